@@ -178,9 +178,13 @@ init_app = typer.Typer()
 @init_app.callback(invoke_without_command=True)
 def init_callback(ctx: typer.Context):
     """
-    Initializes the .teddy directory and pre-warms heavy imports for faster startup.
+    Initializes the .teddy directory and pre-warms heavy imports and the
+    tokenizer for faster (and offline-capable) startup.
     """
-    from teddy_executor.adapters.inbound.cli_helpers import prewarm_imports
+    from teddy_executor.adapters.inbound.cli_helpers import (
+        prewarm_imports,
+        prewarm_tokenizer,
+    )
     from teddy_executor.core.ports.inbound.init import IInitUseCase
 
     container = get_container()
@@ -193,7 +197,8 @@ def init_callback(ctx: typer.Context):
         return
     init_use_case = container.resolve(IInitUseCase)
     summary = init_use_case.ensure_initialized()
-    typer.echo(f"TeDDy initialized in .teddy folder. {summary}")
+    tokenizer_status = prewarm_tokenizer(container)
+    typer.echo(f"TeDDy initialized in .teddy folder. {summary} {tokenizer_status}")
 
 
 @init_app.command()
@@ -262,3 +262,20 @@ def prewarm_imports() -> None:
         from ddgs import DDGS  # noqa: F401
     except ImportError:
         pass
+
+
+def prewarm_tokenizer(container: Container) -> str:
+    """
+    Stores the configured model's tokenizer locally so that token counting
+    works offline. Returns a short status for the init summary.
+    """
+    from teddy_executor.core.ports.outbound.llm_client import ILlmClient
+
+    try:
+        ready = container.resolve(ILlmClient).prewarm_tokenizer()
+    except Exception:
+        logger.debug("Tokenizer pre-warm failed", exc_info=True)
+        ready = False
+    if ready is True:
+        return "Tokenizer: ready."
+    return "Tokenizer: unavailable (token counts are estimated)."
@@ -30,7 +30,10 @@ def extract_status_emoji(raw_status: str) -> str:
 def populate_context_detail(app: "ReviewerApp", pane: Any, data: Any) -> None:
     """Extract context-specific detail population logic."""
     from teddy_executor.adapters.inbound.textual_plan_reviewer_widgets import DetailItem
-    from teddy_executor.core.domain.models.project_context import ContextItem
+    from teddy_executor.core.domain.models.project_context import (
+        OUTLINE_REPRESENTATION,
+        ContextItem,
+    )
     from teddy_executor.core.utils.markdown import is_session_history_path
 
     if isinstance(data, ContextItem):
@@ -46,6 +49,8 @@ def populate_context_detail(app: "ReviewerApp", pane: Any, data: Any) -> None:
         status_text = status_map.get(data.git_status.strip(), "Unmodified")
         pane.append(DetailItem("Git Status", status_text))
         pane.append(DetailItem("Scope", data.scope))
+        if data.representation == OUTLINE_REPRESENTATION:
+            pane.append(DetailItem("Sent As", "Outline"))
         if data.auto_prune_reason:
             pane.append(DetailItem("Auto-Prune", data.auto_prune_reason))
     elif isinstance(data, dict) and data.get("type") == "SYSTEM_PROMPT":
@@ -55,7 +60,10 @@ def populate_context_detail(app: "ReviewerApp", pane: Any, data: Any) -> None:
         # Context Aggregate View - Only sum SELECTED items
         selected_items = [i for i in app.project_context.items if i.selected]
         selected_file_tokens = sum(i.token_count for i in selected_items)
-        system_info_tokens = app.project_context.content_tokens - selected_file_tokens
+        tree_tokens = app.project_context.tree_tokens
+        system_info_tokens = (
+            app.project_context.content_tokens - selected_file_tokens - tree_tokens
+        )
         total_tokens = (
             app.project_context.content_tokens
             + app.project_context.system_prompt_tokens
@@ -91,6 +99,8 @@ def populate_context_detail(app: "ReviewerApp", pane: Any, data: Any) -> None:
             i.token_count for i in selected_items if is_session_history_path(i.path)
         )
 
+        if tree_tokens:
+            pane.append(DetailItem("• Repo Tree", f"{tree_tokens / 1000.0:.1f}k"))
         pane.append(DetailItem("• Session", f"{session_tokens / 1000.0:.1f}k"))
         pane.append(DetailItem("• Turn", f"{turn_tokens / 1000.0:.1f}k"))
         pane.append(DetailItem("• History", f"{history_tokens / 1000.0:.1f}k"))
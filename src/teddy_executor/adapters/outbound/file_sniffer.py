@@ -0,0 +1,141 @@
+import codecs
+import mimetypes
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional, Tuple
+
+TEXT = "text"
+BINARY = "binary"
+MINIFIED = "minified"
+OVERSIZED = "oversized"
+
+# Only this many leading bytes are read to classify a file.
+SNIFF_BYTES = 8192
+# A line this long within the sniffed prefix marks generated/minified output.
+MINIFIED_LINE_LENGTH = 4096
+# Control characters (other than common whitespace) above this share of the
+# prefix mark a file as binary even without NUL bytes.
+CONTROL_CHAR_RATIO = 0.3
+MINIFIED_SUFFIXES = (".min.js", ".min.mjs", ".min.css", ".js.map", ".css.map")
+_TEXT_CONTROL_BYTES = frozenset(b"\t\n\r\f\b\x1b")
+_ASCII_CONTROL_LIMIT = 0x20
+_BYTE_UNITS = ("KB", "MB", "GB")
+_BYTE_UNIT_STEP = 1024
+
+
+@dataclass(frozen=True)
+class FileClassification:
+    """The sniffed kind of a file, with its size and guessed media type."""
+
+    kind: str
+    size: int
+    mime_type: str
+
+    @property
+    def is_text(self) -> bool:
+        return self.kind == TEXT
+
+    def placeholder(self) -> str:
+        """A short stand-in for the content of a non-text file."""
+        return (
+            f"--- {self.kind.upper()} FILE OMITTED "
+            f"({self.mime_type}, {format_size(self.size)}) ---"
+        )
+
+
+def format_size(size: int) -> str:
+    """Formats a byte count for humans (e.g. '12.3 KB')."""
+    if size < _BYTE_UNIT_STEP:
+        return f"{size} B"
+    value = size / _BYTE_UNIT_STEP
+    for unit in _BYTE_UNITS:
+        if value < _BYTE_UNIT_STEP:
+            break
+        value /= _BYTE_UNIT_STEP
+    return f"{value:.1f} {unit}"
+
+
+def _looks_binary(prefix: bytes) -> bool:
+    """Detects binary content from NUL bytes, invalid UTF-8 or control noise."""
+    if b"\x00" in prefix:
+        return True
+    try:
+        # A multi-byte character cut at the end of the prefix is not an error.
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
+    except UnicodeDecodeError:
+        return True
+    controls = sum(
+        1 for b in prefix if b < _ASCII_CONTROL_LIMIT and b not in _TEXT_CONTROL_BYTES
+    )
+    return controls > len(prefix) * CONTROL_CHAR_RATIO
+
+
+def _looks_minified(name: str, prefix: bytes, size: int) -> bool:
+    """Detects minified bundles by name or by a very long line in the prefix."""
+    if name.lower().endswith(MINIFIED_SUFFIXES):
+        return True
+    if size <= SNIFF_BYTES:
+        return False
+    return max(len(line) for line in prefix.splitlines() or [b""]) >= (
+        MINIFIED_LINE_LENGTH
+    )
+
+
+class FileSniffer:
+    """
+    Classifies files as text, binary, minified or oversized by reading only a
+    small prefix. Results are cached by (path, mtime, size), so each file is
+    sniffed once until it changes.
+    """
+
+    DEFAULT_MAX_FILE_BYTES = 1 << 20
+
+    def __init__(self, max_file_bytes: Optional[int] = None, max_entries: int = 20000):
+        self._max_file_bytes = max_file_bytes if max_file_bytes else None
+        self._max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Tuple[str, int, int], FileClassification]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def classify(self, path: str) -> FileClassification:
+        """
+        Classifies the file at the given path.
+
+        Raises FileNotFoundError (or another OSError) if it cannot be read.
+        """
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        result = self._sniff(path, stat.st_size)
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def _sniff(self, path: str, size: int) -> FileClassification:
+        name = os.path.basename(path)
+        mime_type = mimetypes.guess_type(name)[0]
+        with open(path, "rb") as f:
+            prefix = f.read(SNIFF_BYTES)
+
+        if _looks_binary(prefix):
+            kind = BINARY
+        elif _looks_minified(name, prefix, size):
+            kind = MINIFIED
+        elif self._max_file_bytes is not None and size > self._max_file_bytes:
+            kind = OVERSIZED
+        else:
+            kind = TEXT
+
+        if mime_type is None:
+            mime_type = "application/octet-stream" if kind == BINARY else "text/plain"
+        return FileClassification(kind=kind, size=size, mime_type=mime_type)
@@ -1,61 +1,589 @@
+import hashlib
+import logging
+import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
-def load_ignore_spec(root_dir: Path) -> Any:
+IGNORE_FILENAMES = (".gitignore", ".teddyignore")
+DEFAULT_IGNORES = (
+    ".git/",
+    ".venv/",
+    "__pycache__/",
+    ".teddy/",
+    ".ruff_cache/",
+)
+GIT_LS_FILES_TIMEOUT = 10.0
+READ_CHUNK_SIZE = 1 << 20
+_LINE_BREAK = re.compile(rb"\r\n|\r|\n")
+# Besides \n and \r, str.splitlines() also breaks on these characters.
+_EXTRA_LINE_BREAKS = re.compile("[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+_EXTRA_LINE_BREAK_BYTES = (
+    b"\x0b",
+    b"\x0c",
+    b"\x1c",
+    b"\x1d",
+    b"\x1e",
+    b"\xc2\x85",
+    b"\xe2\x80\xa8",
+    b"\xe2\x80\xa9",
+)
+_LINE_BREAK_SUFFIXES = (b"\n", b"\r", *_EXTRA_LINE_BREAK_BYTES)
+_UTF8_LEAD_MASK = 0xC0
+_UTF8_CONTINUATION = 0x80
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+
+def ignore_fingerprint(root_dir: Path) -> str:
     """
-    Loads and returns a pathspec for ignores (.gitignore and .teddyignore).
+    Returns a digest of the root ignore files, used to invalidate cached
+    listings whenever the ignore rules change.
     """
-    import pathspec
+    digest = hashlib.blake2b(digest_size=16)
+    for name in IGNORE_FILENAMES:
+        path = root_dir / name
+        digest.update(name.encode("utf-8"))
+        if path.is_file():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class IgnoreMatcher:
+    """
+    A precompiled form of an ignore `PathSpec` with separate directory-level
+    and file-level matchers.
+
+    Without negations the active patterns are folded into one regex per
+    entry kind, and directory-only patterns (`build/`) are left out of the
+    file matcher: the walker prunes ignored directories before descending,
+    so a file can only reach the matcher if none of its parents matched.
+    With negations, patterns are evaluated in order and the last match wins,
+    exactly like `PathSpec.match_file`.
+    """
+
+    def __init__(self, spec: Any):
+        patterns = [p for p in spec.patterns if p.include is not None]
+        self._ordered = any(not p.include for p in patterns)
+        if self._ordered:
+            ordered = [(p.regex, bool(p.include)) for p in reversed(patterns)]
+            self._dir_patterns = self._file_patterns = ordered
+            return
+        file_patterns = [
+            p for p in patterns if not str(p.pattern).rstrip().endswith("/")
+        ]
+        self._dir_regex = self._combine(patterns)
+        self._file_regex = self._combine(file_patterns)
+
+    @classmethod
+    def from_lines(cls, lines: List[str]) -> "IgnoreMatcher":
+        """Compiles gitignore-style lines."""
+        import pathspec
+
+        return cls(pathspec.PathSpec.from_lines("gitwildmatch", lines))
+
+    @staticmethod
+    def _combine(patterns: List[Any]) -> Optional["re.Pattern[str]"]:
+        """Folds the pattern regexes into a single alternation."""
+        if not patterns:
+            return None
+        # Named groups may repeat across patterns; only the match matters here.
+        parts = [_NAMED_GROUP.sub("(?:", p.regex.pattern) for p in patterns]
+        return re.compile("|".join(f"(?:{part})" for part in parts))
+
+    def decide_dir(self, rel_path: str) -> Optional[bool]:
+        """
+        Checks a directory path (without trailing slash). Returns True if
+        ignored, False if re-included by a negation, None if no pattern matched.
+        """
+        if self._ordered:
+            return self._decide_ordered(self._dir_patterns, rel_path + "/")
+        if self._dir_regex is not None and self._dir_regex.match(rel_path + "/"):
+            return True
+        return None
+
+    def decide_file(self, rel_path: str) -> Optional[bool]:
+        """Like `decide_dir`, for a file whose parents are not ignored."""
+        if self._ordered:
+            return self._decide_ordered(self._file_patterns, rel_path)
+        if self._file_regex is not None and self._file_regex.match(rel_path):
+            return True
+        return None
+
+    @staticmethod
+    def _decide_ordered(patterns: List[Tuple[Any, bool]], path: str) -> Optional[bool]:
+        for regex, include in patterns:
+            if regex.match(path):
+                return include
+        return None
+
+
+@dataclass(frozen=True)
+class _IgnoreLayer:
+    """A compiled `.gitignore`, matched relative to the directory holding it."""
+
+    prefix: str
+    matcher: IgnoreMatcher
+    mtime_ns: int
+
+
+class IgnoreRules:
+    """
+    The ignore rules in effect inside one directory. Layers are consulted
+    from the highest precedence down: the root `.teddyignore`, then every
+    `.gitignore` from the directory up to the root (deepest first, each
+    matched relative to its own directory), then the default ignores. The
+    first layer with a matching pattern decides, as in git.
+    """
+
+    def __init__(self, engine: "IgnoreEngine", layers: Tuple[_IgnoreLayer, ...] = ()):
+        self._engine = engine
+        self._layers = layers
+        chain = [(layer.prefix, layer.matcher) for layer in reversed(layers)]
+        if engine.override is not None:
+            chain.insert(0, ("", engine.override))
+        chain.append(("", engine.defaults))
+        self._chain = chain
+
+    @property
+    def key(self) -> str:
+        """Identifies the ignore files (and their mtimes) behind these rules."""
+        return ";".join(f"{layer.prefix}@{layer.mtime_ns}" for layer in self._layers)
+
+    def enter(
+        self, directory: Path, rel_dir: str, has_ignore_file: bool
+    ) -> "IgnoreRules":
+        """
+        Returns the rules for the children of `directory`, adding its own
+        `.gitignore` as a new layer. Returns `self` when there is none.
+        """
+        if not has_ignore_file:
+            return self
+        layer = self._engine.load_layer(directory, rel_dir)
+        if layer is None:
+            return self
+        return IgnoreRules(self._engine, self._layers + (layer,))
+
+    def match_dir(self, rel_path: str) -> bool:
+        """Checks a root-relative directory path (without trailing slash)."""
+        for prefix, matcher in self._chain:
+            decision = matcher.decide_dir(rel_path[len(prefix) :])
+            if decision is not None:
+                return decision
+        return False
+
+    def match_file(self, rel_path: str) -> bool:
+        """Checks a root-relative file path, assuming its parents are not ignored."""
+        for prefix, matcher in self._chain:
+            decision = matcher.decide_file(rel_path[len(prefix) :])
+            if decision is not None:
+                return decision
+        return False
+
+
+class IgnoreEngine:
+    """
+    Hierarchical, git-style ignore handling for a project root.
+
+    Nested `.gitignore` files are discovered while walking. Their compiled
+    specs are cached per directory and keyed by the file's mtime, so each
+    ignore file is parsed once until it changes. The default ignores and
+    the root `.teddyignore` are loaded when the engine is created.
+    """
+
+    def __init__(self, root_dir: Path):
+        self.root_dir = root_dir
+        self._layer_cache: Dict[str, Tuple[int, IgnoreMatcher]] = {}
+
+        default_lines = list(DEFAULT_IGNORES)
+        if (root_dir / ".gitignore").is_file():
+            default_lines.append(".gitignore")
+        self.defaults = IgnoreMatcher.from_lines(default_lines)
+
+        self.override: Optional[IgnoreMatcher] = None
+        teddyignore_path = root_dir / ".teddyignore"
+        if teddyignore_path.is_file():
+            self.override = IgnoreMatcher.from_lines(
+                [
+                    teddyignore_path.name,
+                    *teddyignore_path.read_text(encoding="utf-8").splitlines(),
+                ]
+            )
+
+    def root_rules(self) -> IgnoreRules:
+        """Returns the rules inherited by the root directory (no `.gitignore` yet)."""
+        return IgnoreRules(self)
+
+    def rules_for(self, directory: Path) -> Optional[IgnoreRules]:
+        """
+        Returns the rules inherited by `directory` from its parents, or None
+        if the directory itself (or one of its parents) is ignored.
+        """
+        rules = self.root_rules()
+        try:
+            parts = directory.relative_to(self.root_dir).parts
+        except ValueError:
+            # Directories outside the root only get the root-level rules.
+            return rules
+
+        current, rel_dir = self.root_dir, ""
+        for part in parts:
+            rules = rules.enter(current, rel_dir, (current / ".gitignore").is_file())
+            current = current / part
+            rel_dir = f"{rel_dir}/{part}" if rel_dir else part
+            if rules.match_dir(rel_dir):
+                return None
+        return rules
+
+    def load_layer(self, directory: Path, rel_dir: str) -> Optional[_IgnoreLayer]:
+        """Loads the `.gitignore` of a directory, reusing the cached spec if unchanged."""
+        path = directory / ".gitignore"
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self._layer_cache.get(rel_dir)
+        if cached is None or cached[0] != mtime_ns:
+            try:
+                lines = path.read_text(encoding="utf-8").splitlines()
+            except (OSError, UnicodeDecodeError):
+                lines = []
+            cached = (mtime_ns, IgnoreMatcher.from_lines(lines))
+            self._layer_cache[rel_dir] = cached
+
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        return _IgnoreLayer(prefix=prefix, matcher=cached[1], mtime_ns=mtime_ns)
+
+
+def _scan_directory(
+    directory: Path, rel_dir: str, inherited: IgnoreRules
+) -> Tuple[IgnoreRules, List[Tuple[str, "os.DirEntry[str]", bool]]]:
+    """
+    Lists one directory, applying its own `.gitignore` on top of the
+    inherited rules. Returns the rules for its children and the
+    non-ignored (relative path, DirEntry, is_real_dir) triples.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+    has_ignore_file = any(
+        entry.name == ".gitignore" and entry.is_file(follow_symlinks=False)
+        for entry in entries
+    )
+    rules = inherited.enter(directory, rel_dir, has_ignore_file)
+
+    prefix = f"{rel_dir}/" if rel_dir else ""
+    kept = []
+    for entry in entries:
+        rel_path = prefix + entry.name
+        is_real_dir = entry.is_dir(follow_symlinks=False)
+        if is_real_dir:
+            if rules.match_dir(rel_path):
+                continue
+        elif rules.match_file(rel_path):
+            continue
+        kept.append((rel_path, entry, is_real_dir))
+    return rules, kept
+
+
+def list_directory_entries(
+    directory: Path, rel_dir: str, inherited: IgnoreRules
+) -> Tuple[List[str], List[str], IgnoreRules]:
+    """
+    Lists the non-ignored children of a single directory.
+    Returns (directory names, other entry names, rules for the children).
+    Symlinks are never treated as directories, matching `scan_recursive`.
+    """
+    rules, kept = _scan_directory(directory, rel_dir, inherited)
+    dirs = [entry.name for _, entry, is_real_dir in kept if is_real_dir]
+    files = [entry.name for _, entry, is_real_dir in kept if not is_real_dir]
+    return dirs, files, rules
+
+
+def _relative_prefix(root_dir: Path, start_dir: Path) -> str:
+    """Returns the root-relative POSIX path of start_dir ('' for the root)."""
+    try:
+        rel_path = start_dir.relative_to(root_dir).as_posix()
+    except ValueError:
+        # Fallback for paths outside root (e.g. symlinks)
+        return str(start_dir).replace("\\", "/")
+    return "" if rel_path == "." else rel_path
+
+
+def scan_recursive(
+    start_dir: Path, engine: IgnoreEngine
+) -> Iterator[Tuple[str, "os.DirEntry[str]"]]:
+    """
+    Iteratively walks a directory with `os.scandir`, yielding
+    (root-relative POSIX path, DirEntry) for every non-ignored entry.
+    Nested `.gitignore` files are applied as they are found, ignored
+    directories are pruned before they are opened, and symlinked
+    directories are never followed.
+    """
+    inherited = engine.rules_for(start_dir)
+    if inherited is None:
+        return
+
+    pending = [(start_dir, _relative_prefix(engine.root_dir, start_dir), inherited)]
+    while pending:
+        directory, rel_dir, inherited = pending.pop()
+        rules, kept = _scan_directory(directory, rel_dir, inherited)
+        for rel_path, entry, is_real_dir in kept:
+            if is_real_dir:
+                pending.append((Path(entry.path), rel_path, rules))
+            yield rel_path, entry
+
+
+def list_files_recursive(start_dir: Path, engine: IgnoreEngine) -> List[str]:
+    """
+    Returns the sorted, root-relative POSIX paths of all non-ignored files
+    below start_dir (symlinks to files included).
+    """
+    return sorted(
+        rel_path
+        for rel_path, entry in scan_recursive(start_dir, engine)
+        if entry.is_file()
+    )
+
 
-    default_ignores = {
-        ".git/",
-        ".venv/",
-        "__pycache__/",
-        ".teddy/",
-        ".ruff_cache/",
-    }
-    lines = list(default_ignores)
+def _is_in_git_work_tree(root_dir: Path) -> bool:
+    """Checks whether `root_dir` or one of its parents contains a `.git` entry."""
+    return any(
+        (candidate / ".git").exists() for candidate in (root_dir, *root_dir.parents)
+    )
 
-    gitignore_path = root_dir / ".gitignore"
-    if gitignore_path.is_file():
-        lines.append(gitignore_path.name)
-        lines.extend(gitignore_path.read_text(encoding="utf-8").splitlines())
+
+def _load_teddyignore_overlay(root_dir: Path) -> Optional[Any]:
+    """
+    Loads the rules applied on top of git's own ignore handling: the default
+    ignores, the ignore files themselves and the root `.teddyignore`.
+    Returns None when `.teddyignore` re-includes paths (`!pattern`), since
+    git has already dropped them and only the full walker can honour the
+    override.
+    """
+    import pathspec
+
+    lines = list(DEFAULT_IGNORES)
+    if (root_dir / ".gitignore").is_file():
+        lines.append(".gitignore")
 
     teddyignore_path = root_dir / ".teddyignore"
     if teddyignore_path.is_file():
+        teddy_lines = teddyignore_path.read_text(encoding="utf-8").splitlines()
+        if any(line.strip().startswith("!") for line in teddy_lines):
+            return None
         lines.append(teddyignore_path.name)
-        lines.extend(teddyignore_path.read_text(encoding="utf-8").splitlines())
-
+        lines.extend(teddy_lines)
     return pathspec.PathSpec.from_lines("gitwildmatch", lines)
 
 
-def walk_recursive(
-    root_dir: Path,
-    start_dir: Path,
-    spec: Any,
-) -> Iterator[Tuple[Path, bool]]:
+def _run_git_ls_files(root_dir: Path, rel_dir: str = ".") -> Optional[List[str]]:
     """
-    Recursively walks a directory, yielding (Path, is_dir) for non-ignored entries.
-    Yielded paths are absolute.
+    Runs `git ls-files` once, limited to `rel_dir`, and returns the tagged
+    NUL-separated records, or None if git is unavailable or fails.
     """
-    for entry in start_dir.iterdir():
-        try:
-            rel_path = entry.relative_to(root_dir)
-        except ValueError:
-            # Fallback for paths outside root (e.g. symlinks)
-            rel_path = entry
+    import subprocess  # nosec
+
+    command = [
+        "git",
+        "ls-files",
+        "-z",
+        "-t",
+        "--cached",
+        "--deleted",
+        "--others",
+        "--exclude-standard",
+    ]
+    if rel_dir != ".":
+        # A literal pathspec, so that names like `[id]` are not globs.
+        command.extend(["--", f":(literal){rel_dir}"])
+    try:
+        result = subprocess.run(  # nosec
+            command,
+            cwd=root_dir,
+            capture_output=True,
+            timeout=GIT_LS_FILES_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug("git ls-files unavailable: %s", e)
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.decode("utf-8", errors="surrogateescape").split("\0")
+
 
-        rel_path_str = str(rel_path).replace("\\", "/")
-        is_real_dir = entry.is_dir() and not entry.is_symlink()
+def git_list_files(root_dir: Path, rel_dir: str = ".") -> Optional[List[str]]:
+    """
+    Lists the non-ignored files under `root_dir` using git's index instead
+    of walking the tree, so large ignored directories cost nothing. With
+    `rel_dir`, git itself only lists that subdirectory.
 
-        # For directories, add a trailing slash to match gitignore behavior
-        match_path = rel_path_str + "/" if is_real_dir else rel_path_str
+    Tracked files (minus unstaged deletions) and untracked, non-ignored
+    files are returned as sorted, root-relative POSIX paths. Git applies
+    every `.gitignore`; the default ignores and `.teddyignore` are applied
+    on top. Untracked nested repositories are reported by git as
+    `dir/` and are skipped. Returns None when `root_dir` is not in a git
+    work tree, git fails, or `.teddyignore` uses negations, so callers can
+    fall back to `list_files_recursive`.
+    """
+    if not _is_in_git_work_tree(root_dir):
+        return None
+    overlay = _load_teddyignore_overlay(root_dir)
+    if overlay is None:
+        return None
+    records = _run_git_ls_files(root_dir, rel_dir)
+    if records is None:
+        return None
 
-        if spec.match_file(match_path):
+    present = set()
+    deleted = set()
+    for record in records:
+        tag, _, path = record.partition(" ")
+        if not path or path.endswith("/"):
             continue
+        if tag == "R":
+            deleted.add(path)
+        elif tag != "S" or os.path.lexists(root_dir / path):
+            # Skip-worktree entries are only listed if actually checked out.
+            present.add(path)
 
-        yield entry, is_real_dir
+    return sorted(p for p in present - deleted if not overlay.match_file(p))
 
-        if is_real_dir:
-            yield from walk_recursive(root_dir, entry, spec)
+
+@dataclass(frozen=True)
+class TextHead:
+    """
+    The beginning of a text file. `text` is newline-translated like
+    `Path.read_text`; when `truncated`, it holds only the first
+    `shown_lines` lines (without the final line break) and `total_lines`
+    counts the lines of the whole file as `str.splitlines()` would.
+    """
+
+    text: str
+    truncated: bool
+    shown_lines: int = 0
+    total_lines: int = 0
+
+
+def read_text_head(
+    path: Path, max_lines: int, max_bytes: Optional[int] = None
+) -> Optional[TextHead]:
+    """
+    Reads at most `max_lines` lines (and at most `max_bytes` bytes, if set)
+    of a UTF-8 file without loading the rest of it. The remaining lines are
+    counted by scanning binary chunks for line breaks, so the truncation
+    hint stays exact.
+
+    Returns None when the head contains line breaks other than newlines
+    (e.g. form feeds), where only a full read matches `str.splitlines()`.
+    Only the returned head is decoded, so undecodable bytes further down
+    the file do not raise.
+    """
+    with open(path, "rb") as stream:
+        buffer, head_end, by_bytes = _scan_head(stream, max_lines, max_bytes)
+        if by_bytes:
+            text = _decode_text(buffer[:head_end])
+            return TextHead(
+                text=text,
+                truncated=True,
+                shown_lines=len(text.splitlines()),
+                total_lines=_count_lines(bytes(buffer), stream),
+            )
+
+        remaining_lines = _count_lines(bytes(buffer[head_end:]), stream)
+
+    if remaining_lines == 0:
+        return TextHead(text=_decode_text(buffer), truncated=False)
+
+    text = _decode_text(buffer[:head_end])
+    if _EXTRA_LINE_BREAKS.search(text):
+        return None
+    return TextHead(
+        text=text[:-1],
+        truncated=True,
+        shown_lines=max_lines,
+        total_lines=max_lines + remaining_lines,
+    )
+
+
+def _scan_head(
+    stream: BinaryIO, max_lines: int, max_bytes: Optional[int]
+) -> Tuple[bytearray, int, bool]:
+    """
+    Reads chunks until `max_lines` line breaks (or `max_bytes` bytes) are
+    buffered. Returns (buffer, end offset of the head, cut by byte budget).
+    """
+    buffer = bytearray()
+    breaks = 0
+    scan_pos = 0
+    while True:
+        chunk = stream.read(READ_CHUNK_SIZE)
+        buffer += chunk
+        for match in _LINE_BREAK.finditer(buffer, scan_pos):
+            if chunk and match.end() == len(buffer) and match.group() == b"\r":
+                break  # May be the first half of a \r\n split across chunks.
+            scan_pos = match.end()
+            breaks += 1
+            if breaks == max_lines:
+                return buffer, scan_pos, False
+        held_cr = 1 if chunk and buffer.endswith(b"\r") else 0
+        scan_pos = max(scan_pos, len(buffer) - held_cr)
+        if max_bytes is not None and len(buffer) > max_bytes:
+            return buffer, _utf8_boundary(buffer, max_bytes), True
+        if not chunk:
+            return buffer, len(buffer), False
+
+
+def _utf8_boundary(data: bytearray, limit: int) -> int:
+    """Moves `limit` back so it does not split a UTF-8 sequence."""
+    while limit > 0 and (data[limit] & _UTF8_LEAD_MASK) == _UTF8_CONTINUATION:
+        limit -= 1
+    return limit
+
+
+def _decode_text(data: bytearray) -> str:
+    """Decodes UTF-8 and translates newlines like text-mode reads do."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _count_lines(initial: bytes, stream: BinaryIO) -> int:
+    """
+    Counts the lines in `initial` followed by the rest of `stream`, matching
+    `str.splitlines()` on the decoded text, without holding it in memory.
+    """
+    breaks = 0
+    has_content = False
+    ends_with_break = False
+    carry = b""
+    data = initial
+    while True:
+        following = stream.read(READ_CHUNK_SIZE)
+        block = carry + data
+        # Hold back a possibly incomplete multi-byte break for the next block.
+        held = _partial_break_suffix(block) if following else 0
+        carry = block[len(block) - held :] if held else b""
+        block = block[: len(block) - held]
+        if block:
+            has_content = True
+            breaks += (
+                block.count(b"\n")
+                + block.count(b"\r")
+                - block.count(b"\r\n")
+                + sum(block.count(sep) for sep in _EXTRA_LINE_BREAK_BYTES)
+            )
+            ends_with_break = block.endswith(_LINE_BREAK_SUFFIXES)
+        if not following:
+            break
+        data = following
+    return breaks + (1 if has_content and not ends_with_break else 0)
+
+
+def _partial_break_suffix(block: bytes) -> int:
+    if block.endswith(b"\xe2\x80"):
+        return 2
+    if block.endswith((b"\r", b"\xc2", b"\xe2")):
+        return 1
+    return 0
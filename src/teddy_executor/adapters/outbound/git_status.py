@@ -0,0 +1,204 @@
+import os
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+PORCELAIN_V2_COMMAND = ["git", "status", "--porcelain=v2", "-z"]
+LONG_STATUS_COMMAND = ["git", "status"]
+QUOTE_PATH_COMMAND = ["git", "config", "--type=bool", "core.quotePath"]
+SHOW_TOPLEVEL_COMMAND = ["git", "rev-parse", "--show-toplevel"]
+
+_CHANGED = "1"
+_RENAMED = "2"
+_UNMERGED = "u"
+_UNTRACKED = "?"
+# Number of space-separated fields before the path in each record kind.
+_PATH_FIELD = {_CHANGED: 8, _RENAMED: 9, _UNMERGED: 10}
+
+# Escapes used by git's C-style path quoting; other special bytes are octal.
+_QUOTE_ESCAPES = {
+    "\a": "\\a",
+    "\b": "\\b",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\v": "\\v",
+    "\f": "\\f",
+    "\r": "\\r",
+    '"': '\\"',
+    "\\": "\\\\",
+}
+_DELETE = 0x7F
+_FIRST_PRINTABLE = 0x20
+_FIRST_NON_ASCII = 0x80
+
+
+@dataclass(frozen=True)
+class GitStatusEntry:
+    """A single record of `git status --porcelain=v2`."""
+
+    kind: str
+    xy: str
+    path: str
+    orig_path: str = ""
+
+
+@dataclass(frozen=True)
+class GitStatus:
+    """The parsed entries of a porcelain v2 status."""
+
+    entries: List[GitStatusEntry] = field(default_factory=list)
+
+
+def parse_porcelain_v2(raw: str) -> GitStatus:
+    """Parses the NUL-separated output of `git status --porcelain=v2 -z`."""
+    entries: List[GitStatusEntry] = []
+    records = iter(raw.split("\0"))
+    for record in records:
+        if record[:1] in _PATH_FIELD:
+            fields = record.split(" ", _PATH_FIELD[record[0]])
+            orig_path = next(records, "") if record[0] == _RENAMED else ""
+            entries.append(GitStatusEntry(record[0], fields[1], fields[-1], orig_path))
+        elif record[:1] == _UNTRACKED:
+            entries.append(GitStatusEntry(_UNTRACKED, "??", record[2:]))
+    return GitStatus(entries=entries)
+
+
+def relative_to_cwd(status: GitStatus, toplevel: str, cwd: str) -> GitStatus:
+    """
+    Rewrites the entry paths, which porcelain v2 gives relative to the
+    repository root, relative to `cwd` as plain `git status` shows them.
+    """
+    top = os.path.realpath(toplevel)
+    here = os.path.realpath(cwd)
+    if top == here:
+        return status
+
+    def relative(path: str) -> str:
+        if not path:
+            return path
+        # Untracked directories keep their trailing slash.
+        suffix = "/" if path.endswith("/") else ""
+        rel = os.path.relpath(os.path.join(top, path), here).replace(os.sep, "/")
+        return rel + suffix
+
+    return replace(
+        status,
+        entries=[
+            replace(
+                entry, path=relative(entry.path), orig_path=relative(entry.orig_path)
+            )
+            for entry in status.entries
+        ],
+    )
+
+
+def format_short_status(status: GitStatus, quote_non_ascii: bool = True) -> str:
+    """
+    Renders the status like `git status -s`: tracked entries (unmerged ones
+    included) in path order, then untracked entries, with paths quoted the
+    way git quotes them. `quote_non_ascii` mirrors `core.quotePath`.
+    """
+    tracked = sorted(
+        (e for e in status.entries if e.kind != _UNTRACKED), key=lambda e: e.path
+    )
+    untracked = [e for e in status.entries if e.kind == _UNTRACKED]
+    lines = []
+    for entry in [*tracked, *untracked]:
+        xy = entry.xy.replace(".", " ")
+        path = quote_path(entry.path, quote_non_ascii)
+        if entry.kind == _RENAMED:
+            lines.append(
+                f"{xy} {quote_path(entry.orig_path, quote_non_ascii)} -> {path}"
+            )
+        else:
+            lines.append(f"{xy} {path}")
+    return "\n".join(lines)
+
+
+def has_non_ascii_path(status: GitStatus) -> bool:
+    """True if any entry path would be affected by `core.quotePath`."""
+    return any(not (entry.path + entry.orig_path).isascii() for entry in status.entries)
+
+
+def quote_path(path: str, quote_non_ascii: bool = True) -> str:
+    """
+    Quotes `path` like git's short status: paths with spaces, quotes,
+    backslashes or control characters (and non-ASCII characters, unless
+    `quote_non_ascii` is off) are wrapped in double quotes, with special
+    bytes escaped.
+    """
+    quoted = []
+    needs_quotes = False
+    for char in path:
+        code = ord(char)
+        if char in _QUOTE_ESCAPES:
+            quoted.append(_QUOTE_ESCAPES[char])
+        elif code < _FIRST_PRINTABLE or code == _DELETE:
+            quoted.append(f"\\{code:03o}")
+        elif code >= _FIRST_NON_ASCII and quote_non_ascii:
+            quoted.extend(f"\\{byte:03o}" for byte in char.encode("utf-8"))
+        else:
+            quoted.append(char)
+            needs_quotes = needs_quotes or char == " "
+            continue
+        needs_quotes = True
+    return f'"{"".join(quoted)}"' if needs_quotes else path
+
+
+def find_git_dir(start: str) -> Optional[Path]:
+    """Finds the git directory for the work tree containing `start`."""
+    current = Path(start).resolve()
+    for directory in (current, *current.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Linked work trees and submodules point to their git directory.
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                return (directory / content[len("gitdir:") :].strip()).resolve()
+            return None
+    return None
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def status_cache_key(cwd: str) -> Optional[tuple]:
+    """
+    Builds a key that changes whenever the index or HEAD changes: the
+    index stat, the content of HEAD and the stat of the ref it points to.
+    Returns None outside a git work tree.
+    """
+    git_dir = find_git_dir(cwd)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    ref_key: Tuple[int, int] = (0, 0)
+    if head.startswith("ref:"):
+        ref = head[len("ref:") :].strip()
+        # Linked work trees keep shared refs in the common directory.
+        common = git_dir
+        commondir = git_dir / "commondir"
+        if commondir.is_file():
+            common = (git_dir / commondir.read_text(encoding="utf-8").strip()).resolve()
+        ref_key = _stat_key(common / ref)
+        if ref_key == (0, 0):
+            ref_key = _stat_key(common / "packed-refs")
+    return (
+        os.path.abspath(cwd),
+        _stat_key(git_dir / "index"),
+        head,
+        ref_key,
+    )
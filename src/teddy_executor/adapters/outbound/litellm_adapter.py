@@ -1,8 +1,18 @@
+import logging
 from typing import Any, Dict, List, Optional, Protocol
 from teddy_executor.core.ports.outbound.config_service import IConfigService
 from teddy_executor.core.domain.models.exceptions import ConfigurationError
 from teddy_executor.core.ports.outbound.llm_client import ILlmClient, LlmApiError
 from teddy_executor.core.ports.outbound.time_service import ITimeService
+from teddy_executor.core.utils.token_estimator import estimate_token_count
+from teddy_executor.adapters.outbound.tiktoken_encoding_store import (
+    TiktokenEncodingStore,
+)
+
+logger = logging.getLogger(__name__)
+
+# Encoding used for models that tiktoken does not know.
+FALLBACK_ENCODING = "cl100k_base"
 
 
 class IOpenRouterHydrator(Protocol):
@@ -18,21 +28,44 @@ class IOpenRouterHydrator(Protocol):
         ...
 
 
+class ITokenCountCache(Protocol):
+    """
+    Internal adapter-layer port for persisting token counts across turns.
+    """
+
+    def get(self, text: str, encoding_name: str) -> Optional[int]:
+        """Returns the cached token count for the text, or None on a miss."""
+        ...
+
+    def put(self, text: str, encoding_name: str, count: int) -> None:
+        """Stores the token count for the text under the given encoding."""
+        ...
+
+
 class LiteLLMAdapter(ILlmClient):
     """
     Implements ILlmClient using the litellm library, driven by configuration.
     """
 
-    def __init__(
+    # Providers that need explicit cache-control breakpoints for prompt caching.
+    CACHE_CONTROL_MODEL_HINTS = ("anthropic", "claude")
+    MAX_CACHE_BREAKPOINTS = 4
+
+    def __init__(  # noqa: PLR0913
         self,
         config_service: IConfigService,
         hydrator: Optional[IOpenRouterHydrator] = None,
         time_service: Optional[ITimeService] = None,
         _litellm_provider: Optional[Any] = None,
+        token_cache: Optional[ITokenCountCache] = None,
+        *,
+        encoding_store: Optional[TiktokenEncodingStore] = None,
     ):
         self._config_service = config_service
         self._hydrator = hydrator
         self._time_service = time_service
+        self._token_cache = token_cache
+        self._encoding_store = encoding_store or TiktokenEncodingStore()
         self._litellm_initialized = _litellm_provider is not None
         self._litellm_module: Any = _litellm_provider
         self._encoding: Any = None
@@ -69,20 +102,44 @@ class LiteLLMAdapter(ILlmClient):
         return self._litellm_module
 
     def _get_encoding(self, model: str) -> Any:
-        """Lazily retrieves and caches the tiktoken encoding for a model."""
+        """
+        Lazily retrieves and caches the tiktoken encoding for a model.
+        Returns None if it cannot be loaded (e.g. offline without a local copy).
+        """
         if self._encoding_model != model:
             with self._init_lock:
                 if self._encoding_model != model:
-                    import tiktoken
-
-                    try:
-                        self._encoding = tiktoken.encoding_for_model(model)
-                    except KeyError:
-                        # Fallback for unknown models
-                        self._encoding = tiktoken.get_encoding("cl100k_base")
+                    self._encoding = self._load_encoding(model)
                     self._encoding_model = model
         return self._encoding
 
+    def _load_encoding(self, model: str) -> Any:
+        """
+        Loads an encoding from the local encoding store, seeding it from the
+        bundled copies first so that no download is needed when possible.
+        """
+        import tiktoken
+
+        try:
+            encoding_name = tiktoken.encoding_name_for_model(model)
+        except KeyError:
+            encoding_name = FALLBACK_ENCODING
+        self._encoding_store.seed(encoding_name)
+        self._encoding_store.activate()
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                # Fallback for unknown models
+                return tiktoken.get_encoding(FALLBACK_ENCODING)
+        except Exception as e:
+            logger.warning(
+                "Could not load the %s tokenizer (%s); token counts are estimated.",
+                encoding_name,
+                e,
+            )
+            return None
+
     def _ensure_silence(self, litellm_module: Any) -> None:
         """Internal helper to silence litellm lazily."""
         import logging
@@ -106,7 +163,7 @@ class LiteLLMAdapter(ILlmClient):
         return str(resolved)
 
     def get_completion(
-        self, messages: List[Dict[str, str]], model: Optional[str] = None, **kwargs: Any
+        self, messages: List[Dict[str, Any]], model: Optional[str] = None, **kwargs: Any
     ) -> Any:
         """
         Sends a request to an LLM via litellm and returns the raw response object.
@@ -124,6 +181,7 @@ class LiteLLMAdapter(ILlmClient):
                     self._validated = True
 
         final_params = self._prepare_completion_params(model, **kwargs)
+        messages = self._apply_cache_control(messages, str(final_params["model"]))
 
         # Lazy startup validation: check config on first call only
         if not self._validated:
@@ -193,6 +251,55 @@ class LiteLLMAdapter(ILlmClient):
 
         return params
 
+    def _apply_cache_control(
+        self, messages: List[Dict[str, Any]], model: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Adapts text parts for the target provider. Providers that support
+        explicit prompt caching get an ephemeral cache-control breakpoint after
+        the system prompt and after every user part but the last, which is the
+        volatile tail. Other providers get the parts joined back into a string.
+        """
+        lowered = model.lower()
+        if any(hint in lowered for hint in self.CACHE_CONTROL_MODEL_HINTS):
+            return self._add_cache_breakpoints(messages)
+        return [self._join_text_parts(message) for message in messages]
+
+    def _add_cache_breakpoints(
+        self, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Marks stable parts as cacheable, earliest first, within the limit."""
+        remaining = self.MAX_CACHE_BREAKPOINTS
+        marked = []
+        for message in messages:
+            content = message.get("content")
+            if message.get("role") == "system" and isinstance(content, str) and content:
+                content = [{"type": "text", "text": content}]
+                stable_count = 1
+            elif isinstance(content, list):
+                stable_count = len(content) - 1
+            else:
+                marked.append(message)
+                continue
+
+            parts = []
+            for index, part in enumerate(content):
+                if index < stable_count and remaining > 0:
+                    part = {**part, "cache_control": {"type": "ephemeral"}}
+                    remaining -= 1
+                parts.append(part)
+            marked.append({**message, "content": parts})
+        return marked
+
+    def _join_text_parts(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Turns a content made only of text parts back into a plain string."""
+        content = message.get("content")
+        if not isinstance(content, list) or not all(
+            isinstance(part, dict) and part.get("type") == "text" for part in content
+        ):
+            return message
+        return {**message, "content": "".join(str(p["text"]) for p in content)}
+
     def _should_retry_completion(
         self, error: Exception, attempt: int, max_attempts: int
     ) -> bool:
@@ -219,7 +326,7 @@ class LiteLLMAdapter(ILlmClient):
             raise ConfigurationError(clean_msg) from error
 
     def get_token_count(
-        self, messages: List[Dict[str, str]], model: Optional[str] = None
+        self, messages: List[Dict[str, Any]], model: Optional[str] = None
     ) -> int:
         """Calculates the number of tokens in the payload."""
         litellm = self._get_litellm()
@@ -227,12 +334,34 @@ class LiteLLMAdapter(ILlmClient):
         return litellm.token_counter(model=resolved_model, messages=messages)
 
     def get_text_token_count(self, text: str, model: Optional[str] = None) -> int:
-        """Calculates the number of tokens for a raw string using tiktoken directly."""
+        """
+        Calculates the number of tokens for a raw string using tiktoken directly.
+        Counts are memoized by content hash when a token cache is configured.
+        Falls back to an estimate when the encoding is unavailable.
+        """
         if not text:
             return 0
         resolved_model = self._resolve_model(model)
         encoding = self._get_encoding(resolved_model)
-        return len(encoding.encode(text, disallowed_special=()))
+        if encoding is None:
+            return estimate_token_count(text)
+        if self._token_cache is None:
+            return len(encoding.encode(text, disallowed_special=()))
+
+        encoding_name = str(getattr(encoding, "name", resolved_model))
+        cached = self._token_cache.get(text, encoding_name)
+        if cached is not None:
+            return cached
+        count = len(encoding.encode(text, disallowed_special=()))
+        self._token_cache.put(text, encoding_name, count)
+        return count
+
+    def prewarm_tokenizer(self, model: Optional[str] = None) -> bool:
+        """
+        Loads the model's encoding into the local encoding store, downloading
+        it once if it is not bundled. Returns True if exact counting is ready.
+        """
+        return self._get_encoding(self._resolve_model(model)) is not None
 
     def get_completion_cost(
         self, completion_response: Any, model_override: Optional[str] = None
@@ -265,6 +394,36 @@ class LiteLLMAdapter(ILlmClient):
             # Graceful fallback for unmapped models or hydration failure
             return 0.0
 
+    def get_cache_usage(self, completion_response: Any) -> Dict[str, int]:
+        """
+        Extracts prompt-cache token counts from the response usage. Hits come
+        from `prompt_tokens_details.cached_tokens` (or Anthropic's
+        `cache_read_input_tokens`); every other prompt token is a miss.
+        """
+        usage = getattr(completion_response, "usage", None)
+        if usage is None:
+            return {}
+        prompt_tokens = self._usage_count(usage, "prompt_tokens")
+        details = getattr(usage, "prompt_tokens_details", None)
+        hits = self._usage_count(details, "cached_tokens") or self._usage_count(
+            usage, "cache_read_input_tokens"
+        )
+        return {
+            "cache_hit_tokens": hits,
+            "cache_miss_tokens": max(0, prompt_tokens - hits),
+            "cache_write_tokens": self._usage_count(
+                usage, "cache_creation_input_tokens"
+            ),
+        }
+
+    @staticmethod
+    def _usage_count(usage: Any, name: str) -> int:
+        """Reads a numeric usage field, treating anything else as zero."""
+        value = getattr(usage, name, None)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return 0
+        return int(value)
+
     def validate_config(self, include_remote: bool = False) -> List[str]:
         """
         Validates the LLM configuration for common errors.
@@ -376,7 +535,7 @@ class LiteLLMAdapter(ILlmClient):
         return "input_cost_per_token" in model_info
 
     def _handle_hydration_retry(
-        self, error: Exception, messages: List[Dict[str, str]], params: Dict[str, Any]
+        self, error: Exception, messages: List[Dict[str, Any]], params: Dict[str, Any]
     ) -> Optional[Any]:
         """Internal helper to detect NotFoundError and retry once with hydrated metadata."""
         litellm = self._get_litellm()
@@ -1,11 +1,20 @@
 import logging
 import os
+import time
 from pathlib import Path
-from typing import List, Sequence, TextIO
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    TextIO,
+)
 from teddy_executor.core.domain.models.plan import DEFAULT_SIMILARITY_THRESHOLD
 from teddy_executor.core.ports.inbound.edit_simulator import EditPair, IEditSimulator
 from teddy_executor.core.ports.outbound.file_system_manager import IFileSystemManager
-from teddy_executor.core.utils.string import truncate_lines
+from teddy_executor.core.utils.string import get_truncation_hint, truncate_lines
 
 # Configure debug logging
 if os.environ.get("TEDDY_DEBUG"):
@@ -17,23 +26,53 @@ from teddy_executor.core.domain.models import (
     FileAlreadyExistsError,
 )
 
+if TYPE_CHECKING:
+    from teddy_executor.adapters.outbound.file_sniffer import FileClassification
+    from teddy_executor.adapters.outbound.filesystem_helpers import TextHead
+
 logger = logging.getLogger(__name__)
 
 
+class IFileSniffer(Protocol):
+    """
+    Internal adapter-layer port for classifying files before they are loaded
+    into the context.
+    """
+
+    def classify(self, path: str) -> "FileClassification":
+        """Classifies the file as text, binary, minified or oversized."""
+        ...
+
+
 class LocalFileSystemAdapter(IFileSystemManager):
     """
     An adapter that implements file system operations on the local machine.
     """
 
-    def __init__(
+    DEFAULT_READ_WORKERS = 8
+    # Files slower than this are reported when diagnosing bulk reads.
+    SLOW_READ_SECONDS = 0.1
+    # Largest slice of a part encoded at once by `write_file_parts`.
+    WRITE_CHUNK_CHARS = 256 * 1024
+
+    def __init__(  # noqa: PLR0913
         self,
         edit_simulator: IEditSimulator,
         root_dir: str = ".",
         max_read_lines: int = 1000,
+        max_read_bytes: Optional[int] = None,
+        *,
+        file_sniffer: Optional[IFileSniffer] = None,
+        read_workers: Optional[int] = None,
     ):
         self._edit_simulator = edit_simulator
         self.root_dir = Path(root_dir)
         self.max_read_lines = max_read_lines
+        self.max_read_bytes = max_read_bytes
+        self._file_sniffer = file_sniffer
+        self.read_workers = read_workers or self.DEFAULT_READ_WORKERS
+        # Seconds spent on each file by the last read_files_in_vault call.
+        self.last_read_timings: dict[str, float] = {}
 
     def _resolve_path(self, path: str) -> Path:
         """
@@ -92,8 +131,9 @@ class LocalFileSystemAdapter(IFileSystemManager):
                 for line in content.splitlines():
                     stripped_line = line.strip()
                     if stripped_line and not stripped_line.startswith("#"):
-                        # Skip strings with illegal filename characters on Windows/Unix
-                        if any(c in stripped_line for c in '*?"<>|'):
+                        # Skip strings with illegal filename characters on Windows/Unix.
+                        # '*' and '?' are kept as gitignore-style globs.
+                        if any(c in stripped_line for c in '"<>|'):
                             continue
                         all_paths.add(stripped_line)
             except (FileNotFoundError, OSError, ValueError):
@@ -113,8 +153,12 @@ class LocalFileSystemAdapter(IFileSystemManager):
     def list_directory_recursive(self, path: str) -> list[str]:
         """
         Lists all files in a directory and its subdirectories, respecting ignores.
+        Inside a git work tree the listing comes from `git ls-files`; otherwise
+        the directory is walked.
         """
-        from teddy_executor.adapters.outbound.filesystem_helpers import walk_recursive
+        from teddy_executor.adapters.outbound.filesystem_helpers import (
+            list_files_recursive,
+        )
 
         dir_path = self._resolve_path(path)
         if not dir_path.is_dir():
@@ -123,31 +167,50 @@ class LocalFileSystemAdapter(IFileSystemManager):
         if not hasattr(self, "_resolved_root"):
             self._resolved_root = self.root_dir.resolve()
 
-        spec = self._get_ignore_spec()
-        files = []
+        git_files = self._list_git_files_under(dir_path)
+        if git_files is not None:
+            return git_files
 
-        for entry, is_dir in walk_recursive(self._resolved_root, dir_path, spec):
-            if not is_dir and entry.is_file():
-                try:
-                    rel_path = entry.relative_to(self._resolved_root)
-                except ValueError:
-                    rel_path = entry
-                files.append(str(rel_path).replace("\\", "/"))
+        return list_files_recursive(dir_path, self._get_ignore_engine())
 
-        return sorted(files)
+    def match_paths(self, paths: Sequence[str], patterns: Sequence[str]) -> list[str]:
+        """
+        Returns the paths (in their given order) matching any of the
+        gitignore-style patterns. Directory patterns match everything below.
+        """
+        import pathspec
 
-    def _get_ignore_spec(self):
-        """Loads and caches the ignore specification."""
-        if not hasattr(self, "_ignore_spec"):
+        spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+        return list(spec.match_files(paths))
+
+    def _list_git_files_under(self, dir_path: Path) -> list[str] | None:
+        """
+        Returns the git-listed files below `dir_path`, or None if git cannot
+        be used (non-git project or a directory outside the project root).
+        """
+        from teddy_executor.adapters.outbound.filesystem_helpers import (
+            git_list_files,
+        )
+
+        try:
+            rel_dir = dir_path.relative_to(self._resolved_root).as_posix()
+        except ValueError:
+            return None
+
+        return git_list_files(self._resolved_root, rel_dir)
+
+    def _get_ignore_engine(self):
+        """Creates and caches the hierarchical ignore engine."""
+        if not hasattr(self, "_ignore_engine"):
             from teddy_executor.adapters.outbound.filesystem_helpers import (
-                load_ignore_spec,
+                IgnoreEngine,
             )
 
             if not hasattr(self, "_resolved_root"):
                 self._resolved_root = self.root_dir.resolve()
 
-            self._ignore_spec = load_ignore_spec(self._resolved_root)
-        return self._ignore_spec
+            self._ignore_engine = IgnoreEngine(self._resolved_root)
+        return self._ignore_engine
 
     def get_mtime(self, path: str) -> float:
         """
@@ -185,16 +248,72 @@ class LocalFileSystemAdapter(IFileSystemManager):
         """
         Reads the content of multiple files specified in a list.
         Returns content for found files and None for files that are not found.
-        """
+        Binary, minified and oversized files are replaced by a placeholder
+        with their type and size.
+
+        Files are read on a bounded thread pool so that slow (e.g. network)
+        filesystems overlap their latency. The result keeps the input order,
+        and per-file timings are kept in `last_read_timings`.
+        """
+        sniffer = self._get_file_sniffer()
+        # Disable parallelization in tests to avoid pyfakefs deadlocks.
+        workers = 1 if os.environ.get("TEDDY_TESTING") else self.read_workers
+        workers = min(workers, len(paths))
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(lambda p: self._read_vault_file(p, sniffer), paths)
+                )
+        else:
+            results = [self._read_vault_file(path, sniffer) for path in paths]
+
         contents: dict[str, str | None] = {}
-        for path in paths:
-            try:
-                # read_file already calls _resolve_path, which joins with root_dir.
-                contents[path] = self.read_file(path)
-            except FileNotFoundError:
-                contents[path] = None  # Mark not found files with None
+        timings: dict[str, float] = {}
+        for path, (content, elapsed) in zip(paths, results):
+            contents[path] = content
+            timings[path] = elapsed
+        self.last_read_timings = timings
+        self._log_slow_reads(timings)
         return contents
 
+    def _read_vault_file(
+        self, path: str, sniffer: IFileSniffer
+    ) -> tuple[Optional[str], float]:
+        """Reads a single vault file and returns its content and read time."""
+        start = time.perf_counter()
+        try:
+            classification = sniffer.classify(str(self._resolve_path(path)))
+            if not classification.is_text:
+                content: Optional[str] = classification.placeholder()
+            else:
+                # read_file already calls _resolve_path, which joins with root_dir.
+                content = self.read_file(path)
+        except FileNotFoundError:
+            content = None  # Mark not found files with None
+        return content, time.perf_counter() - start
+
+    def _log_slow_reads(self, timings: dict[str, float]) -> None:
+        """Logs the total read time and any slow files at debug level."""
+        if not logger.isEnabledFor(logging.DEBUG) or not timings:
+            return
+        logger.debug(
+            "Read %d files in %.4fs (cumulative)", len(timings), sum(timings.values())
+        )
+        for path, elapsed in sorted(timings.items(), key=lambda t: -t[1]):
+            if elapsed < self.SLOW_READ_SECONDS:
+                break
+            logger.debug("Slow read: %s took %.4fs", path, elapsed)
+
+    def _get_file_sniffer(self) -> IFileSniffer:
+        """Returns the injected sniffer, or a private uncapped one."""
+        if self._file_sniffer is None:
+            from teddy_executor.adapters.outbound.file_sniffer import FileSniffer
+
+            self._file_sniffer = FileSniffer()
+        return self._file_sniffer
+
     def path_exists(self, path: str) -> bool:
         """
         Checks if a path (file or directory) exists relative to the root_dir.
@@ -221,6 +340,20 @@ class LocalFileSystemAdapter(IFileSystemManager):
         """
         self._resolve_path(path).write_text(content, encoding="utf-8")
 
+    def write_file_parts(self, path: str, parts: Iterable[str]) -> None:
+        """
+        Writes the concatenation of `parts` to a file. Large parts are
+        written in slices, so their encoded copy stays small.
+        """
+        chunk = self.WRITE_CHUNK_CHARS
+        with open(self._resolve_path(path), "w", encoding="utf-8") as f:
+            for part in parts:
+                if len(part) <= chunk:
+                    f.write(part)
+                    continue
+                for start in range(0, len(part), chunk):
+                    f.write(part[start : start + chunk])
+
     def create_file(self, path: str, content: str, overwrite: bool = False) -> None:
         """
         Creates a new file with the given content.
@@ -243,10 +376,17 @@ class LocalFileSystemAdapter(IFileSystemManager):
 
     def read_file(self, path: str) -> str:
         """
-        Reads the content of a file from the specified path.
+        Reads the content of a file from the specified path, truncated to
+        `max_read_lines` lines. Only the head of the file is loaded; the
+        remaining lines are just counted for the truncation hint.
         """
         try:
-            content = self.read_raw_file(path)
+            head = self._read_head(path)
+            if head is not None and head.truncated:
+                hint = get_truncation_hint("read", head.shown_lines, head.total_lines)
+                return f"{head.text}\n{hint}"
+
+            content = head.text if head is not None else self.read_raw_file(path)
             return truncate_lines(
                 content,
                 max_lines=self.max_read_lines,
@@ -259,6 +399,21 @@ class LocalFileSystemAdapter(IFileSystemManager):
         except IOError as e:
             raise IOError(f"Failed to read file at {path}: {e}") from e
 
+    def _read_head(self, path: str) -> "TextHead | None":
+        """
+        Streams the head of a file. Returns None when no limit is configured
+        or the head cannot be split exactly without a full read.
+        """
+        from teddy_executor.adapters.outbound.filesystem_helpers import (
+            read_text_head,
+        )
+
+        if not self.max_read_lines or self.max_read_lines <= 0:
+            return None
+        return read_text_head(
+            self._resolve_path(path), self.max_read_lines, self.max_read_bytes
+        )
+
     def read_raw_file(self, path: str) -> str:
         """
         Reads the full content of a file from the specified path.
@@ -1,26 +1,44 @@
+import json
+import logging
 import os
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Collection, Dict, List, Optional, Sequence, Tuple
 from teddy_executor.core.ports.outbound.repo_tree_generator import IRepoTreeGenerator
 
+if TYPE_CHECKING:
+    from teddy_executor.adapters.outbound.filesystem_helpers import IgnoreRules
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _DirectorySnapshot:
+    """The non-ignored children of a single directory at a given mtime."""
+
+    mtime_ns: Optional[int]
+    dirs: List[str] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+    # Whether the directory holds its own .gitignore, and the key of the
+    # ignore rules (nested .gitignore files and mtimes) it was listed with.
+    has_ignore_file: bool = False
+    rules_key: str = ""
+
 
 class _RecursiveListFormatter:
     """
-    A helper class to format a set of paths into a recursive "ls -R" style list.
+    A helper class to format a tree snapshot into a recursive "ls -R" style list.
+    Rendering works purely from the in-memory snapshot and never touches the disk.
     """
 
-    def __init__(self, root_dir: Path, included_paths: set[Path]):
-        self.root_dir = root_dir
-        self.included_paths = included_paths
+    def __init__(self, snapshot: Dict[str, _DirectorySnapshot]):
+        self.snapshot = snapshot
 
     def format(self) -> str:
         """Generates the recursive list string."""
         sections: list[str] = []
-        # Gather all directories that are included (including root)
-        directories = sorted(
-            [p for p in self.included_paths if p.is_dir() and not p.is_symlink()]
-            + [self.root_dir],
-            key=lambda p: str(p.relative_to(self.root_dir)).lower(),
-        )
+        directories = sorted(self.snapshot, key=self._sort_key)
 
         for directory in directories:
             section_content = self._format_section(directory)
@@ -29,68 +47,342 @@ class _RecursiveListFormatter:
 
         return "\n\n".join(sections)
 
-    def _format_section(self, directory: Path) -> str:
+    @staticmethod
+    def _sort_key(rel_dir: str) -> str:
+        """Orders sections like a native relative path ('.' for the root)."""
+        return (rel_dir.replace("/", os.sep) if rel_dir else ".").lower()
+
+    def _format_section(self, rel_dir: str) -> str:
         """Formats a single directory section."""
-        children = sorted(
-            [p for p in directory.iterdir() if p in self.included_paths],
-            key=lambda p: p.name.lower(),
-        )
+        entry = self.snapshot[rel_dir]
+        children = sorted(entry.dirs + entry.files, key=str.lower)
 
         if not children:
             return ""
 
         lines = []
-        if directory != self.root_dir:
-            rel_path = directory.relative_to(self.root_dir)
+        if rel_dir:
             # Poka-Yoke: Always use forward slashes for the tree protocol
-            posix_rel_path = str(rel_path).replace(os.sep, "/")
-            lines.append(f"./{posix_rel_path}:")
+            lines.append(f"./{rel_dir}:")
+
+        lines.extend(children)
+        return "\n".join(lines)
+
+
+class _CompactTreeFormatter:
+    """
+    Formats a tree snapshot as an indented trie. Chains of directories with
+    a single subdirectory and no files are collapsed onto one line, and a
+    directory with more than `dir_budget` entries lists only the first ones,
+    followed by a summary of the rest (file counts by extension). Directories
+    in `expand_dirs` are always listed in full.
+    """
+
+    INDENT = "  "
 
-        for child in children:
-            lines.append(child.name)
+    def __init__(
+        self,
+        snapshot: Dict[str, _DirectorySnapshot],
+        dir_budget: int,
+        expand_dirs: Collection[str],
+    ):
+        self.snapshot = snapshot
+        self.dir_budget = dir_budget
+        self.expand_dirs = expand_dirs
+        self._file_counts: Dict[str, int] = {}
 
+    def format(self) -> str:
+        """Generates the compact tree string."""
+        lines: List[str] = []
+        self._format_children("", 0, lines)
         return "\n".join(lines)
 
+    def _format_children(self, rel_dir: str, depth: int, lines: List[str]) -> None:
+        entry = self.snapshot.get(rel_dir)
+        if entry is None:
+            return
+        dirs = sorted(entry.dirs, key=str.lower)
+        files = sorted(entry.files, key=str.lower)
+        shown = len(dirs) + len(files)
+        if 0 < self.dir_budget < shown and rel_dir not in self.expand_dirs:
+            shown = self.dir_budget
+
+        indent = self.INDENT * depth
+        for name in dirs[:shown]:
+            label, child = self._collapse(self._join(rel_dir, name))
+            lines.append(f"{indent}{label}/")
+            self._format_children(child, depth + 1, lines)
+        for name in files[: max(0, shown - len(dirs))]:
+            lines.append(f"{indent}{name}")
+
+        hidden_dirs = dirs[shown:]
+        hidden_files = files[max(0, shown - len(dirs)) :]
+        if hidden_dirs or hidden_files:
+            lines.append(
+                f"{indent}{self._summarize(rel_dir, hidden_dirs, hidden_files)}"
+            )
+
+    def _collapse(self, rel_dir: str) -> Tuple[str, str]:
+        """Follows single-subdirectory chains; returns the label and last dir."""
+        label = rel_dir.rpartition("/")[2]
+        entry = self.snapshot.get(rel_dir)
+        while entry is not None and len(entry.dirs) == 1 and not entry.files:
+            rel_dir = self._join(rel_dir, entry.dirs[0])
+            label = f"{label}/{entry.dirs[0]}"
+            entry = self.snapshot.get(rel_dir)
+        return label, rel_dir
+
+    def _summarize(
+        self, rel_dir: str, hidden_dirs: List[str], hidden_files: List[str]
+    ) -> str:
+        """Describes omitted entries, e.g. `... +2 dirs (40 files), 12 *.json`."""
+        parts = []
+        if hidden_dirs:
+            nested = sum(self._count_files(self._join(rel_dir, d)) for d in hidden_dirs)
+            parts.append(f"+{len(hidden_dirs)} dirs ({nested} files)")
+        by_extension: Dict[str, int] = {}
+        for name in hidden_files:
+            suffix = os.path.splitext(name)[1].lower()
+            key = f"*{suffix}" if suffix else "(no extension)"
+            by_extension[key] = by_extension.get(key, 0) + 1
+        parts.extend(
+            f"{count} {key}"
+            for key, count in sorted(
+                by_extension.items(), key=lambda kv: (-kv[1], kv[0])
+            )
+        )
+        return "... " + ", ".join(parts)
+
+    def _count_files(self, rel_dir: str) -> int:
+        """Counts the files below a directory, memoized per directory."""
+        count = self._file_counts.get(rel_dir)
+        if count is None:
+            entry = self.snapshot.get(rel_dir)
+            count = 0
+            if entry is not None:
+                count = len(entry.files) + sum(
+                    self._count_files(self._join(rel_dir, d)) for d in entry.dirs
+                )
+            self._file_counts[rel_dir] = count
+        return count
+
+    @staticmethod
+    def _join(rel_dir: str, name: str) -> str:
+        return f"{rel_dir}/{name}" if rel_dir else name
+
 
 class LocalRepoTreeGenerator(IRepoTreeGenerator):
     """
     An adapter that generates a file tree for the local repository,
     respecting .gitignore and .teddyignore rules.
+
+    Inside a git work tree the file list comes from a single `git ls-files`
+    call. Otherwise, directory listings are kept in a snapshot keyed by
+    directory mtime and persisted to `.teddy/.tree_snapshot.json`, so that
+    only directories whose entries changed since the previous turn are
+    listed again.
     """
 
+    SNAPSHOT_FILENAME = ".tree_snapshot.json"
+    SNAPSHOT_VERSION = 2
+    # Directories modified this recently may still change within the same
+    # mtime tick, so their listings are never trusted on the next run.
+    RACY_WINDOW_NS = 2_000_000_000
+
     def __init__(self, root_dir: str = "."):
+        from teddy_executor.adapters.outbound.filesystem_helpers import IgnoreEngine
+
+        self.root_dir = Path(root_dir).resolve()
+        self.ignore_engine = IgnoreEngine(self.root_dir)
+        self._snapshot: Optional[Dict[str, _DirectorySnapshot]] = None
+
+    def generate_tree(
+        self,
+        expand_paths: Optional[Sequence[str]] = None,
+        *,
+        compact: bool = False,
+        dir_budget: int = 0,
+    ) -> str:
+        """
+        Generates a string representation of the file tree by building the
+        directory snapshot and then delegating to a formatter.
+        """
         from teddy_executor.adapters.outbound.filesystem_helpers import (
-            load_ignore_spec,
+            git_list_files,
         )
 
-        self.root_dir = Path(root_dir).resolve()
-        self.ignore_spec = load_ignore_spec(self.root_dir)
+        files = git_list_files(self.root_dir)
+        if files is not None:
+            snapshot = self._snapshot_from_files(files)
+        else:
+            snapshot = self._refresh_snapshot()
+        if not compact:
+            return _RecursiveListFormatter(snapshot).format()
+        return _CompactTreeFormatter(
+            snapshot, dir_budget, self._ancestor_dirs(expand_paths or [])
+        ).format()
+
+    @staticmethod
+    def _ancestor_dirs(paths: Sequence[str]) -> set[str]:
+        """Returns every directory on the way to the given relative paths."""
+        ancestors: set[str] = set()
+        for path in paths:
+            rel_dir = path.replace("\\", "/").strip("/").rpartition("/")[0]
+            while rel_dir and rel_dir not in ancestors:
+                ancestors.add(rel_dir)
+                rel_dir = rel_dir.rpartition("/")[0]
+        ancestors.add("")
+        return ancestors
+
+    @staticmethod
+    def _snapshot_from_files(files: List[str]) -> Dict[str, _DirectorySnapshot]:
+        """Derives the directory snapshot from a flat list of relative file paths."""
+        snapshot: Dict[str, _DirectorySnapshot] = {"": _DirectorySnapshot(None)}
+        for path in files:
+            rel_dir, _, name = path.rpartition("/")
+            entry = snapshot.get(rel_dir)
+            if entry is None:
+                entry = snapshot[rel_dir] = _DirectorySnapshot(None)
+                # Register each newly seen ancestor with its own parent.
+                child = rel_dir
+                while child:
+                    parent, _, child_name = child.rpartition("/")
+                    known = parent in snapshot
+                    snapshot.setdefault(parent, _DirectorySnapshot(None)).dirs.append(
+                        child_name
+                    )
+                    if known:
+                        break
+                    child = parent
+            entry.files.append(name)
+        return snapshot
+
+    def _refresh_snapshot(self) -> Dict[str, _DirectorySnapshot]:
+        """
+        Walks the included directories, reusing cached listings for every
+        directory whose mtime and ignore rules are unchanged.
+        """
+        from teddy_executor.adapters.outbound.filesystem_helpers import (
+            ignore_fingerprint,
+        )
+
+        fingerprint = ignore_fingerprint(self.root_dir)
+        previous = self._snapshot
+        if previous is None:
+            previous = self._load_snapshot(fingerprint)
+
+        racy_after_ns = time.time_ns() - self.RACY_WINDOW_NS
+        snapshot: Dict[str, _DirectorySnapshot] = {}
+        changed = False
+        pending = [("", self.ignore_engine.root_rules())]
+        while pending:
+            rel_dir, inherited = pending.pop()
+            entry, rules = self._scan_directory(
+                rel_dir, inherited, previous.get(rel_dir), racy_after_ns
+            )
+            changed = changed or entry is not previous.get(rel_dir)
+            snapshot[rel_dir] = entry
+            pending.extend(
+                (f"{rel_dir}/{d}" if rel_dir else d, rules) for d in entry.dirs
+            )
+
+        self._snapshot = snapshot
+        if changed or len(snapshot) != len(previous):
+            self._save_snapshot(fingerprint, snapshot)
+        return snapshot
 
-    def _get_included_paths(self) -> set[Path]:
+    def _scan_directory(
+        self,
+        rel_dir: str,
+        inherited: "IgnoreRules",
+        cached: Optional[_DirectorySnapshot],
+        racy_after_ns: int,
+    ) -> Tuple[_DirectorySnapshot, "IgnoreRules"]:
         """
-        Walks the directory and returns a set of all files and parent directories
-        that are not excluded by the ignore spec.
+        Returns the cached listing if still fresh, otherwise lists the
+        directory. Also returns the ignore rules for its children.
         """
-        from teddy_executor.adapters.outbound.filesystem_helpers import walk_recursive
+        from teddy_executor.adapters.outbound.filesystem_helpers import (
+            list_directory_entries,
+        )
+
+        directory = self.root_dir / rel_dir if rel_dir else self.root_dir
+        mtime_ns = directory.stat().st_mtime_ns
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            rules = inherited.enter(directory, rel_dir, cached.has_ignore_file)
+            if rules.key == cached.rules_key:
+                return cached, rules
 
-        included_paths: set[Path] = set()
-        for entry, _ in walk_recursive(self.root_dir, self.root_dir, self.ignore_spec):
-            # If not ignored, add to set
-            included_paths.add(entry)
+        dirs, files, rules = list_directory_entries(directory, rel_dir, inherited)
+        entry = _DirectorySnapshot(
+            mtime_ns=mtime_ns if mtime_ns < racy_after_ns else None,
+            dirs=dirs,
+            files=files,
+            has_ignore_file=rules is not inherited,
+            rules_key=rules.key,
+        )
+        return entry, rules
 
-            # Ensure parent connectivity
-            for parent in entry.parents:
-                if parent == self.root_dir:
-                    break
-                included_paths.add(parent)
+    def _snapshot_path(self) -> Path:
+        return self.root_dir / ".teddy" / self.SNAPSHOT_FILENAME
 
-        return included_paths
+    def _load_snapshot(self, fingerprint: str) -> Dict[str, _DirectorySnapshot]:
+        """
+        Loads the persisted snapshot. Missing, corrupt or stale snapshots
+        (different ignore rules) are treated as empty.
+        """
+        path = self._snapshot_path()
+        if not path.is_file():
+            return {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if (
+                data.get("version") != self.SNAPSHOT_VERSION
+                or data.get("ignore_fingerprint") != fingerprint
+            ):
+                return {}
+            return {
+                rel_dir: _DirectorySnapshot(
+                    mtime_ns=raw["mtime_ns"],
+                    dirs=raw["dirs"],
+                    files=raw["files"],
+                    has_ignore_file=raw["has_ignore_file"],
+                    rules_key=raw["rules_key"],
+                )
+                for rel_dir, raw in data["dirs"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
 
-    def generate_tree(self) -> str:
+    def _save_snapshot(
+        self, fingerprint: str, snapshot: Dict[str, _DirectorySnapshot]
+    ) -> None:
         """
-        Generates a string representation of the file tree by gathering paths
-        and then delegating to a formatter.
+        Persists the snapshot atomically. Never creates the `.teddy/` directory,
+        so uninitialized projects are left untouched.
         """
-        included_paths = self._get_included_paths()
-        formatter = _RecursiveListFormatter(self.root_dir, included_paths)
-        return formatter.format()
+        path = self._snapshot_path()
+        if not path.parent.is_dir():
+            return
+        payload = {
+            "version": self.SNAPSHOT_VERSION,
+            "ignore_fingerprint": fingerprint,
+            "dirs": {
+                rel_dir: {
+                    "mtime_ns": entry.mtime_ns,
+                    "dirs": entry.dirs,
+                    "files": entry.files,
+                    "has_ignore_file": entry.has_ignore_file,
+                    "rules_key": entry.rules_key,
+                }
+                for rel_dir, entry in snapshot.items()
+            },
+        }
+        tmp = path.with_name(f"{path.name}.tmp")
+        try:
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as e:
+            logger.debug("Failed to write tree snapshot: %s", e)
+            if tmp.exists():
+                tmp.unlink()
@@ -2,6 +2,8 @@ import os
 import platform
 import subprocess  # nosec B404
 import sys
+import threading
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -17,10 +19,23 @@ class SystemEnvironmentInspector(IEnvironmentInspector):
     """
     An adapter that inspects the real system environment using standard
     Python libraries.
+
+    The short git status, used for the per-file status codes, is rendered
+    from a single `git status --porcelain=v2 -z` call. The full status is
+    git's own `git status` text. Both are cached, keyed on the
+    `.git/index` stat and HEAD, for a short time.
     """
 
+    # Working tree edits do not touch the index, so cached results are only
+    # trusted for this long even if the key is unchanged.
+    STATUS_CACHE_TTL = 2.0
+
     def __init__(self, run_func: Optional[Callable[..., Any]] = None):
         self._run_func = run_func or subprocess.run
+        self._status_locks = {"short": threading.Lock(), "full": threading.Lock()}
+        self._status_cache: dict[str, tuple[Any, float, str]] = {}
+        self._toplevels: dict[str, Optional[str]] = {}
+        self._quote_paths: dict[str, bool] = {}
 
     def get_environment_info(self) -> dict[str, str]:
         """
@@ -41,30 +56,97 @@ class SystemEnvironmentInspector(IEnvironmentInspector):
         """
         Gathers the current Git status of the working directory (short format).
         """
-        try:
-            result = self._run_func(  # nosec B603 B607
-                ["git", "status", "-s"],
-                capture_output=True,
-                text=True,
-                check=True,
-                stdin=subprocess.DEVNULL,
-            )
-            return result.stdout.rstrip() if result.stdout else ""
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return None
+        return self._read_cached_status("short", self._run_short_status)
 
     def get_full_git_status(self) -> Optional[str]:
         """
         Gathers the full Git status of the working directory (including branch info).
         """
+        return self._read_cached_status("full", self._run_long_status)
+
+    def _read_cached_status(
+        self, view: str, run: Callable[[], Optional[str]]
+    ) -> Optional[str]:
+        """
+        Returns the cached status `view`, reusing it while the index and HEAD
+        are unchanged. Concurrent callers share a single git invocation.
+        """
+        from teddy_executor.adapters.outbound.git_status import status_cache_key
+
+        key = status_cache_key(os.getcwd())
+        with self._status_locks[view]:
+            cached = self._status_cache.get(view)
+            if (
+                key is not None
+                and cached is not None
+                and cached[0] == key
+                and time.monotonic() - cached[1] < self.STATUS_CACHE_TTL
+            ):
+                return cached[2]
+
+            status = run()
+            if key is not None and status is not None:
+                self._status_cache[view] = (key, time.monotonic(), status)
+            return status
+
+    def _run_short_status(self) -> Optional[str]:
+        """Renders `git status -s` from the porcelain v2 entries."""
+        from teddy_executor.adapters.outbound.git_status import (
+            PORCELAIN_V2_COMMAND,
+            format_short_status,
+            has_non_ascii_path,
+            parse_porcelain_v2,
+            relative_to_cwd,
+        )
+
+        output = self._run_git(PORCELAIN_V2_COMMAND)
+        if output is None:
+            return None
+        status = parse_porcelain_v2(output)
+        cwd = os.getcwd()
+        # At the top of the work tree, root-relative paths are cwd-relative.
+        if not os.path.exists(os.path.join(cwd, ".git")):
+            toplevel = self._get_git_toplevel(cwd)
+            if toplevel:
+                status = relative_to_cwd(status, toplevel, cwd)
+        quote_non_ascii = has_non_ascii_path(status) and self._quotes_paths(cwd)
+        return format_short_status(status, quote_non_ascii)
+
+    def _run_long_status(self) -> Optional[str]:
+        """Returns git's own `git status` text."""
+        from teddy_executor.adapters.outbound.git_status import LONG_STATUS_COMMAND
+
+        output = self._run_git(LONG_STATUS_COMMAND)
+        return output.rstrip() if output is not None else None
+
+    def _get_git_toplevel(self, cwd: str) -> Optional[str]:
+        """Returns the work tree root for `cwd` (cached, it never changes)."""
+        from teddy_executor.adapters.outbound.git_status import SHOW_TOPLEVEL_COMMAND
+
+        if cwd not in self._toplevels:
+            output = self._run_git(SHOW_TOPLEVEL_COMMAND)
+            self._toplevels[cwd] = output.strip() if output else None
+        return self._toplevels[cwd]
+
+    def _quotes_paths(self, cwd: str) -> bool:
+        """Returns `core.quotePath` for `cwd` (cached, default true)."""
+        from teddy_executor.adapters.outbound.git_status import QUOTE_PATH_COMMAND
+
+        if cwd not in self._quote_paths:
+            output = self._run_git(QUOTE_PATH_COMMAND)
+            self._quote_paths[cwd] = (output or "").strip() != "false"
+        return self._quote_paths[cwd]
+
+    def _run_git(self, command: list[str]) -> Optional[str]:
+        """Runs a git command, returning its stdout or None if it fails."""
         try:
             result = self._run_func(  # nosec B603 B607
-                ["git", "status"],
+                command,
                 capture_output=True,
                 text=True,
                 check=True,
                 stdin=subprocess.DEVNULL,
             )
-            return result.stdout.rstrip() if result.stdout else ""
         except (subprocess.CalledProcessError, FileNotFoundError):
             return None
+        return result.stdout or ""
@@ -0,0 +1,124 @@
+import hashlib
+import importlib.util
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Where tiktoken downloads the BPE files of the OpenAI encodings from.
+ENCODING_URL = "https://openaipublic.blob.core.windows.net/encodings/{name}.tiktoken"
+
+
+class TiktokenEncodingStore:
+    """
+    Keeps tiktoken's BPE files in a persistent local directory.
+
+    tiktoken downloads an encoding on first use and caches it in a temporary
+    directory, which fails without network access and is lost on cleanup.
+    The store points tiktoken at `cache_dir` instead and seeds it with the
+    encodings bundled with litellm, so the common encodings load offline and
+    anything else is only downloaded once. `CUSTOM_TIKTOKEN_CACHE_DIR`
+    overrides the directory, as it does for litellm, and a
+    `TIKTOKEN_CACHE_DIR` set by the user is used as is.
+    """
+
+    CACHE_DIRNAME = ".tiktoken_cache"
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        custom_dir = os.environ.get("CUSTOM_TIKTOKEN_CACHE_DIR")
+        tiktoken_dir = os.environ.get("TIKTOKEN_CACHE_DIR")
+        # litellm points TIKTOKEN_CACHE_DIR at its bundled files on import;
+        # only a directory chosen by the user is kept.
+        if tiktoken_dir and self._is_bundled_dir(Path(tiktoken_dir)):
+            tiktoken_dir = None
+        chosen = custom_dir or tiktoken_dir or cache_dir
+        self._cache_dir = Path(chosen) if chosen else None
+
+    def activate(self) -> None:
+        """
+        Points tiktoken at the cache directory (call before loading). A
+        user-set `TIKTOKEN_CACHE_DIR` is the cache directory, so it keeps
+        its value.
+        """
+        if self._cache_dir is None:
+            return
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            logger.debug("Cannot create the tiktoken cache at %s", self._cache_dir)
+            return
+        os.environ["TIKTOKEN_CACHE_DIR"] = str(self._cache_dir)
+
+    def has_encoding(self, encoding_name: str) -> bool:
+        """Returns True if the encoding's BPE file is available locally."""
+        return self._find_file(encoding_name) is not None
+
+    def seed(self, encoding_name: str) -> bool:
+        """
+        Copies the encoding from litellm's bundled tokenizers into the cache
+        directory if it is missing. Returns True if it is available locally.
+        """
+        if self._cache_dir is None:
+            return self._bundled_file(encoding_name) is not None
+        target = self._cache_dir / self._file_key(encoding_name)
+        if target.is_file():
+            return True
+        bundled = self._bundled_file(encoding_name)
+        if bundled is None:
+            return False
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(".tmp")
+            shutil.copyfile(bundled, tmp)
+            os.replace(tmp, target)
+        except OSError:
+            logger.debug("Cannot seed the tiktoken cache with %s", encoding_name)
+            return False
+        return True
+
+    def _find_file(self, encoding_name: str) -> Optional[Path]:
+        """Returns the local BPE file of an encoding, if any."""
+        if self._cache_dir is not None:
+            cached = self._cache_dir / self._file_key(encoding_name)
+            if cached.is_file():
+                return cached
+        return self._bundled_file(encoding_name)
+
+    @staticmethod
+    def _file_key(encoding_name: str) -> str:
+        """Returns tiktoken's cache file name (SHA-1 of the source URL)."""
+        url = ENCODING_URL.format(name=encoding_name)
+        return hashlib.sha1(url.encode(), usedforsecurity=False).hexdigest()
+
+    def _bundled_file(self, encoding_name: str) -> Optional[Path]:
+        """Returns the copy of an encoding bundled with litellm, if any."""
+        for directory in self._bundled_dirs():
+            candidate = directory / self._file_key(encoding_name)
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def _is_bundled_dir(self, directory: Path) -> bool:
+        """Returns True if `directory` holds litellm's bundled tokenizers."""
+        resolved = directory.resolve()
+        return any(resolved == bundled.resolve() for bundled in self._bundled_dirs())
+
+    @staticmethod
+    def _bundled_dirs() -> List[Path]:
+        """
+        Returns litellm's bundled tokenizer directories. The package is
+        located without importing it.
+        """
+        try:
+            spec = importlib.util.find_spec("litellm")
+            locations = list(spec.submodule_search_locations or []) if spec else []
+        except (ImportError, ValueError, TypeError, AttributeError):
+            return []
+        return [
+            Path(location) / "litellm_core_utils" / "tokenizers"
+            for location in locations
+            if isinstance(location, str)
+        ]
@@ -0,0 +1,110 @@
+import atexit
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCountCache:
+    """
+    A persistent, size-capped LRU cache of token counts.
+
+    Entries are keyed by (content hash, encoding name) so that unchanged
+    files cost a single hash lookup instead of a full BPE pass. The cache
+    is loaded lazily on first access and flushed to disk once at process
+    exit (or explicitly via `flush()`).
+    """
+
+    CACHE_FILENAME = ".token_cache.json"
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_path: Optional[str] = None, max_entries: int = 20000):
+        self._cache_path = Path(cache_path) if cache_path else None
+        self._max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(text: str, encoding_name: str) -> str:
+        """Builds the cache key from the content hash and encoding name."""
+        digest = hashlib.blake2b(
+            text.encode("utf-8", errors="surrogatepass"), digest_size=16
+        ).hexdigest()
+        return f"{encoding_name}:{digest}"
+
+    def get(self, text: str, encoding_name: str) -> Optional[int]:
+        """Returns the cached token count, or None on a miss."""
+        key = self.make_key(text, encoding_name)
+        with self._lock:
+            self._ensure_loaded()
+            count = self._entries.get(key)
+            if count is not None:
+                self._entries.move_to_end(key)
+            return count
+
+    def put(self, text: str, encoding_name: str, count: int) -> None:
+        """Stores a token count, evicting the least recently used entries."""
+        key = self.make_key(text, encoding_name)
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = count
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def flush(self) -> None:
+        """
+        Writes the cache to disk atomically if it has unsaved entries.
+        The parent directory (normally `.teddy/`) is never created here, so
+        uninitialized projects are left untouched.
+        """
+        with self._lock:
+            if not self._dirty or self._cache_path is None:
+                return
+            if not self._cache_path.parent.is_dir():
+                return
+            payload = {"version": self.CACHE_VERSION, "entries": self._entries}
+            tmp = self._cache_path.with_name(f"{self._cache_path.name}.tmp")
+            try:
+                tmp.write_text(json.dumps(payload), encoding="utf-8")
+                tmp.replace(self._cache_path)
+                self._dirty = False
+            except OSError as e:
+                logger.debug("Failed to write token cache: %s", e)
+                if tmp.exists():
+                    tmp.unlink()
+
+    def _ensure_loaded(self) -> None:
+        """Loads persisted entries on first access. Caller must hold the lock."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._cache_path is None:
+            return
+        atexit.register(self.flush)
+        for key, count in self._read_entries(self._cache_path).items():
+            if isinstance(key, str) and isinstance(count, int):
+                self._entries[key] = count
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_entries(self, cache_path: Path) -> dict:
+        """Reads the raw entry map. Missing or corrupt files yield an empty map."""
+        if not cache_path.is_file():
+            return {}
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
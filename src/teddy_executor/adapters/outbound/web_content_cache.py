@@ -0,0 +1,224 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, Optional
+from teddy_executor.core.ports.outbound.web_content_cache import (
+    CachedWebContent,
+    IWebContentCache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class WebContentCache(IWebContentCache):
+    """
+    A persistent, size-capped LRU cache of scraped web content.
+
+    Each page is stored once in its own content-addressed blob file
+    (`<digest[:2]>/<digest>.txt`), so saving one URL never rewrites the
+    others. A small JSON index maps URLs to their blob, expiry time and
+    ETag/Last-Modified validators, in least-recently-used order. Expired
+    entries are kept so that they can be revalidated with a conditional
+    request instead of being downloaded again.
+
+    The cache directory is created inside an existing parent only (normally
+    `.teddy/`). Without one, entries live in memory for the current process.
+    """
+
+    CACHE_DIRNAME = "web_cache"
+    INDEX_FILENAME = "index.json"
+    CACHE_VERSION = 1
+    DEFAULT_TTL_SECONDS = 24 * 60 * 60
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._ttl_seconds = float(ttl_seconds)
+        self._max_bytes = max(1, int(max_bytes))
+        self._clock = clock
+        self._index: "OrderedDict[str, dict]" = OrderedDict()
+        self._memory_blobs: Dict[str, str] = {}
+        self._loaded = False
+        self._lock = Lock()
+
+    @staticmethod
+    def make_digest(content: str) -> str:
+        """Returns the content address of a page."""
+        return hashlib.blake2b(
+            content.encode("utf-8", errors="surrogatepass"), digest_size=16
+        ).hexdigest()
+
+    def get(self, url: str) -> Optional[CachedWebContent]:
+        """Returns the entry for `url` (fresh or expired), or None on a miss."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+            content = self._read_blob(entry["blob"])
+            if content is None:
+                # The blob was removed behind our back; forget the entry.
+                del self._index[url]
+                self._write_index()
+                return None
+            self._index.move_to_end(url)
+            return CachedWebContent(
+                content=content,
+                etag=entry.get("etag"),
+                last_modified=entry.get("last_modified"),
+                is_fresh=self._clock() < entry["expires_at"],
+            )
+
+    def put(
+        self,
+        url: str,
+        content: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Stores a page and evicts least recently used entries over the cap."""
+        digest = self.make_digest(content)
+        ttl = self._ttl_seconds if ttl_seconds is None else float(ttl_seconds)
+        with self._lock:
+            self._ensure_loaded()
+            self._write_blob(digest, content)
+            self._index[url] = {
+                "blob": digest,
+                "size": len(content.encode("utf-8", errors="surrogatepass")),
+                "expires_at": self._clock() + ttl,
+                "etag": etag if isinstance(etag, str) else None,
+                "last_modified": (
+                    last_modified if isinstance(last_modified, str) else None
+                ),
+            }
+            self._index.move_to_end(url)
+            self._evict()
+            self._write_index()
+
+    def renew(self, url: str) -> None:
+        """Restarts the default time-to-live of an existing entry."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._index.get(url)
+            if entry is None:
+                return
+            entry["expires_at"] = self._clock() + self._ttl_seconds
+            self._index.move_to_end(url)
+            self._write_index()
+
+    def _evict(self) -> None:
+        """Drops LRU entries (never the newest) until the blobs fit the cap."""
+        sizes = {entry["blob"]: entry["size"] for entry in self._index.values()}
+        total = sum(sizes.values())
+        while total > self._max_bytes and len(self._index) > 1:
+            _, evicted = self._index.popitem(last=False)
+            blob = evicted["blob"]
+            if any(entry["blob"] == blob for entry in self._index.values()):
+                continue
+            total -= sizes.pop(blob)
+            self._delete_blob(blob)
+
+    @staticmethod
+    def _blob_path(cache_dir: Path, digest: str) -> Path:
+        return cache_dir / digest[:2] / f"{digest}.txt"
+
+    def _read_blob(self, digest: str) -> Optional[str]:
+        if self._cache_dir is None or digest in self._memory_blobs:
+            return self._memory_blobs.get(digest)
+        try:
+            return self._blob_path(self._cache_dir, digest).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _write_blob(self, digest: str, content: str) -> None:
+        if self._cache_dir is None:
+            self._memory_blobs[digest] = content
+            return
+        path = self._blob_path(self._cache_dir, digest)
+        if path.is_file():
+            return
+        tmp = path.with_name(f"{path.name}.tmp")
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp.write_text(content, encoding="utf-8")
+            tmp.replace(path)
+        except OSError as e:
+            logger.debug("Failed to write web cache entry: %s", e)
+            self._memory_blobs[digest] = content
+
+    def _delete_blob(self, digest: str) -> None:
+        self._memory_blobs.pop(digest, None)
+        if self._cache_dir is None:
+            return
+        try:
+            self._blob_path(self._cache_dir, digest).unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("Failed to delete web cache entry: %s", e)
+
+    def _write_index(self) -> None:
+        """Writes the index atomically. Caller must hold the lock."""
+        if self._cache_dir is None:
+            return
+        index_path = self._cache_dir / self.INDEX_FILENAME
+        tmp = index_path.with_name(f"{index_path.name}.tmp")
+        payload = {"version": self.CACHE_VERSION, "entries": self._index}
+        try:
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(index_path)
+        except OSError as e:
+            logger.debug("Failed to write web cache index: %s", e)
+
+    def _ensure_loaded(self) -> None:
+        """Loads the index on first access. Caller must hold the lock."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._cache_dir is None:
+            return
+        if not self._cache_dir.is_dir():
+            if not self._cache_dir.parent.is_dir():
+                self._cache_dir = None
+                return
+            try:
+                self._cache_dir.mkdir()
+            except OSError:
+                self._cache_dir = None
+                return
+        for url, entry in self._read_index(self._cache_dir).items():
+            if self._is_valid_entry(url, entry):
+                self._index[url] = entry
+
+    def _read_index(self, cache_dir: Path) -> dict:
+        """Reads the raw index. Missing or corrupt files yield an empty index."""
+        index_path = cache_dir / self.INDEX_FILENAME
+        if not index_path.is_file():
+            return {}
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def _is_valid_entry(url: object, entry: object) -> bool:
+        return (
+            isinstance(url, str)
+            and isinstance(entry, dict)
+            and isinstance(entry.get("blob"), str)
+            and isinstance(entry.get("size"), int)
+            and isinstance(entry.get("expires_at"), (int, float))
+        )
@@ -1,13 +1,18 @@
+from threading import Lock
+from typing import Dict, Optional
 from teddy_executor.core.ports.outbound.web_scraper import WebScraper
 from teddy_executor.core.ports.outbound.config_service import IConfigService
 
 
 MIN_GITHUB_CONTENT_LENGTH = 10
+HTTP_NOT_MODIFIED = 304
 HTTP_BAD_REQUEST = 400
 HTTP_FORBIDDEN = 403
 HTTP_NOT_ACCEPTABLE = 406
 HTTP_TOO_MANY_REQUESTS = 429
 HTTP_INTERNAL_SERVER_ERROR = 500
+REVALIDATION_TIMEOUT = 10
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, Gecko) Chrome/124.0.0.0 Safari/537.36"
 
 
 class WebScraperAdapter(WebScraper):
@@ -17,6 +22,46 @@ class WebScraperAdapter(WebScraper):
 
     def __init__(self, config_service: IConfigService = None):  # type: ignore
         self._config_service = config_service
+        self._validators: Dict[str, Dict[str, Optional[str]]] = {}
+        self._validators_lock = Lock()
+
+    def _remember_validators(self, url: str, response) -> None:
+        """Records the cache validators of a successful response."""
+        headers = getattr(response, "headers", None) or {}
+        validators = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        with self._validators_lock:
+            self._validators[url] = validators
+
+    def get_validators(self, url: str) -> Dict[str, Optional[str]]:
+        """Returns the ETag/Last-Modified headers of the last fetch of `url`."""
+        with self._validators_lock:
+            return dict(self._validators.get(url, {}))
+
+    def is_unchanged(
+        self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> bool:
+        """Revalidates `url` with a single conditional GET."""
+        if not (etag or last_modified):
+            return False
+        import requests
+
+        headers = {"User-Agent": DEFAULT_USER_AGENT}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        try:
+            response = requests.get(
+                self._github_raw_target(url) or url,
+                headers=headers,
+                timeout=REVALIDATION_TIMEOUT,
+            )
+        except requests.exceptions.RequestException:
+            return False
+        return response.status_code == HTTP_NOT_MODIFIED
 
     def _get_trafilatura(self):
         """Lazy-load trafilatura to keep CLI startup fast."""
@@ -171,6 +216,7 @@ class WebScraperAdapter(WebScraper):
             try:
                 response = requests.get(url, headers=headers, timeout=20)
                 response.raise_for_status()
+                self._remember_validators(url, response)
                 return response.text
             except requests.exceptions.HTTPError as e:
                 status_code = getattr(e.response, "status_code", None)
@@ -225,18 +271,15 @@ class WebScraperAdapter(WebScraper):
 
         return html_content
 
-    def _handle_github_raw(self, url: str) -> str | None:
-        """Handles specialized fetching for GitHub raw content with retries."""
-        import requests
-        import time
-
+    def _github_raw_target(self, url: str) -> str | None:
+        """Returns the raw content URL for GitHub raw/blob URLs, else None."""
         is_raw_github = url.startswith("https://raw.githubusercontent.com/")
         is_github_blob = url.startswith("https://github.com/") and "/blob/" in url
 
         if not (is_raw_github or is_github_blob):
             return None
 
-        target_url = (
+        return (
             url.replace("github.com", "raw.githubusercontent.com").replace(
                 "/blob/", "/"
             )
@@ -244,6 +287,15 @@ class WebScraperAdapter(WebScraper):
             else url
         )
 
+    def _handle_github_raw(self, url: str) -> str | None:
+        """Handles specialized fetching for GitHub raw content with retries."""
+        import requests
+        import time
+
+        target_url = self._github_raw_target(url)
+        if target_url is None:
+            return None
+
         max_retries = 3
         if self._config_service:
             val = self._config_service.get_setting("research.max_scraper_retries", 3)
@@ -254,12 +306,11 @@ class WebScraperAdapter(WebScraper):
             try:
                 response = requests.get(
                     target_url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, Gecko) Chrome/124.0.0.0 Safari/537.36"
-                    },
+                    headers={"User-Agent": DEFAULT_USER_AGENT},
                     timeout=30,
                 )
                 response.raise_for_status()
+                self._remember_validators(url, response)
                 return response.text
             except (
                 requests.exceptions.HTTPError,
@@ -71,6 +71,7 @@ def _register_services(container: punq.Container) -> None:
 
     from teddy_executor.core.ports.outbound import (
         IShellExecutor,
+        IWebContentCache,
         IWebScraper,
         IWebSearcher,
     )
@@ -86,6 +87,7 @@ def _register_services(container: punq.Container) -> None:
                 web_scraper=container.resolve(IWebScraper),
                 web_searcher=container.resolve(IWebSearcher),
                 config_service=container.resolve(IConfigService),
+                web_cache=container.resolve(IWebContentCache),
             )
         ),
         scope=punq.Scope.transient,
@@ -168,6 +170,7 @@ def _register_orchestration_services(container: punq.Container) -> None:
     from teddy_executor.core.ports.outbound import (
         IEnvironmentInspector,
         IRepoTreeGenerator,
+        IWebContentCache,
         IWebScraper,
     )
 
@@ -179,6 +182,8 @@ def _register_orchestration_services(container: punq.Container) -> None:
             environment_inspector=container.resolve(IEnvironmentInspector),
             llm_client=container.resolve(ILlmClient),
             web_scraper=container.resolve(IWebScraper),
+            web_cache=container.resolve(IWebContentCache),
+            config_service=container.resolve(IConfigService),
         ),
         scope=punq.Scope.transient,
     )
@@ -11,6 +11,9 @@ if TYPE_CHECKING:
         IWebSearcher,
         IConfigService,
     )
+    from teddy_executor.core.ports.outbound.web_content_cache import (
+        IWebContentCache,
+    )
 
 
 @dataclass(frozen=True)
@@ -26,3 +29,4 @@ class ActionPorts:
     web_scraper: IWebScraper
     web_searcher: IWebSearcher
     config_service: Optional[IConfigService] = None
+    web_cache: Optional[IWebContentCache] = None
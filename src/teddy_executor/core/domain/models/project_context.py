@@ -1,12 +1,17 @@
 from dataclasses import dataclass
 
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, overload
 
 
 from dataclasses import field
 
 
+# How a context file was sent to the model.
+FULL_REPRESENTATION = "full"
+OUTLINE_REPRESENTATION = "outline"
+
+
 @dataclass
 class ContextItem:
     """
@@ -19,6 +24,7 @@ class ContextItem:
         scope: Source scope (System/Session/Turn).
         selected: Whether the file is selected for the next turn.
         auto_prune_reason: Reason for pre-deselection, if any.
+        representation: Whether the file was sent as full text or as an outline.
     """
 
     path: str
@@ -27,6 +33,38 @@ class ContextItem:
     scope: str
     selected: bool = True
     auto_prune_reason: Optional[str] = None
+    representation: str = FULL_REPRESENTATION
+
+
+class _JoinedSections:
+    """
+    Descriptor for `ProjectContext.content`. A value passed in is kept as is;
+    otherwise the content sections are joined on first access, so the full
+    text is only built when something actually reads it.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attribute = f"_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: Any = None) -> None: ...
+
+    @overload
+    def __get__(self, instance: "ProjectContext", owner: Any = None) -> str: ...
+
+    def __get__(
+        self, instance: Optional["ProjectContext"], owner: Any = None
+    ) -> Optional[str]:
+        if instance is None:
+            return None  # The dataclass default: join the sections.
+        value = instance.__dict__.get(self._attribute)
+        if value is None:
+            value = "\n".join(instance.content_sections)
+            instance.__dict__[self._attribute] = value
+        return value
+
+    def __set__(self, instance: "ProjectContext", value: Optional[str]) -> None:
+        instance.__dict__[self._attribute] = value
 
 
 @dataclass
@@ -37,16 +75,24 @@ class ProjectContext:
     Attributes:
         header: A string containing metadata about the context (e.g., CWD, OS).
         content: The main body of the context (e.g., file tree and contents).
+            When omitted, it is joined from `content_sections` on first access.
         scoped_paths: A mapping of scope names (e.g., 'Turn', 'Session') to lists of file paths.
         git_status: An optional string containing the output of 'git status -s'.
         items: Structured list of context files and metadata.
         agent_name: Name of the active agent.
         system_prompt_tokens: Token count of the system prompt.
         total_window: Total context window for the model.
+        tree_tokens: Token count of the repo tree (already part of content_tokens).
+        tokens_estimated: Whether the token counts are estimates rather than
+            exact tokenizer counts.
+        content_segments: The content split from most to least stable, when the
+            cache-friendly layout is used; joined with newlines it equals `content`.
+        content_sections: The content as formatted, section by section; joined
+            with newlines it equals `content`. Empty when only `content` is given.
     """
 
     header: str
-    content: str
+    content: _JoinedSections = _JoinedSections()
     scoped_paths: Dict[str, List[str]] = field(default_factory=dict)
     git_status: Optional[str] = None
     items: List[ContextItem] = field(default_factory=list)
@@ -54,3 +100,7 @@ class ProjectContext:
     system_prompt_tokens: int = 0
     content_tokens: int = 0
     total_window: int = 0
+    tree_tokens: int = 0
+    tokens_estimated: bool = False
+    content_segments: List[str] = field(default_factory=list)
+    content_sections: List[str] = field(default_factory=list)
@@ -23,6 +23,8 @@ class IGetContextUseCase(Protocol):
 
         Args:
             context_files: Optional mapping of scope names to .context files.
+            cache_dir: Deprecated. Web content is cached project-wide by the
+                shared web content cache.
             current_turn: Optional 2-digit turn number to include in the header.
             system_prompt_tokens: Token count of the system prompt (pre-computed).
 
@@ -1,4 +1,4 @@
-from typing import Protocol, Sequence, TextIO
+from typing import Iterable, Protocol, Sequence, TextIO
 
 
 class IFileSystemManager(Protocol):
@@ -24,6 +24,13 @@ class IFileSystemManager(Protocol):
         """
         ...
 
+    def match_paths(self, paths: Sequence[str], patterns: Sequence[str]) -> list[str]:
+        """
+        Returns the paths (in their given order) matching any of the
+        gitignore-style patterns. Directory patterns match everything below.
+        """
+        ...
+
     def create_directory(self, path: str) -> None:
         """
         Creates a directory, including any necessary parent directories.
@@ -37,6 +44,14 @@ class IFileSystemManager(Protocol):
         """
         ...
 
+    def write_file_parts(self, path: str, parts: Iterable[str]) -> None:
+        """
+        Writes the concatenation of `parts` to a file, one part at a time,
+        so that large content never has to be joined in memory. Creates or
+        overwrites the file like `write_file`.
+        """
+        ...
+
     def create_file(self, path: str, content: str, overwrite: bool = False) -> None:
         """
         Creates a new file with the given content.
@@ -91,6 +106,7 @@ class IFileSystemManager(Protocol):
     def resolve_paths_from_files(self, file_paths: Sequence[str]) -> list[str]:
         """
         Reads a list of context files and returns a deduplicated list of the paths they contain.
+        Glob patterns and `!` negations are returned verbatim.
         """
         ...
 
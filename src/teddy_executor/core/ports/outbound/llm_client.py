@@ -16,7 +16,7 @@ class ILlmClient(ABC):
     @abstractmethod
     def get_completion(
         self,
-        messages: List[Dict[str, str]],
+        messages: List[Dict[str, Any]],
         model: Optional[str] = None,
         **kwargs: Any,
     ) -> Any:
@@ -24,7 +24,9 @@ class ILlmClient(ABC):
         Sends a request to an LLM and returns the completed response object.
 
         Args:
-            messages: A list of message dictionaries (role/content).
+            messages: A list of message dictionaries (role/content). The
+                content is a string or a list of text parts; the parts mark
+                where the prompt may be cached.
             model: Optional identifier for the target model (overrides config).
             **kwargs: Additional parameters for the LLM provider.
 
@@ -38,7 +40,7 @@ class ILlmClient(ABC):
 
     @abstractmethod
     def get_token_count(
-        self, messages: List[Dict[str, str]], model: Optional[str] = None
+        self, messages: List[Dict[str, Any]], model: Optional[str] = None
     ) -> int:
         """
         Calculates the number of tokens in the payload.
@@ -53,6 +55,14 @@ class ILlmClient(ABC):
             "ILlmClient implementation must provide get_text_token_count"
         )
 
+    def prewarm_tokenizer(self, model: Optional[str] = None) -> bool:
+        """
+        Makes the tokenizer for the model available locally ahead of time, so
+        that token counting works offline. Returns True if exact counting is
+        ready; clients without a local tokenizer return False.
+        """
+        return False
+
     @abstractmethod
     def get_completion_cost(
         self, completion_response: Any, model_override: Optional[str] = None
@@ -62,6 +72,14 @@ class ILlmClient(ABC):
         """
         pass
 
+    def get_cache_usage(self, completion_response: Any) -> Dict[str, int]:
+        """
+        Returns the prompt-cache token counts of a completion response
+        (`cache_hit_tokens`, `cache_miss_tokens`, `cache_write_tokens`), or an
+        empty dict when the response carries no usage information.
+        """
+        return {}
+
     @abstractmethod
     def validate_config(self, include_remote: bool = False) -> List[str]:
         """
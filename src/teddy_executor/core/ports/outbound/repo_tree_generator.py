@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Optional, Protocol, Sequence
 
 
 class IRepoTreeGenerator(Protocol):
@@ -6,11 +6,24 @@ class IRepoTreeGenerator(Protocol):
     Outbound Port for generating a repository file tree.
     """
 
-    def generate_tree(self) -> str:
+    def generate_tree(
+        self,
+        expand_paths: Optional[Sequence[str]] = None,
+        *,
+        compact: bool = False,
+        dir_budget: int = 0,
+    ) -> str:
         """
         Generates a string representation of the file tree,
         respecting rules from .gitignore.
 
+        Args:
+            expand_paths: Relative paths whose directories are always listed
+                in full (e.g. the files in the context).
+            compact: Renders an indented trie instead of an "ls -R" listing.
+            dir_budget: In compact mode, the maximum number of entries listed
+                per directory before the rest is summarised (0 = unlimited).
+
         Returns:
             str: The file tree as a multi-line string.
         """
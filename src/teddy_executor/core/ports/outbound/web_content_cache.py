@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+
+@dataclass(frozen=True)
+class CachedWebContent:
+    """A cached page together with the validators needed to revalidate it."""
+
+    content: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    is_fresh: bool = True
+
+    @property
+    def can_revalidate(self) -> bool:
+        """True if a conditional request can confirm the entry is unchanged."""
+        return bool(self.etag or self.last_modified)
+
+
+class IWebContentCache(Protocol):
+    """
+    An outbound port for the persistent cache of scraped web content, shared
+    by context assembly and the `READ <url>` action.
+    """
+
+    def get(self, url: str) -> Optional[CachedWebContent]:
+        """
+        Returns the cached entry for `url`, or None on a miss. Expired
+        entries are still returned, with `is_fresh` set to False.
+        """
+        ...
+
+    def put(
+        self,
+        url: str,
+        content: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Stores the content of `url` with its validators. `ttl_seconds`
+        overrides the default time-to-live for this entry.
+        """
+        ...
+
+    def renew(self, url: str) -> None:
+        """Restarts the time-to-live of an entry after a successful revalidation."""
+        ...
@@ -1,4 +1,4 @@
-from typing import Protocol, runtime_checkable
+from typing import Dict, Optional, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -22,3 +22,20 @@ class WebScraper(Protocol):
             Any exception related to network errors or HTTP status codes.
         """
         ...
+
+    def get_validators(self, url: str) -> Dict[str, Optional[str]]:
+        """
+        Returns the `etag` and `last_modified` response headers recorded by
+        the last successful fetch of `url` (empty if none were sent).
+        """
+        ...
+
+    def is_unchanged(
+        self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> bool:
+        """
+        Sends a conditional request for `url` and returns True only if the
+        server confirmed the content is unchanged (304 Not Modified).
+        Network errors yield False.
+        """
+        ...
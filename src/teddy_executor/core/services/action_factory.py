@@ -25,6 +25,7 @@ class ActionFactory(IActionFactory):
         self._user_interactor = ports.user_interactor
         self._web_scraper = ports.web_scraper
         self._web_searcher = ports.web_searcher
+        self._web_cache = ports.web_cache
         self._config_service = ports.config_service
         self._standalone_actions: set[str] = set()
         self._action_map: Dict[str, Any] = {
@@ -51,15 +52,23 @@ class ActionFactory(IActionFactory):
         safe_params = params or {}
         resource = safe_params.get("resource", safe_params.get("path", ""))
         if resource.startswith("http"):
-            # Return a wrapper instead of monkeypatching the adapter
+            from teddy_executor.core.services.web_content_loader import (  # noqa: PLC0415
+                load_web_content,
+            )
+
+            # Return a wrapper instead of monkeypatching the adapter.
+            # URLs share the web content cache with context assembly.
             class WebReadAction:
-                def __init__(self, scraper):
+                def __init__(self, scraper, web_cache):
                     self._scraper = scraper
+                    self._web_cache = web_cache
 
                 def execute(self, **kwargs: Any) -> Any:
-                    return self._scraper.get_content(url=kwargs["path"])
+                    return load_web_content(
+                        self._scraper, self._web_cache, kwargs["path"]
+                    )
 
-            return WebReadAction(self._web_scraper)
+            return WebReadAction(self._web_scraper, self._web_cache)
 
         if safe_params.get("lines"):
             # Lines-aware read: use read_raw_file (bypass truncation) and extract range
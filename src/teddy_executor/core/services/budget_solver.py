@@ -0,0 +1,74 @@
+import math
+from dataclasses import dataclass
+from typing import List, Sequence, Set, Tuple
+
+# Upper bound on the number of capacity buckets used by the solver.
+DEFAULT_RESOLUTION = 1024
+
+
+@dataclass(frozen=True)
+class BudgetItem:
+    """A candidate for the token budget: its key, token weight and value."""
+
+    key: int
+    tokens: int
+    value: float
+
+
+def solve_knapsack(
+    items: Sequence[BudgetItem],
+    capacity: int,
+    resolution: int = DEFAULT_RESOLUTION,
+) -> Set[int]:
+    """
+    Returns the keys of the items to keep so that their total value is
+    maximal while their tokens fit in `capacity` (0/1 knapsack).
+
+    Token weights are scaled down to at most `resolution` buckets and
+    rounded up, so the result always fits and the dynamic program runs in
+    O(len(items) * resolution). Capacity lost to rounding is then refilled
+    greedily by value per token. Results are deterministic.
+    """
+    if capacity <= 0:
+        return {item.key for item in items if item.tokens <= 0}
+
+    scale = max(1, math.ceil(capacity / max(1, resolution)))
+    buckets = capacity // scale
+    best = [0.0] * (buckets + 1)
+    choices: List[Tuple[int, int, bytes]] = []
+    kept: Set[int] = set()
+
+    for item in items:
+        if item.tokens <= 0:
+            kept.add(item.key)
+            continue
+        weight = math.ceil(item.tokens / scale)
+        if weight > buckets:
+            continue
+        taken = [b + item.value for b in best[: buckets + 1 - weight]]
+        skipped = best[weight:]
+        flags = bytes(t > s for t, s in zip(taken, skipped))
+        best = best[:weight] + [t if t > s else s for t, s in zip(taken, skipped)]
+        choices.append((item.key, weight, flags))
+
+    remaining = buckets
+    for key, weight, flags in reversed(choices):
+        if remaining >= weight and flags[remaining - weight]:
+            kept.add(key)
+            remaining -= weight
+
+    return _refill(items, kept, capacity)
+
+
+def _refill(items: Sequence[BudgetItem], kept: Set[int], capacity: int) -> Set[int]:
+    """Adds the densest left-out items that still fit in the exact capacity."""
+    used = sum(item.tokens for item in items if item.key in kept)
+    left_out = sorted(
+        (item for item in items if item.key not in kept),
+        key=lambda item: (-item.value / item.tokens, item.key),
+    )
+    for item in left_out:
+        if used + item.tokens <= capacity:
+            kept.add(item.key)
+            used += item.tokens
+    return kept
@@ -1,8 +1,15 @@
 import concurrent.futures
-import json
-from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, TypeVar
 from teddy_executor.core.domain.models import ProjectContext, ContextItem
+from teddy_executor.core.domain.models.project_context import (
+    FULL_REPRESENTATION,
+    OUTLINE_REPRESENTATION,
+)
 from teddy_executor.core.utils.markdown import (
     get_fence_for_content,
     get_language_from_path,
@@ -11,33 +18,99 @@ from teddy_executor.core.utils.markdown import (
     get_session_history_sort_key,
 )
 from teddy_executor.core.ports.inbound.get_context_use_case import IGetContextUseCase
+from teddy_executor.core.ports.outbound.config_service import IConfigService
 from teddy_executor.core.ports.outbound.file_system_manager import IFileSystemManager
 from teddy_executor.core.ports.outbound.repo_tree_generator import IRepoTreeGenerator
 from teddy_executor.core.ports.outbound.environment_inspector import (
     IEnvironmentInspector,
 )
 from teddy_executor.core.ports.outbound.llm_client import ILlmClient
+from teddy_executor.core.ports.outbound.web_content_cache import IWebContentCache
 from teddy_executor.core.ports.outbound.web_scraper import WebScraper as IWebScraper
+from teddy_executor.core.services.file_outliner import build_outline
+from teddy_executor.core.services.history_compactor import compact_history
+from teddy_executor.core.services.manifest_resolver import ManifestResolver, is_url
+from teddy_executor.core.services.web_content_loader import load_web_contents
+from teddy_executor.core.utils.token_estimator import estimate_token_count
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_LAYOUT = "default"
+CACHE_FRIENDLY_LAYOUT = "cache_friendly"
+LS_TREE_FORMAT = "ls"
+COMPACT_TREE_FORMAT = "compact"
+EXACT_TOKEN_COUNTING = "exact"
+ESTIMATED_TOKEN_COUNTING = "estimate"
+
+
+class _StageTimer:
+    """Accumulates the wall-clock time spent in each context pipeline stage."""
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def run(self, stage: str, func: Callable[..., T], *args: Any) -> T:
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.timings[stage] = self.timings.get(stage, 0.0) + elapsed
 
 
 class ContextService(IGetContextUseCase):
     """
     Application service for orchestrating the gathering of project context.
+
+    The independent, I/O-bound stages (environment info, git status, tree
+    generation, file reads, URL fetches and token counting) run as a
+    concurrent pipeline on a shared thread pool. Set `TEDDY_DEBUG` to log a
+    per-stage timing breakdown; the last one is kept in `last_stage_timings`.
+
+    With `context.layout: cache_friendly`, the content is ordered from most
+    stable to most volatile and also returned as `content_segments`, so
+    that providers can reuse the unchanged prefix from one turn to the next.
+
+    Turn-only source files larger than `context.outline_threshold_chars` are
+    sent as a structural outline instead of their full text, and content
+    repeated across session history files is replaced by references to its
+    first occurrence (`context.compact_history`).
+
+    With `context.token_counting: estimate`, token counts come from a
+    calibrated bytes-per-token ratio instead of the tokenizer.
     """
 
-    def __init__(
+    PIPELINE_WORKERS = 16
+    URL_FETCH_WORKERS = 8
+    URL_FETCH_PER_HOST = 2
+    URL_FETCH_DEADLINE = 30.0
+    OUTLINE_THRESHOLD_CHARS = 40000
+    TREE_DIR_BUDGET = 40
+
+    def __init__(  # noqa: PLR0913
         self,
         file_system_manager: IFileSystemManager,
         repo_tree_generator: IRepoTreeGenerator,
         environment_inspector: IEnvironmentInspector,
         llm_client: ILlmClient,
         web_scraper: IWebScraper,
+        *,
+        web_cache: Optional[IWebContentCache] = None,
+        config_service: Optional[IConfigService] = None,
     ):
         self._file_system_manager = file_system_manager
         self._repo_tree_generator = repo_tree_generator
         self._environment_inspector = environment_inspector
         self._llm_client = llm_client
         self._web_scraper = web_scraper
+        self._web_cache = web_cache
+        self._config_service = config_service
+        self._manifest_resolver = ManifestResolver(file_system_manager)
+        self.last_stage_timings: Dict[str, float] = {}
 
     def get_context(  # noqa: PLR0913
         self,
@@ -51,54 +124,310 @@ class ContextService(IGetContextUseCase):
     ) -> ProjectContext:
         """
         Gathers all project context information by orchestrating its dependencies.
+        `cache_dir` is kept for compatibility: remote content now goes through
+        the shared web content cache regardless of the session.
         """
-        system_info = self._environment_inspector.get_environment_info()
-        short_git_status = self._environment_inspector.get_git_status()
-        full_git_status = self._environment_inspector.get_full_git_status()
-        repo_tree = self._repo_tree_generator.generate_tree()
-
-        scoped_paths, all_resolved_paths = self._resolve_scoped_paths(context_files)
-
-        local_paths = [p for p in all_resolved_paths if not self._is_url(p)]
-        urls = [p for p in all_resolved_paths if self._is_url(p)]
-
-        file_contents = self._file_system_manager.read_files_in_vault(local_paths)
-
-        # Fetch remote content with session-level caching
-        web_cache = self._load_web_cache(cache_dir)
-        for url in urls:
-            if url in web_cache:
-                file_contents[url] = web_cache[url]
+        timer = _StageTimer()
+        start = time.perf_counter()
+        estimated = self._estimates_tokens()
+        # Disable parallelization in tests to avoid pyfakefs deadlocks.
+        max_workers = 1 if os.environ.get("TEDDY_TESTING") else self.PIPELINE_WORKERS
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            inspector = self._environment_inspector
+            system_info_f = pool.submit(
+                timer.run, "environment", inspector.get_environment_info
+            )
+            short_status_f = pool.submit(
+                timer.run, "git_status", inspector.get_git_status
+            )
+            full_status_f = pool.submit(
+                timer.run, "git_status_full", inspector.get_full_git_status
+            )
+
+            scoped_paths, all_resolved_paths = timer.run(
+                "resolve_paths", self._resolve_scoped_paths, context_files
+            )
+            local_paths = [p for p in all_resolved_paths if not self._is_url(p)]
+            urls = [p for p in all_resolved_paths if self._is_url(p)]
+            repo_tree_f = pool.submit(
+                timer.run, "repo_tree", self._generate_tree, local_paths
+            )
+
+            # URL fetches overlap with the file reads, and token counting
+            # starts as soon as each batch of contents has arrived.
+            urls_f = pool.submit(timer.run, "fetch_urls", self._fetch_urls, urls)
+            file_contents = timer.run(
+                "read_files", self._file_system_manager.read_files_in_vault, local_paths
+            )
+            outlines = timer.run(
+                "outline", self._outline_oversized_files, scoped_paths, file_contents
+            )
+            file_contents = {**file_contents, **outlines}
+            file_contents.update(
+                timer.run(
+                    "compact_history",
+                    self._compact_session_history,
+                    all_resolved_paths,
+                    file_contents,
+                )
+            )
+            token_futures = self._submit_token_counts(
+                pool,
+                timer,
+                local_paths,
+                file_contents,
+                include_tokens,
+                estimated=estimated,
+            )
+            file_contents.update(urls_f.result())
+            token_futures.update(
+                self._submit_token_counts(
+                    pool,
+                    timer,
+                    urls,
+                    file_contents,
+                    include_tokens,
+                    estimated=estimated,
+                )
+            )
+
+            full_git_status = full_status_f.result()
+            system_info = system_info_f.result()
+            segments: List[str] = []
+            if self._get_layout() == CACHE_FRIENDLY_LAYOUT:
+                header = "# Project Context"
+                segments = timer.run(
+                    "format",
+                    functools.partial(
+                        self._format_cache_friendly_segments, outlined=set(outlines)
+                    ),
+                    repo_tree_f.result(),
+                    scoped_paths,
+                    file_contents,
+                    full_git_status,
+                    self._format_system_information(system_info, current_turn),
+                )
+                sections = segments
             else:
-                try:
-                    content = self._web_scraper.get_content(url)
-                    file_contents[url] = content
-                    web_cache[url] = content
-                    if cache_dir:
-                        self._save_web_cache(cache_dir, web_cache)
-                except Exception:
-                    file_contents[url] = None
-
-        content = self._format_content(
-            repo_tree, scoped_paths, file_contents, full_git_status
-        )
-        content_tokens = (
-            self._llm_client.get_text_token_count(content) if include_tokens else 0
-        )
-
+                header = self._format_header(system_info, current_turn)
+                sections = timer.run(
+                    "format",
+                    self._format_content,
+                    repo_tree_f.result(),
+                    scoped_paths,
+                    file_contents,
+                    full_git_status,
+                    set(outlines),
+                )
+            count = self._get_token_counter(estimated)
+            content_tokens_f = (
+                pool.submit(
+                    timer.run, "count_tokens", self._count_sections, count, sections
+                )
+                if include_tokens
+                else None
+            )
+            tree_tokens_f = (
+                pool.submit(timer.run, "count_tokens", count, repo_tree_f.result())
+                if include_tokens and repo_tree_f.result()
+                else None
+            )
+            path_to_tokens = {path: f.result() for path, f in token_futures.items()}
+            items = self._collect_items(
+                scoped_paths, path_to_tokens, short_status_f.result(), set(outlines)
+            )
+            content_tokens = content_tokens_f.result() if content_tokens_f else 0
+            tree_tokens = tree_tokens_f.result() if tree_tokens_f else 0
+
+        self._report_timings(timer, time.perf_counter() - start)
         return ProjectContext(
-            header=self._format_header(system_info, current_turn),
-            content=content,
+            header=header,
+            content_segments=segments,
+            content_sections=sections,
             scoped_paths=scoped_paths,
             git_status=full_git_status,
-            items=self._collect_items(
-                scoped_paths, file_contents, short_git_status, include_tokens
-            ),
+            items=items,
             agent_name=agent_name,
             total_window=total_window,
             system_prompt_tokens=system_prompt_tokens,
             content_tokens=content_tokens,
+            tree_tokens=tree_tokens,
+            tokens_estimated=estimated and include_tokens,
+        )
+
+    def _fetch_urls(self, urls: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Fetches remote content through the shared web content cache, with a
+        bounded number of workers, a per-host limit and an overall deadline.
+        """
+        # Disable parallelization in tests to avoid pyfakefs deadlocks.
+        testing = bool(os.environ.get("TEDDY_TESTING"))
+        return load_web_contents(
+            self._web_scraper,
+            self._web_cache,
+            urls,
+            max_workers=1 if testing else self.URL_FETCH_WORKERS,
+            per_host=self.URL_FETCH_PER_HOST,
+            deadline=self.URL_FETCH_DEADLINE,
+        )
+
+    def _generate_tree(self, local_paths: List[str]) -> str:
+        """
+        Generates the repo tree in the configured `context.tree_format`. The
+        compact format keeps the directories of context files fully expanded.
+        """
+        if self._config_service is None:
+            return self._repo_tree_generator.generate_tree()
+        tree_format = self._config_service.get_setting(
+            "context.tree_format", LS_TREE_FORMAT
         )
+        if tree_format != COMPACT_TREE_FORMAT:
+            return self._repo_tree_generator.generate_tree()
+        budget = self._config_service.get_setting(
+            "context.tree_dir_budget", self.TREE_DIR_BUDGET
+        )
+        try:
+            dir_budget = int(str(budget))
+        except ValueError:
+            dir_budget = self.TREE_DIR_BUDGET
+        return self._repo_tree_generator.generate_tree(
+            local_paths, compact=True, dir_budget=dir_budget
+        )
+
+    def _get_outline_threshold(self) -> int:
+        """Returns the size above which Turn files are outlined (0 disables)."""
+        if self._config_service is None:
+            return self.OUTLINE_THRESHOLD_CHARS
+        threshold = self._config_service.get_setting(
+            "context.outline_threshold_chars", self.OUTLINE_THRESHOLD_CHARS
+        )
+        try:
+            return int(str(threshold))
+        except ValueError:
+            return self.OUTLINE_THRESHOLD_CHARS
+
+    def _outline_oversized_files(
+        self,
+        scoped_paths: Dict[str, List[str]],
+        file_contents: Dict[str, Optional[str]],
+    ) -> Dict[str, str]:
+        """
+        Returns outlines for the Turn-only local files above the threshold.
+        Files without any recognizable structure keep their full text.
+        """
+        threshold = self._get_outline_threshold()
+        if threshold <= 0:
+            return {}
+        outlines = {}
+        for path in self._turn_only_paths(scoped_paths):
+            content = file_contents.get(path)
+            if (
+                content is None
+                or len(content) <= threshold
+                or self._is_url(path)
+                or is_session_file_path(path)
+            ):
+                continue
+            outline = build_outline(path, content)
+            if outline is not None:
+                outlines[path] = outline
+        return outlines
+
+    def _compact_session_history(
+        self, paths: List[str], file_contents: Dict[str, Optional[str]]
+    ) -> Dict[str, str]:
+        """
+        Returns the session history files whose content changed after
+        replacing blocks repeated from earlier turns with references.
+        """
+        if self._config_service is not None and not self._config_service.get_setting(
+            "context.compact_history", True
+        ):
+            return {}
+        history = sorted(
+            (p for p in paths if get_session_history_display_name(p) is not None),
+            key=get_session_history_sort_key,
+        )
+        entries = [
+            (str(get_session_history_display_name(p)), file_contents.get(p) or "")
+            for p in history
+        ]
+        return {
+            path: compacted
+            for path, (_, original), compacted in zip(
+                history, entries, compact_history(entries)
+            )
+            if compacted != original
+        }
+
+    def _turn_only_paths(self, scoped_paths: Dict[str, List[str]]) -> List[str]:
+        """Returns the paths that only appear in the Turn scope."""
+        pinned = {
+            p for scope, paths in scoped_paths.items() if scope != "Turn" for p in paths
+        }
+        return [p for p in scoped_paths.get("Turn", []) if p not in pinned]
+
+    def _submit_token_counts(  # noqa: PLR0913
+        self,
+        pool: concurrent.futures.Executor,
+        timer: _StageTimer,
+        paths: List[str],
+        file_contents: Dict[str, Optional[str]],
+        include_tokens: bool,
+        *,
+        estimated: bool = False,
+    ) -> Dict[str, "concurrent.futures.Future[int]"]:
+        """Schedules token counting for the given paths on the pipeline pool."""
+        if not include_tokens:
+            return {}
+        return {
+            path: pool.submit(
+                timer.run,
+                "count_tokens",
+                self._get_token_counter(estimated, path),
+                file_contents.get(path) or "",
+            )
+            for path in dict.fromkeys(paths)
+        }
+
+    def _estimates_tokens(self) -> bool:
+        """Returns True if `context.token_counting` selects the estimator."""
+        if self._config_service is None:
+            return False
+        mode = self._config_service.get_setting(
+            "context.token_counting", EXACT_TOKEN_COUNTING
+        )
+        return mode == ESTIMATED_TOKEN_COUNTING
+
+    def _get_token_counter(
+        self, estimated: bool, path: Optional[str] = None
+    ) -> Callable[[str], int]:
+        """
+        Returns the token counting function: the LLM client's tokenizer, or
+        the bytes-per-token estimator for the language of `path`.
+        """
+        if estimated:
+            return functools.partial(estimate_token_count, path=path)
+        return self._llm_client.get_text_token_count
+
+    @staticmethod
+    def _count_sections(count: Callable[[str], int], sections: List[str]) -> int:
+        """
+        Counts the content tokens section by section, so the full content is
+        never assembled just to be measured and unchanged sections hit the
+        token cache.
+        """
+        return sum(count(section) for section in sections if section)
+
+    def _report_timings(self, timer: _StageTimer, total: float) -> None:
+        """Keeps the stage breakdown and logs it when debugging."""
+        timer.timings["total"] = total
+        self.last_stage_timings = timer.timings
+        if logger.isEnabledFor(logging.DEBUG):
+            breakdown = ", ".join(
+                f"{stage}={elapsed:.4f}s" for stage, elapsed in timer.timings.items()
+            )
+            logger.debug("Context pipeline stages: %s", breakdown)
 
     def _resolve_scoped_paths(
         self, context_files: Optional[Dict[str, Sequence[str]]]
@@ -115,92 +444,39 @@ class ContextService(IGetContextUseCase):
             context_files = {"Default": context_files}
 
         scoped_paths: Dict[str, List[str]] = {}
-        all_resolved_paths: List[str] = []
+        all_resolved_paths: Dict[str, None] = {}
 
         for scope, files in context_files.items():
             paths = self._resolve_files_to_paths(files)
             scoped_paths[scope] = paths
-            for p in paths:
-                if p not in all_resolved_paths:
-                    all_resolved_paths.append(p)
+            all_resolved_paths.update(dict.fromkeys(paths))
 
-        return scoped_paths, all_resolved_paths
+        return scoped_paths, list(all_resolved_paths)
 
     def _resolve_files_to_paths(self, files: Sequence[str]) -> List[str]:
         """
         Nuanced Resolution: Distinguishes manifests (.context) from targets.
-        Detects and expands directories recursively.
-        Preserves original order while deduplicating results.
+        Detects and expands directories recursively, and expands globs and
+        `!` negations. Preserves original order while deduplicating results.
         """
-        paths: List[str] = []
-        processed_manifests: set[str] = set()
-
-        for f in files:
-            self._resolve_recursive(f, paths, processed_manifests)
-
-        return paths
-
-    def _resolve_recursive(
-        self, f: str, paths: List[str], processed_manifests: set[str]
-    ) -> None:
-        """Helper to resolve a single path recursively."""
-        if self._is_url(f):
-            if f not in paths:
-                paths.append(f)
-        elif self._is_manifest(f):
-            self._expand_manifest(f, paths, processed_manifests)
-        elif self._file_system_manager.is_dir(f):
-            self._expand_directory(f, paths)
-        elif f not in paths:
-            paths.append(f)
-
-    def _expand_manifest(
-        self, f: str, paths: List[str], processed_manifests: set[str]
-    ) -> None:
-        """Expands a manifest and recursively resolves its contents."""
-        if f in processed_manifests:
-            return
-        processed_manifests.add(f)
-
-        # Expansion of manifests can return multiple paths
-        resolved = self._file_system_manager.resolve_paths_from_files([f])
-        for r in resolved:
-            self._resolve_recursive(r, paths, processed_manifests)
-
-    def _expand_directory(self, f: str, paths: List[str]) -> None:
-        """Expands a directory and adds its contents to the path list."""
-        resolved = self._file_system_manager.list_directory_recursive(f)
-        for r in resolved:
-            if r not in paths:
-                paths.append(r)
-
-    def _is_manifest(self, file_path: str) -> bool:
-        """Determines if a file path refers to a .context manifest."""
-        return (
-            file_path.endswith(".context")
-            or file_path.endswith("/context")
-            or file_path == "context"
-        )
+        return self._manifest_resolver.resolve(files)
 
     def _is_url(self, path: str) -> bool:
         """Determines if a path is a remote URL."""
-        return path.startswith("http://") or path.startswith("https://")
+        return is_url(path)
 
     def _collect_items(
         self,
         scoped_paths: Dict[str, List[str]],
-        file_contents: Dict[str, Optional[str]],
+        path_to_tokens: Dict[str, int],
         git_status: Optional[str],
-        include_tokens: bool,
+        outlined: Optional[Set[str]] = None,
     ) -> List[ContextItem]:
         """
         Orchestrates the assembly of ContextItem metadata DTOs.
         Deduplicates by path, prioritizing non-Turn scopes (e.g. Session).
         """
         parsed_status = self._parse_git_status(git_status)
-        path_to_tokens = self._get_path_to_tokens(
-            scoped_paths, file_contents, include_tokens
-        )
 
         # Deduplication map: path -> ContextItem
         items_map: Dict[str, ContextItem] = {}
@@ -219,46 +495,15 @@ class ContextService(IGetContextUseCase):
                         token_count=path_to_tokens.get(path, 0),
                         git_status=parsed_status.get(path, ""),
                         scope=scope,
+                        representation=(
+                            OUTLINE_REPRESENTATION
+                            if outlined and path in outlined
+                            else FULL_REPRESENTATION
+                        ),
                     )
 
         return list(items_map.values())
 
-    def _get_path_to_tokens(
-        self,
-        scoped_paths: Dict[str, List[str]],
-        file_contents: Dict[str, Optional[str]],
-        include_tokens: bool,
-    ) -> Dict[str, int]:
-        """Calculates token counts for all unique files in parallel."""
-        if not include_tokens:
-            return {}
-
-        unique_paths = list(set().union(*scoped_paths.values()))
-        if not unique_paths:
-            return {}
-
-        token_counts = {}
-
-        def get_count(path: str) -> tuple[str, int]:
-            content = file_contents.get(path) or ""
-            return path, self._llm_client.get_text_token_count(content)
-
-        # Parallelize to handle large repositories without stalling the UI.
-        # We use a ThreadPoolExecutor as token counting is often offloaded or involves latency.
-        # Disable parallelization in tests to avoid pyfakefs deadlocks.
-        import os
-
-        max_workers = 10 if not os.environ.get("TEDDY_TESTING") else 1
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_path = {
-                executor.submit(get_count, path): path for path in unique_paths
-            }
-            for future in concurrent.futures.as_completed(future_to_path):
-                path, count = future.result()
-                token_counts[path] = count
-
-        return token_counts
-
     def _parse_git_status(self, git_status: Optional[str]) -> Dict[str, str]:
         """Parses git status -s output into a map of path -> status code."""
         if not git_status:
@@ -280,12 +525,26 @@ class ContextService(IGetContextUseCase):
 
         return status_map
 
+    def _get_layout(self) -> str:
+        """Returns the configured content layout (`context.layout`)."""
+        if self._config_service is None:
+            return DEFAULT_LAYOUT
+        layout = self._config_service.get_setting("context.layout", DEFAULT_LAYOUT)
+        return str(layout or DEFAULT_LAYOUT)
+
     def _format_header(
         self, system_info: Dict[str, str], current_turn: Optional[str] = None
     ) -> str:
         """Formats the header section of the context report."""
-        header_parts = [
-            "# Project Context",
+        header_parts = ["# Project Context"]
+        header_parts.extend(self._format_system_information(system_info, current_turn))
+        return "\n".join(header_parts)
+
+    def _format_system_information(
+        self, system_info: Dict[str, str], current_turn: Optional[str] = None
+    ) -> List[str]:
+        """Formats the System Information section."""
+        return [
             "\n## System Information",
             f"- **Current Date:** {system_info.get('current_date', 'N/A')}",
             f"- **Current Time:** {system_info.get('current_time', 'N/A')}",
@@ -294,7 +553,6 @@ class ContextService(IGetContextUseCase):
             f"- **Shell:** {system_info.get('shell', 'N/A')}",
             f"- **Current Turn:** {current_turn or 'N/A'}",
         ]
-        return "\n".join(header_parts)
 
     def _format_content(
         self,
@@ -302,14 +560,16 @@ class ContextService(IGetContextUseCase):
         scoped_paths: Dict[str, List[str]],
         file_contents: Dict[str, Optional[str]],
         git_status: Optional[str] = None,
-    ) -> str:
-        """Formats the main content section of the context report."""
+        outlined: Optional[Set[str]] = None,
+    ) -> List[str]:
+        """
+        Formats the main content of the context report as a list of sections
+        which, joined with newlines, form the full content.
+        """
         # Gather all unique paths
-        all_paths: List[str] = []
-        for paths in scoped_paths.values():
-            for p in paths:
-                if p not in all_paths:
-                    all_paths.append(p)
+        all_paths = list(
+            dict.fromkeys(p for paths in scoped_paths.values() for p in paths)
+        )
 
         # Partition standard workspace files and session files
         workspace_paths = [p for p in all_paths if not is_session_file_path(p)]
@@ -324,7 +584,9 @@ class ContextService(IGetContextUseCase):
 
         # Format workspace files under ## Resource Contents
         content_parts.extend(
-            self._format_workspace_contents(workspace_paths, file_contents)
+            self._format_workspace_contents(
+                workspace_paths, file_contents, outlined=outlined
+            )
         )
 
         # Prepend Session History section first (after header's System Information)
@@ -334,78 +596,89 @@ class ContextService(IGetContextUseCase):
         if session_history_parts:
             content_parts = session_history_parts + content_parts
 
-        return "\n".join(content_parts)
+        return content_parts
+
+    def _format_cache_friendly_segments(  # noqa: PLR0913
+        self,
+        repo_tree: str,
+        scoped_paths: Dict[str, List[str]],
+        file_contents: Dict[str, Optional[str]],
+        git_status: Optional[str],
+        system_information: List[str],
+        *,
+        outlined: Optional[Set[str]] = None,
+    ) -> List[str]:
+        """
+        Formats the content as segments ordered from most to least stable:
+        pinned (non-Turn) resources, the project structure, Turn resources,
+        and finally git status, session history and system information.
+        Empty segments are left out.
+        """
+        turn_only = set(self._turn_only_paths(scoped_paths))
+
+        all_paths = list(
+            dict.fromkeys(p for paths in scoped_paths.values() for p in paths)
+        )
+        workspace_paths = [p for p in all_paths if not is_session_file_path(p)]
+        session_paths = [p for p in all_paths if is_session_file_path(p)]
+
+        pinned = self._format_workspace_contents(
+            [p for p in workspace_paths if p not in turn_only],
+            file_contents,
+            "\n## Pinned Resource Contents",
+            outlined=outlined,
+        )
+        structure = ["\n## Project Structure", f"```\n{repo_tree}\n```"]
+        turn = self._format_workspace_contents(
+            [p for p in workspace_paths if p in turn_only],
+            file_contents,
+            "\n## Turn Resource Contents",
+            outlined=outlined,
+        )
+        volatile = [
+            "\n## Git Status",
+            git_status if isinstance(git_status, str) else "",
+        ]
+        volatile.extend(self._format_session_history(session_paths, file_contents))
+        volatile.extend(system_information)
+
+        segments = [pinned, structure, turn, volatile]
+        return ["\n".join(parts) for parts in segments if parts]
 
     def _format_workspace_contents(
         self,
         workspace_paths: List[str],
         file_contents: Dict[str, Optional[str]],
+        heading: str = "\n## Resource Contents",
+        *,
+        outlined: Optional[Set[str]] = None,
     ) -> List[str]:
-        """Formats the workspace contents section."""
+        """
+        Formats the workspace contents section. Outlined files are marked as
+        such and fenced as plain text.
+        """
         if not workspace_paths:
             return []
 
-        parts = ["\n## Resource Contents"]
+        parts = [heading]
         for path in workspace_paths:
             parts.append("\n---")
             if self._is_url(path):
                 parts.append(f"### [{path}]({path})")
+            elif outlined and path in outlined:
+                parts.append(f"### [{path}](/{path}) (outline)")
             else:
                 parts.append(f"### [{path}](/{path})")
             content = file_contents.get(path)
             if content is not None:
-                lang = get_language_from_path(path)
+                is_outline = bool(outlined and path in outlined)
+                lang = "text" if is_outline else get_language_from_path(path)
                 fence = get_fence_for_content(content)
                 parts.append(f"{fence}{lang}\n{content}\n{fence}")
             else:
                 parts.append("```\n--- FILE NOT FOUND ---\n```")
         return parts
 
-    CACHE_FILENAME = ".web_cache.json"
-
-    def _load_web_cache(self, cache_dir: Optional[str]) -> Dict[str, str]:
-        """Load the web content cache from disk.
-
-        Returns an empty dict if:
-        - cache_dir is None (caching disabled)
-        - Cache file does not exist
-        - Cache file contains invalid JSON
-        - Cache file contains non-dict structure
-        - Cache file contains non-string values
-        """
-        if not cache_dir:
-            return {}
-        cache_path = Path(cache_dir) / self.CACHE_FILENAME
-        if not cache_path.exists():
-            return {}
-        try:
-            raw = cache_path.read_text(encoding="utf-8")
-            parsed = json.loads(raw)
-            if not isinstance(parsed, dict):
-                return {}
-            # Validate all values are strings
-            for k, v in parsed.items():
-                if not isinstance(k, str) or not isinstance(v, str):
-                    return {}
-            return parsed
-        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
-            return {}
-
-    def _save_web_cache(self, cache_dir: str, cache: Dict[str, str]) -> None:
-        """Write the cache to disk atomically.
-
-        Creates cache_dir if it does not exist.
-        Writes to a .tmp file first, then atomically renames to .web_cache.json
-        using Path.replace(). This prevents partial writes from corrupting
-        the cache if the process crashes mid-write.
-        """
-        cache_dir_path = Path(cache_dir)
-        cache_dir_path.mkdir(parents=True, exist_ok=True)
-        target = cache_dir_path / self.CACHE_FILENAME
-        tmp = cache_dir_path / f"{self.CACHE_FILENAME}.tmp"
-        tmp.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
-        tmp.replace(target)
-
     def _format_session_history(
         self,
         session_paths: List[str],
@@ -6,6 +6,7 @@ from teddy_executor.core.domain.models import (
 )
 from teddy_executor.core.domain.models.plan import DEFAULT_SIMILARITY_THRESHOLD
 from teddy_executor.core.ports.inbound.edit_simulator import EditPair, IEditSimulator
+from teddy_executor.core.services.validation_rules.edit_line_index import LineIndex
 from teddy_executor.core.services.validation_rules.edit_matcher import find_best_match
 
 
@@ -16,17 +17,19 @@ class EditSimulator(IEditSimulator):
 
     def _apply_single_edit(
         self,
-        content: str,
+        line_index: LineIndex,
         find: str,
         replace: str,
         threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
         match_all: bool = False,
     ) -> tuple[str, float]:
         """
-        Applies a single find/replace operation to content with domain logic.
+        Applies a single find/replace operation to the indexed content with
+        domain logic, updating the index to the returned content.
         """
+        content = line_index.content
         best_match, score, is_ambiguous, offset = find_best_match(
-            content, find, threshold
+            content, find, threshold, line_index=line_index
         )
 
         if is_ambiguous and not match_all:
@@ -62,14 +65,14 @@ class EditSimulator(IEditSimulator):
         if replace == "" and not match_all:
             # Newline cleanup logic for surgical deletions
             if best_match.endswith("\n") and (best_match) in content:
-                return content.replace(best_match, "", 1), score
+                return line_index.replace(best_match, "", 1), score
             if "\n" + best_match in content:
-                return content.replace("\n" + best_match, "", 1), score
+                return line_index.replace("\n" + best_match, "", 1), score
 
         if match_all:
             # Replaces all occurrences of the found block
-            return content.replace(best_match, final_replace), score
-        return content.replace(best_match, final_replace, 1), score
+            return line_index.replace(best_match, final_replace), score
+        return line_index.replace(best_match, final_replace, 1), score
 
     def _apply_indent_offset(self, replace_block: str, offset: int) -> str:
         """Applies a constant indentation offset to every non-empty line."""
@@ -98,9 +101,13 @@ class EditSimulator(IEditSimulator):
     ) -> tuple[str, list[float]]:
         """
         Applies each FIND/REPLACE pair in sequence.
+
+        One `LineIndex` is carried across the edits and patched around each
+        replacement, so the file is not re-split for every FIND block.
         """
         current_content = content
         all_scores = []
+        line_index = LineIndex(content)
 
         for edit in edits:
             # Local match_all override from action params or global
@@ -108,7 +115,7 @@ class EditSimulator(IEditSimulator):
 
             if do_match_all:
                 current_content, score = self._apply_single_edit(
-                    current_content,
+                    line_index,
                     edit["find"],
                     edit["replace"],
                     threshold,
@@ -117,7 +124,7 @@ class EditSimulator(IEditSimulator):
                 all_scores.append(score)
             else:
                 current_content, score = self._apply_single_edit(
-                    current_content,
+                    line_index,
                     edit["find"],
                     edit["replace"],
                     threshold,
@@ -0,0 +1,129 @@
+import ast
+import collections
+import hashlib
+import re
+import threading
+from typing import List, Optional, OrderedDict, Tuple
+
+# Number of outlines kept in memory, keyed by content hash.
+OUTLINE_CACHE_MAX_ENTRIES = 512
+# Longest signature shown for a single outline entry.
+MAX_SIGNATURE_LENGTH = 160
+
+PYTHON_EXTENSIONS = (".py", ".pyi")
+
+# Declarations of common languages (JS/TS, Go, Rust, Java, C#, Kotlin, ...).
+_DECLARATION_RE = re.compile(
+    r"^(?P<indent>\s*)(?:(?:export|default|public|private|protected|internal|"
+    r"static|abstract|final|async|pub(?:\([^)]*\))?|unsafe|override|sealed|"
+    r"open|data|inline)\s+)*"
+    r"(?:class|interface|trait|struct|enum|impl|type|module|namespace|object|"
+    r"function\*?|func|fn|fun|def)\b"
+)
+_HEADING_RE = re.compile(r"^#{1,6}\s+\S")
+_MARKDOWN_EXTENSIONS = (".md", ".markdown")
+
+Entry = Tuple[int, int, str]
+
+_cache: OrderedDict[str, List[Entry]] = collections.OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def build_outline(path: str, content: str) -> Optional[str]:
+    """
+    Returns a structural outline of `content`: its classes, functions and
+    other declarations with their signatures and line numbers, so that the
+    agent can follow up with a `READ` of just the lines it needs.
+
+    Python is parsed with `ast`; other languages fall back to line-based
+    heuristics. Returns None when no structure was found. The extracted
+    structure is cached by content hash.
+    """
+    is_python = path.endswith(PYTHON_EXTENSIONS)
+    is_markdown = path.endswith(_MARKDOWN_EXTENSIONS)
+    key = hashlib.blake2b(
+        f"{is_python}:{is_markdown}:".encode() + content.encode("utf-8", "replace"),
+        digest_size=16,
+    ).hexdigest()
+    with _cache_lock:
+        entries = _cache.get(key)
+        if entries is not None:
+            _cache.move_to_end(key)
+
+    if entries is None:
+        entries = _python_entries(content) if is_python else None
+        if entries is None:
+            entries = _heuristic_entries(content, is_markdown)
+        with _cache_lock:
+            _cache[key] = entries
+            while len(_cache) > OUTLINE_CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+
+    return _render(path, content, entries) if entries else None
+
+
+def _python_entries(content: str) -> Optional[List[Entry]]:
+    """Lists classes and functions, or returns None if the code does not parse."""
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return None
+
+    entries: List[Entry] = []
+
+    def visit(nodes: List[ast.stmt], depth: int) -> None:
+        for node in nodes:
+            if isinstance(node, ast.ClassDef):
+                bases = ", ".join(ast.unparse(b) for b in node.bases)
+                signature = (
+                    f"class {node.name}({bases}):" if bases else f"class {node.name}:"
+                )
+                entries.append((node.lineno, depth, signature))
+                visit(node.body, depth + 1)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                prefix = (
+                    "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+                )
+                returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+                signature = f"{prefix} {node.name}({ast.unparse(node.args)}){returns}:"
+                entries.append((node.lineno, depth, signature))
+                visit(node.body, depth + 1)
+
+    visit(tree.body, 0)
+    return entries
+
+
+def _heuristic_entries(content: str, is_markdown: bool) -> List[Entry]:
+    """Lists lines that look like declarations (or headings for Markdown)."""
+    entries: List[Entry] = []
+    indent_levels: List[int] = []
+    for lineno, line in enumerate(content.splitlines(), start=1):
+        if is_markdown:
+            if _HEADING_RE.match(line):
+                depth = len(line) - len(line.lstrip("#")) - 1
+                entries.append((lineno, depth, line.strip()))
+            continue
+
+        match = _DECLARATION_RE.match(line)
+        if not match:
+            continue
+        indent = len(match.group("indent").expandtabs(4))
+        while indent_levels and indent_levels[-1] >= indent:
+            indent_levels.pop()
+        entries.append((lineno, len(indent_levels), line.strip().rstrip("{").strip()))
+        indent_levels.append(indent)
+    return entries
+
+
+def _render(path: str, content: str, entries: List[Entry]) -> str:
+    """Formats outline entries as `L<line>: <signature>` with nesting."""
+    total_lines = content.count("\n") + (0 if content.endswith("\n") else 1)
+    lines = [
+        f"Outline of {path} ({total_lines} lines). "
+        "Use READ with `Lines:` to view a section."
+    ]
+    for lineno, depth, signature in entries:
+        if len(signature) > MAX_SIGNATURE_LENGTH:
+            signature = signature[: MAX_SIGNATURE_LENGTH - 3] + "..."
+        lines.append(f"L{lineno}: {'    ' * depth}{signature}")
+    return "\n".join(lines)
@@ -0,0 +1,103 @@
+import hashlib
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Fenced blocks shorter than this are kept even when repeated, since the
+# reference would cost about as much as the block itself.
+MIN_DUPLICATE_BLOCK_CHARS = 200
+
+_FENCE_RE = re.compile(r"^(?P<indent> {0,3})(?P<fence>`{3,}|~{3,})(?P<info>.*)$")
+_HEADING_RE = re.compile(r"^#{1,6}\s+\S")
+
+
+class _Origin(NamedTuple):
+    """Where a block was first seen."""
+
+    source: str
+    ordinal: int
+    heading: str
+
+
+def compact_history(entries: Sequence[Tuple[str, str]]) -> List[str]:
+    """
+    Replaces content repeated across session history files with short
+    references to its first occurrence.
+
+    `entries` are `(display name, content)` pairs in chronological order.
+    A file identical to an earlier one is replaced as a whole; otherwise,
+    every fenced block of at least `MIN_DUPLICATE_BLOCK_CHARS` that already
+    appeared (e.g. a FIND/REPLACE block or an unchanged command output) has
+    its body replaced. Each entry only depends on the ones before it, so the
+    output is deterministic and earlier entries never change as turns are
+    appended, which keeps the provider's prompt cache valid.
+    """
+    seen_files: Dict[str, str] = {}
+    seen_blocks: Dict[str, _Origin] = {}
+    compacted = []
+    for name, content in entries:
+        if not content.strip():
+            compacted.append(content)
+            continue
+        file_key = _digest(content.strip())
+        if file_key in seen_files:
+            compacted.append(f"[Identical to {seen_files[file_key]}; omitted.]")
+            continue
+        seen_files[file_key] = name
+        compacted.append(_compact_blocks(name, content, seen_blocks))
+    return compacted
+
+
+def _compact_blocks(name: str, content: str, seen: Dict[str, _Origin]) -> str:
+    """Replaces the bodies of top-level fenced blocks seen before."""
+    lines = content.split("\n")
+    output: List[str] = []
+    heading = ""
+    ordinal = 0
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        opening = _FENCE_RE.match(line)
+        end = _find_closing_fence(lines, index, opening) if opening else None
+        if end is None:
+            if _HEADING_RE.match(line):
+                heading = line.strip()
+            output.append(line)
+            index += 1
+            continue
+
+        ordinal += 1
+        body = "\n".join(lines[index + 1 : end])
+        origin = _Origin(name, ordinal, heading)
+        if len(body) >= MIN_DUPLICATE_BLOCK_CHARS:
+            key = _digest(body)
+            origin = seen.setdefault(key, origin)
+        if origin.source == name and origin.ordinal == ordinal:
+            output.extend(lines[index : end + 1])
+        else:
+            output.extend([line, _reference(origin), lines[end]])
+        index = end + 1
+    return "\n".join(output)
+
+
+def _find_closing_fence(
+    lines: List[str], start: int, opening: "re.Match[str]"
+) -> Optional[int]:
+    """Returns the index of the fence closing the block opened at `start`."""
+    fence = opening.group("fence")
+    closing = re.compile(rf"^ {{0,3}}{re.escape(fence[0])}{{{len(fence)},}}\s*$")
+    for index in range(start + 1, len(lines)):
+        if closing.match(lines[index]):
+            return index
+    return None
+
+
+def _reference(origin: _Origin) -> str:
+    """Formats the placeholder pointing at the first occurrence of a block."""
+    where = f' under "{origin.heading}"' if origin.heading else ""
+    return f"[Identical to block {origin.ordinal}{where} in {origin.source}; omitted.]"
+
+
+def _digest(text: str) -> str:
+    """Hashes text, ignoring trailing whitespace on each line."""
+    normalized = "\n".join(line.rstrip() for line in text.split("\n"))
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
@@ -0,0 +1,210 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+from teddy_executor.core.ports.outbound.file_system_manager import IFileSystemManager
+
+NEGATION_PREFIX = "!"
+GLOB_CHARS = ("*", "?", "[")
+# Explicit paths may contain literal brackets (e.g. Next.js `app/[id]/` routes),
+# so only these characters make them globs.
+PATH_GLOB_CHARS = ("*", "?")
+# The character sorting right after "/" bounds a directory prefix range.
+_PREFIX_END = chr(ord("/") + 1)
+# Below this many directories (and without globs) each one is walked on its own.
+_MIN_SHARED_DIRS = 2
+
+
+def is_url(path: str) -> bool:
+    """Determines if a path is a remote URL."""
+    return path.startswith("http://") or path.startswith("https://")
+
+
+def is_manifest(path: str) -> bool:
+    """Determines if a file path refers to a .context manifest."""
+    return path.endswith(".context") or path.endswith("/context") or path == "context"
+
+
+def is_pattern(path: str, glob_chars: Sequence[str] = GLOB_CHARS) -> bool:
+    """Determines if a manifest entry is a gitignore-style glob."""
+    return any(c in path for c in glob_chars)
+
+
+@dataclass(frozen=True)
+class _Expansion:
+    """A directory or glob entry whose files come from the shared listing."""
+
+    value: str
+    is_glob: bool
+
+
+@dataclass
+class _Manifest:
+    """The entries of a manifest in order, and the patterns it excludes."""
+
+    entries: List[Union[str, _Expansion, "_Manifest"]] = field(default_factory=list)
+    negations: List[str] = field(default_factory=list)
+
+
+def _normalize_dir(path: str) -> Optional[str]:
+    """
+    Returns the POSIX form of a directory entry, or None if it cannot be
+    located in a root-relative listing (e.g. it contains '..'). Absolute
+    entries keep their leading '/'.
+    """
+    clean = path.replace("\\", "/").strip()
+    while clean.startswith("./"):
+        clean = clean[2:]
+    absolute = clean.startswith("/")
+    clean = clean.strip("/")
+    if not clean or clean == "." or ":" in clean or ".." in clean.split("/"):
+        return None
+    return f"/{clean}" if absolute else clean
+
+
+def _common_ancestor(dirs: Sequence[str]) -> str:
+    """Returns the deepest directory containing all given directories."""
+    parts = [d.split("/") for d in dirs]
+    common: List[str] = []
+    for segments in zip(*parts):
+        if len(set(segments)) != 1:
+            break
+        common.append(segments[0])
+    return "/".join(common) or "."
+
+
+def _prefix_slice(listing: List[str], directory: str) -> List[str]:
+    """Returns the files below `directory` from a sorted listing."""
+    low = bisect.bisect_left(listing, f"{directory}/")
+    high = bisect.bisect_left(listing, f"{directory}{_PREFIX_END}", lo=low)
+    return listing[low:high]
+
+
+class ManifestResolver:
+    """
+    Resolves context entries (files, directories, URLs, nested `.context`
+    manifests, globs and `!` negations) into an ordered, deduplicated list
+    of paths.
+
+    Resolution runs in two passes. The first builds the manifest tree and
+    collects every directory and glob entry. The second lists all of them
+    from one shared walk and flattens the tree into an ordered set, so the
+    cost is linear in the number of resolved paths.
+    """
+
+    def __init__(self, file_system_manager: IFileSystemManager):
+        self._file_system_manager = file_system_manager
+
+    def resolve(
+        self, files: Sequence[str], processed_manifests: Optional[set[str]] = None
+    ) -> List[str]:
+        """Resolves the entries, treating the list itself as one manifest."""
+        processed = processed_manifests if processed_manifests is not None else set()
+        root = self._build(files, processed, from_manifest=False)
+        listings = self._list_expansions(list(self._expansions(root)))
+        resolved: Dict[str, None] = {}
+        self._flatten(root, listings, resolved)
+        return list(resolved)
+
+    def _build(
+        self, entries: Sequence[str], processed: set[str], *, from_manifest: bool
+    ) -> _Manifest:
+        """
+        Classifies entries and expands nested manifests (each only once).
+        Entries that exist on disk are taken literally even if they look
+        like globs; explicit paths outside manifests only glob on `*`/`?`.
+        """
+        glob_chars = GLOB_CHARS if from_manifest else PATH_GLOB_CHARS
+        manifest = _Manifest()
+        for entry in entries:
+            if entry.startswith(NEGATION_PREFIX):
+                manifest.negations.append(entry[len(NEGATION_PREFIX) :])
+            elif is_url(entry):
+                manifest.entries.append(entry)
+            elif is_pattern(
+                entry, glob_chars
+            ) and not self._file_system_manager.path_exists(entry):
+                manifest.entries.append(_Expansion(entry, is_glob=True))
+            elif is_manifest(entry):
+                if entry in processed:
+                    continue
+                processed.add(entry)
+                nested = self._file_system_manager.resolve_paths_from_files([entry])
+                manifest.entries.append(
+                    self._build(nested, processed, from_manifest=True)
+                )
+            elif self._file_system_manager.is_dir(entry):
+                manifest.entries.append(_Expansion(entry, is_glob=False))
+            else:
+                manifest.entries.append(entry)
+        return manifest
+
+    def _expansions(self, manifest: _Manifest) -> Iterator[_Expansion]:
+        for entry in manifest.entries:
+            if isinstance(entry, _Expansion):
+                yield entry
+            elif isinstance(entry, _Manifest):
+                yield from self._expansions(entry)
+
+    def _list_expansions(
+        self, expansions: List[_Expansion]
+    ) -> Dict[_Expansion, List[str]]:
+        """
+        Lists every directory and glob entry. A single directory is listed
+        directly; otherwise one walk of their common ancestor (or of the
+        whole project, for globs) is shared by all entries.
+        """
+        unique = list(dict.fromkeys(expansions))
+        globs = [e for e in unique if e.is_glob]
+        dirs = [e for e in unique if not e.is_glob]
+        normalized = {e: _normalize_dir(e.value) for e in dirs}
+        # Absolute directories are never part of the root-relative listing.
+        shareable = [
+            d for d in normalized.values() if d is not None and not d.startswith("/")
+        ]
+        if not globs and len(shareable) < _MIN_SHARED_DIRS:
+            return {
+                e: self._file_system_manager.list_directory_recursive(e.value)
+                for e in dirs
+            }
+
+        base = "." if globs else _common_ancestor(shareable)
+        shared = sorted(self._file_system_manager.list_directory_recursive(base))
+        listings: Dict[_Expansion, List[str]] = {
+            e: self._file_system_manager.match_paths(shared, [e.value]) for e in globs
+        }
+        for entry, directory in normalized.items():
+            files = (
+                _prefix_slice(shared, directory)
+                if directory and not directory.startswith("/")
+                else []
+            )
+            # Symlinked or otherwise unlisted directories are walked directly.
+            listings[entry] = (
+                files or self._file_system_manager.list_directory_recursive(entry.value)
+            )
+        return listings
+
+    def _flatten(
+        self,
+        manifest: _Manifest,
+        listings: Dict[_Expansion, List[str]],
+        resolved: Dict[str, None],
+    ) -> None:
+        """Appends the manifest's paths in order, minus its own negations."""
+        local: Dict[str, None] = {}
+        for entry in manifest.entries:
+            if isinstance(entry, str):
+                local[entry] = None
+            elif isinstance(entry, _Manifest):
+                self._flatten(entry, listings, local)
+            else:
+                local.update(dict.fromkeys(listings[entry]))
+
+        if manifest.negations:
+            excluded = set(
+                self._file_system_manager.match_paths(list(local), manifest.negations)
+            )
+            local = {path: None for path in local if path not in excluded}
+
+        for path in local:
+            resolved.setdefault(path, None)
@@ -1,5 +1,6 @@
 from pathlib import Path
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from teddy_executor.core.domain.models import ProjectContext
 from teddy_executor.core.ports.inbound.planning_use_case import IPlanningUseCase
 
 
@@ -10,6 +11,10 @@ class PlanningService(IPlanningUseCase):
 
     from teddy_executor.core.domain.models.planning_ports import PlanningPorts
 
+    # Chat formatting tokens added per message and to prime the reply.
+    MESSAGE_OVERHEAD_TOKENS = 3
+    REPLY_PRIMING_TOKENS = 3
+
     def __init__(self, ports: PlanningPorts):
         self._context_service = ports.context
         self._llm_client = ports.llm
@@ -79,21 +84,15 @@ class PlanningService(IPlanningUseCase):
         )
 
         # Context is purely project state (including initial_request.md via session.context).
-        full_context = f"{context.header}\n{context.content}"
+        # The content sections are joined into one string only for the
+        # request; input.md is streamed section by section.
         messages = [
             {"role": "system", "content": system_prompt},
-            {
-                "role": "user",
-                "content": full_context,
-            },
+            {"role": "user", "content": self._build_user_content(context)},
         ]
 
-        self._file_system_manager.write_file(
-            (turn_path / "input.md").as_posix(), full_context
-        )
-
-        model = str(
-            meta.get("model") or self._config_service.get_setting("llm.model") or ""
+        self._file_system_manager.write_file_parts(
+            (turn_path / "input.md").as_posix(), self._iter_context_parts(context)
         )
 
         # Pre-emptive Hydration: Trigger hydration via get_context_window BEFORE counting tokens.
@@ -102,8 +101,8 @@ class PlanningService(IPlanningUseCase):
             # We call this for the side-effect of triggering hydration in Turn 1
             self._llm_client.get_context_window(model=model)
 
-        token_count = int(
-            self._safe_float(self._llm_client.get_token_count(messages=messages))
+        token_count = self._count_prompt_tokens(
+            messages, context, system_token_count, model
         )
 
         if self._user_interactor:
@@ -124,15 +123,83 @@ class PlanningService(IPlanningUseCase):
         # This prevents the bug where meta["model"] was missing on first turn (no --model flag)
         # and update_meta overwrote it with the bare actual model.
         meta.setdefault("model", model)
+        self._record_cache_usage(meta, response)
         self._prompt_manager.update_meta(
             meta, response, token_count, turn_cost, meta_file_path
         )
 
         return plan_path, cost_val
 
+    def _build_user_content(self, context: ProjectContext) -> Any:
+        """
+        Returns the user message content. When the context comes in stable
+        segments, it is sent as one text part per segment (which concatenate
+        to the full context) so the LLM client can place cache breakpoints
+        between them.
+        """
+        if not context.content_segments:
+            return "\n".join([context.header, *self._content_sections(context)])
+        texts = [f"{context.header}\n{context.content_segments[0]}"]
+        texts.extend(f"\n{segment}" for segment in context.content_segments[1:])
+        return [{"type": "text", "text": text} for text in texts]
+
+    def _iter_context_parts(self, context: ProjectContext) -> Iterator[str]:
+        """Yields the full context (as written to input.md) section by section."""
+        yield context.header
+        for section in self._content_sections(context):
+            yield "\n"
+            yield section
+
+    @staticmethod
+    def _content_sections(context: ProjectContext) -> List[str]:
+        """
+        Returns the sections the context content was formatted in, so it is
+        streamed to input.md and joined into the LLM payload only once.
+        """
+        return context.content_sections or [context.content]
+
+    def _count_prompt_tokens(
+        self,
+        messages: List[Dict[str, Any]],
+        context: ProjectContext,
+        system_token_count: int,
+        model: str,
+    ) -> int:
+        """
+        Returns the prompt size. When the context and system prompt were
+        already counted exactly, their counts are summed instead of
+        tokenizing the whole payload again.
+        """
+        content_tokens = context.content_tokens
+        if (
+            isinstance(content_tokens, int)
+            and content_tokens > 0
+            and system_token_count > 0
+            and not context.tokens_estimated
+        ):
+            header_tokens = self._llm_client.get_text_token_count(
+                context.header, model=model
+            )
+            return (
+                system_token_count
+                + int(self._safe_float(header_tokens))
+                + content_tokens
+                + self.MESSAGE_OVERHEAD_TOKENS * len(messages)
+                + self.REPLY_PRIMING_TOKENS
+            )
+        return int(
+            self._safe_float(self._llm_client.get_token_count(messages=messages))
+        )
+
+    def _record_cache_usage(self, meta: Dict[str, Any], response: Any) -> None:
+        """Records the prompt-cache hit/miss token counts into meta.yaml."""
+        cache_usage = self._llm_client.get_cache_usage(response)
+        if isinstance(cache_usage, dict):
+            meta.update(cache_usage)
+
     def _perform_generation_with_retry(
         self,
-        messages: list[Dict[str, str]],
+        messages: list[Dict[str, Any]],
         model: str,
         provider: Optional[str] = None,
         api_key: Optional[str] = None,
@@ -12,6 +12,9 @@ from teddy_executor.core.domain.models.plan import Plan
 from teddy_executor.core.ports.inbound.run_plan_use_case import IRunPlanUseCase
 from teddy_executor.core.ports.outbound.file_system_manager import IFileSystemManager
 from teddy_executor.core.services.session_replanner import SessionReplanner
+from teddy_executor.core.services.validation_rules.edit_matcher import (
+    clear_match_cache,
+)
 from teddy_executor.core.utils.io import Tee as _Tee
 import typer
 
@@ -198,6 +201,9 @@ class SessionOrchestrator(IRunPlanUseCase):
         if message is not None and not message.strip():
             return None  # type: ignore
 
+        # Validation, previews and execution of this turn share EDIT matches.
+        clear_match_cache()
+
         # 0. Detect Session Mode (requires plan_path and meta.yaml)
         is_session = self._is_session_mode(plan_path)
 
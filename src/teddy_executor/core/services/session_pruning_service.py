@@ -1,3 +1,4 @@
+import math
 import re
 from dataclasses import is_dataclass, replace
 from typing import Any, Dict, Optional
@@ -5,6 +6,14 @@ from typing import Any, Dict, Optional
 from teddy_executor.core.domain.models import ProjectContext
 from teddy_executor.core.ports.outbound.config_service import IConfigService
 from teddy_executor.core.ports.outbound.file_system_manager import IFileSystemManager
+from teddy_executor.core.services.budget_solver import BudgetItem, solve_knapsack
+
+LARGEST_FIRST_STRATEGY = "largest_first"
+KNAPSACK_STRATEGY = "knapsack"
+# Priority multiplier per turn of age for the knapsack strategy.
+RECENCY_DECAY = 0.8
+# Priority multiplier for files with uncommitted changes.
+MODIFIED_WEIGHT = 2.0
 
 
 class SessionPruningService:
@@ -399,6 +408,28 @@ class SessionPruningService:
         except (TypeError, ValueError):
             return 0
 
+    def _get_budget_strategy(self) -> str:
+        """Reads ``auto_pruning.strategy``; unknown values use largest-first."""
+        strategy = self._config_service.get_setting(
+            "auto_pruning.strategy", LARGEST_FIRST_STRATEGY
+        )
+        if isinstance(strategy, str) and strategy.lower() == KNAPSACK_STRATEGY:
+            return KNAPSACK_STRATEGY
+        return LARGEST_FIRST_STRATEGY
+
+    def _get_pinned_paths(self, paths: list[str]) -> set[str]:
+        """Returns the paths matching ``auto_pruning.pinned`` (gitignore-style)."""
+        patterns = self._config_service.get_setting("auto_pruning.pinned", [])
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        if not isinstance(patterns, (list, tuple)) or not patterns or not paths:
+            return set()
+        return set(
+            self._file_system_manager.match_paths(
+                paths, [str(p) for p in patterns if p]
+            )
+        )
+
     def _apply_global_budget(self, items):
         """Prunes turn and history context items to fit within a global token budget."""
         threshold = self._get_turn_context_threshold()
@@ -423,16 +454,87 @@ class SessionPruningService:
                     and isinstance(item.token_count, (int, float))
                 ]
 
-                # Sort by token count descending to prune largest files first
-                prune_candidates.sort(key=lambda x: x[1].token_count, reverse=True)
-
-                for idx, item in prune_candidates:
-                    if total_tokens <= threshold:
-                        break
-                    items[idx] = replace(
-                        item,
-                        selected=False,
-                        auto_prune_reason="Pruned to fit context budget",
+                if self._get_budget_strategy() == KNAPSACK_STRATEGY:
+                    self._prune_by_value(items, prune_candidates, threshold)
+                else:
+                    self._prune_largest_first(
+                        items, prune_candidates, total_tokens, threshold
                     )
-                    total_tokens -= item.token_count
         return items
+
+    def _prune_largest_first(self, items, prune_candidates, total_tokens, threshold):
+        """Deselects the largest candidates until the budget is met."""
+        # Sort by token count descending to prune largest files first
+        prune_candidates.sort(key=lambda x: x[1].token_count, reverse=True)
+
+        for idx, item in prune_candidates:
+            if total_tokens <= threshold:
+                break
+            items[idx] = replace(
+                item,
+                selected=False,
+                auto_prune_reason="Pruned to fit context budget",
+            )
+            total_tokens -= item.token_count
+
+    def _prune_by_value(self, items, prune_candidates, threshold):
+        """
+        Keeps the subset of candidates with the highest total value that fits
+        the budget (0/1 knapsack). An item's value is its token count times
+        its priority, so the solver keeps the most valuable tokens rather
+        than the most files. Pinned paths are always kept.
+        """
+        pinned = self._get_pinned_paths([item.path for _, item in prune_candidates])
+        capacity = threshold - sum(
+            item.token_count for _, item in prune_candidates if item.path in pinned
+        )
+        turn_ids = {
+            idx: int(tid)
+            for idx, item in prune_candidates
+            if (tid := self._extract_turn_id(item.path))
+        }
+        latest_turn = max(turn_ids.values(), default=0)
+
+        priorities: Dict[int, tuple[float, str]] = {}
+        budget_items = []
+        for idx, item in prune_candidates:
+            if item.path in pinned:
+                continue
+            age = latest_turn - turn_ids[idx] if idx in turn_ids else 0
+            priorities[idx] = self._item_priority(item, age)
+            budget_items.append(
+                BudgetItem(
+                    key=idx,
+                    tokens=int(math.ceil(item.token_count)),
+                    value=priorities[idx][0] * item.token_count,
+                )
+            )
+
+        kept = solve_knapsack(budget_items, max(0, int(capacity)))
+        for idx, (priority, explanation) in priorities.items():
+            if idx in kept:
+                continue
+            items[idx] = replace(
+                items[idx],
+                selected=False,
+                auto_prune_reason=(
+                    "Pruned to fit context budget "
+                    f"(priority {priority:.2f}: {explanation})"
+                ),
+            )
+
+    def _item_priority(self, item: Any, age: int) -> tuple[float, str]:
+        """
+        Scores an item by recency and git status, with a short explanation.
+        Each turn of age multiplies the priority by RECENCY_DECAY; files with
+        uncommitted changes weigh MODIFIED_WEIGHT times more.
+        """
+        priority = RECENCY_DECAY**age
+        reasons = [f"{age} turn{'s' if age != 1 else ''} old" if age else "current"]
+        status = (item.git_status or "").strip()
+        if status and status != "D":
+            priority *= MODIFIED_WEIGHT
+            reasons.append("modified")
+        else:
+            reasons.append("unmodified")
+        return priority, ", ".join(reasons)
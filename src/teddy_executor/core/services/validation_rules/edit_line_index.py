@@ -0,0 +1,110 @@
+"""
+Editable line index shared by the EDIT matcher and simulator.
+"""
+
+from typing import List, Optional
+
+# Per-line hashes are reduced modulo a Mersenne prime for the rolling hash.
+LINE_HASH_MODULUS = (1 << 61) - 1
+
+
+class LineIndex:
+    """
+    The lines of a text, with their stripped forms and hashes, kept in sync
+    as the text is edited.
+
+    Stripped lines and hashes are computed on first use. `replace` splices
+    only the lines around the replaced span, so a sequence of edits does not
+    re-split or re-hash the whole file each time. Texts with line breaks
+    other than `\\n` and `\\r\\n` are simply re-indexed after each edit.
+    """
+
+    def __init__(self, content: str):
+        self._reset(content)
+
+    def _reset(self, content: str) -> None:
+        self.content = content
+        self.lines: List[str] = content.splitlines(keepends=True)
+        self._plain_breaks = has_plain_line_breaks(content)
+        self._stripped: Optional[List[str]] = None
+        self._hashes: Optional[List[int]] = None
+
+    @property
+    def stripped(self) -> List[str]:
+        """The lines without surrounding whitespace."""
+        if self._stripped is None:
+            self._stripped = [line.strip() for line in self.lines]
+        return self._stripped
+
+    @property
+    def line_hashes(self) -> List[int]:
+        """The hashes of the stripped lines, reduced for the rolling hash."""
+        if self._hashes is None:
+            self._hashes = [hash(line) % LINE_HASH_MODULUS for line in self.stripped]
+        return self._hashes
+
+    def positions(self, stripped_line: str) -> List[int]:
+        """Returns the indices of the lines equal to `stripped_line` once stripped."""
+        stripped = self.stripped
+        found: List[int] = []
+        index = -1
+        while True:
+            try:
+                index = stripped.index(stripped_line, index + 1)
+            except ValueError:
+                return found
+            found.append(index)
+
+    def replace(self, old: str, new: str, count: int = -1) -> str:
+        """
+        Replaces occurrences of `old` like `str.replace`, updates the index
+        and returns the new content. A single replacement only re-splits the
+        lines it touches; anything else re-indexes the whole text.
+        """
+        content = self.content
+        if count != 1:
+            self._reset(content.replace(old, new, count))
+            return self.content
+        start = content.find(old)
+        if start == -1:
+            return content
+        end = start + len(old)
+        updated = content[:start] + new + content[end:]
+        if not self._plain_breaks:
+            self._reset(updated)
+            return updated
+
+        # Widen the span to whole lines; the line after it is included since
+        # the replacement may join onto it.
+        region_start = content.rfind("\n", 0, start) + 1
+        region_end = content.find("\n", end) + 1 or len(content)
+        first_line = content.count("\n", 0, region_start)
+        old_line_count = content.count("\n", region_start, region_end)
+        if region_start < region_end == len(content) and not content.endswith("\n"):
+            old_line_count += 1  # final line without a terminator
+
+        region = updated[region_start : region_end + len(new) - len(old)]
+        if region and not has_plain_line_breaks(region):
+            self._reset(updated)
+            return updated
+        new_lines = region.splitlines(keepends=True)
+
+        span = slice(first_line, first_line + old_line_count)
+        self.content = updated
+        self.lines[span] = new_lines
+        if self._stripped is not None:
+            new_stripped = [line.strip() for line in new_lines]
+            self._stripped[span] = new_stripped
+            if self._hashes is not None:
+                self._hashes[span] = [
+                    hash(line) % LINE_HASH_MODULUS for line in new_stripped
+                ]
+        return updated
+
+
+def has_plain_line_breaks(text: str) -> bool:
+    """True if `text` only breaks lines with `\\n` or `\\r\\n`."""
+    if "\r" in text.replace("\r\n", ""):
+        return False
+    expected = text.count("\n") + (0 if text.endswith("\n") else 1)
+    return len(text.splitlines()) == expected
@@ -0,0 +1,70 @@
+"""
+In-memory cache of EDIT match results shared within a turn.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+
+MatchResult = Tuple[str, float, bool, int]
+
+
+class EditMatchCache:
+    """
+    Memoises `find_best_match` results by (file content hash, FIND block,
+    threshold).
+
+    Validation, the change set preview, the TUI preview and the file write
+    all match the same blocks against the same content, so only the first
+    of them pays for the fuzzy cascade. Results are grouped per content
+    hash: once a file changes its old hash is never looked up again and
+    its entries age out, least recently used first, after
+    `max_files` other contents. `clear()` drops everything at the start of
+    a turn.
+    """
+
+    DEFAULT_MAX_FILES = 32
+
+    def __init__(self, max_files: int = DEFAULT_MAX_FILES):
+        self._max_files = max_files
+        self._entries: "OrderedDict[str, Dict[Tuple[str, float], MatchResult]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        file_content: str,
+        find_block: str,
+        threshold: float,
+        compute: Callable[[], MatchResult],
+    ) -> MatchResult:
+        """Returns the cached result, calling `compute` on a miss."""
+        content_key = _digest(file_content)
+        key = (find_block, threshold)
+        with self._lock:
+            bucket = self._entries.get(content_key)
+            if bucket is not None and key in bucket:
+                self._entries.move_to_end(content_key)
+                return bucket[key]
+
+        result = compute()
+        with self._lock:
+            bucket = self._entries.setdefault(content_key, {})
+            bucket[key] = result
+            self._entries.move_to_end(content_key)
+            while len(self._entries) > self._max_files:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drops all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _digest(text: str) -> str:
+    """Hashes file content for use as a cache key."""
+    data = text.encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
@@ -3,34 +3,84 @@ Heuristic matching logic for the EDIT action validator.
 """
 
 import difflib
+import heapq
 import os
 import time
-from typing import List, Set
+from typing import Dict, List, Optional, Set
 
 from teddy_executor.core.domain.models.plan import DEFAULT_SIMILARITY_THRESHOLD
+from teddy_executor.core.services.validation_rules.edit_line_index import LineIndex
+from teddy_executor.core.services.validation_rules.edit_match_cache import (
+    EditMatchCache,
+)
+from teddy_executor.core.services.validation_rules.edit_matcher_exact import (
+    find_exact_match,
+)
 from teddy_executor.core.services.validation_rules.edit_matcher_heuristics import (
     gather_candidate_starts,
 )
+from teddy_executor.core.services.validation_rules.edit_similarity import (
+    ratio_upper_bound,
+    window_line_matches,
+)
 
 # Performance Heuristic Constants
 LARGE_BLOCK_LINE_LIMIT = 20
-SUB_SAMPLE_RATIO_THRESHOLD = 0.7
-SUB_SAMPLE_PASS_THRESHOLD = 0.7
+LINE_MATCH_PASS_THRESHOLD = 0.7
 CANDIDATE_EVALUATION_CAP = 5
 
+# Shared by every caller in the process; cleared at the start of each turn.
+_MATCH_CACHE = EditMatchCache()
+
+
+def clear_match_cache() -> None:
+    """Drops the match results cached during the previous turn."""
+    _MATCH_CACHE.clear()
+
 
 def find_best_match(
     file_content: str,
     find_block: str,
     threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    *,
+    line_index: Optional[LineIndex] = None,
 ) -> tuple[str, float, bool, int]:
     """
     Finds the most similar block of text in the file content.
 
+    Blocks found verbatim (or re-indented) are resolved by the exact fast
+    path; the fuzzy cascade only runs when that fails. Results are cached
+    per content hash, so repeated lookups within a turn are free. Callers
+    editing the same text repeatedly can pass its `LineIndex` to avoid
+    re-splitting it; an index of other content is ignored.
+
     Returns:
         tuple[str, float, bool, int]: (best_match_string, best_score, is_ambiguous, offset)
     """
-    file_lines = file_content.splitlines(keepends=True)
+    return _MATCH_CACHE.get_or_compute(
+        file_content,
+        find_block,
+        threshold,
+        lambda: _find_best_match_uncached(
+            file_content, find_block, threshold, line_index
+        ),
+    )
+
+
+def _find_best_match_uncached(
+    file_content: str,
+    find_block: str,
+    threshold: float,
+    line_index: Optional[LineIndex] = None,
+) -> tuple[str, float, bool, int]:
+    """Runs the exact fast path, then the fuzzy cascade."""
+    if line_index is None or line_index.content is not file_content:
+        line_index = LineIndex(file_content)
+    exact_match = find_exact_match(file_content, find_block, line_index)
+    if exact_match is not None:
+        return exact_match
+
+    file_lines = line_index.lines
     find_lines = find_block.splitlines(keepends=True)
     num_find_lines = len(find_lines)
 
@@ -43,9 +93,9 @@ def find_best_match(
         score = matcher.ratio()
         return "".join(file_lines), round(score, 2), False, 0
 
-    candidate_starts = gather_candidate_starts(file_lines, find_lines, threshold)
+    candidate_starts = gather_candidate_starts(line_index, find_lines, threshold)
     best_match_lines, score, is_ambiguous, offset = _evaluate_candidates(
-        file_lines, find_lines, candidate_starts, find_block
+        line_index, find_lines, candidate_starts, find_block
     )
 
     return "".join(best_match_lines), round(score, 2), is_ambiguous, offset
@@ -90,26 +140,29 @@ def find_best_match_and_diff(
 
 
 def _evaluate_candidates(
-    file_lines: List[str],
+    line_index: LineIndex,
     find_lines: List[str],
     candidate_starts: Set[int],
     find_block: str,
 ) -> tuple[List[str], float, bool, int]:
-    """Evaluates candidates using difflib ratio, with sub-sampling and priority capping."""
+    """Evaluates candidates using difflib ratio, with line-match filtering and priority capping."""
+    file_lines = line_index.lines
     num_find_lines = len(find_lines)
     scored_candidates = []
 
-    for start in candidate_starts:
-        window = file_lines[start : start + num_find_lines]
-        if num_find_lines > LARGE_BLOCK_LINE_LIMIT:
-            score = _calculate_sub_sample_score(window, find_lines)
-            if score >= SUB_SAMPLE_PASS_THRESHOLD:
+    if num_find_lines > LARGE_BLOCK_LINE_LIMIT:
+        line_matches = _count_line_matches(
+            line_index.stripped, find_lines, candidate_starts
+        )
+        for start in candidate_starts:
+            score = line_matches[start] / num_find_lines
+            if score >= LINE_MATCH_PASS_THRESHOLD:
+                window = file_lines[start : start + num_find_lines]
                 scored_candidates.append((score, window))
-        else:
-            window_str = "".join(window)
-            matcher = difflib.SequenceMatcher(None, window_str, find_block)
-            score = matcher.ratio()
-            scored_candidates.append((score, window))
+    else:
+        scored_candidates = _score_top_candidates(
+            file_lines, num_find_lines, candidate_starts, find_block
+        )
 
     # Sort by score descending and cap evaluation
     scored_candidates.sort(key=lambda x: x[0], reverse=True)
@@ -124,6 +177,59 @@ def _evaluate_candidates(
     )
 
 
+def _count_line_matches(
+    stripped_lines: List[str], find_lines: List[str], candidate_starts: Set[int]
+) -> Dict[int, int] | List[int]:
+    """
+    Counts the stripped lines each candidate window shares with the FIND
+    block. A few candidates are compared directly; many (e.g. the exhaustive
+    fallback) are scored together in one pass over the file.
+    """
+    num_find_lines = len(find_lines)
+    if len(candidate_starts) * num_find_lines > len(stripped_lines):
+        return window_line_matches(stripped_lines, find_lines)
+    stripped_find = [line.strip() for line in find_lines]
+    return {
+        start: sum(
+            file_line == find_line
+            for file_line, find_line in zip(
+                stripped_lines[start : start + num_find_lines], stripped_find
+            )
+        )
+        for start in candidate_starts
+    }
+
+
+def _score_top_candidates(
+    file_lines: List[str],
+    num_find_lines: int,
+    candidate_starts: Set[int],
+    find_block: str,
+) -> List[tuple[float, List[str]]]:
+    """
+    Scores candidates with difflib ratio, skipping those whose bit-parallel
+    upper bound is already below the current top-N cut-off. Skipped windows
+    could never reach the top N, so the selection is unchanged.
+    """
+    scored_candidates = []
+    top_scores: List[float] = []  # min-heap of the best N scores so far
+    for start in candidate_starts:
+        window = file_lines[start : start + num_find_lines]
+        window_str = "".join(window)
+        if len(top_scores) == CANDIDATE_EVALUATION_CAP:
+            cutoff = top_scores[0]
+            if ratio_upper_bound(window_str, find_block, cutoff) < cutoff:
+                continue
+        matcher = difflib.SequenceMatcher(None, window_str, find_block)
+        score = matcher.ratio()
+        scored_candidates.append((score, window))
+        if len(top_scores) < CANDIDATE_EVALUATION_CAP:
+            heapq.heappush(top_scores, score)
+        elif score > top_scores[0]:
+            heapq.heapreplace(top_scores, score)
+    return scored_candidates
+
+
 def _refine_and_select_best(
     candidates: List[tuple[float, List[str]]],
     find_lines: List[str],
@@ -225,23 +331,3 @@ def _apply_substring_boost(
                 is_ambiguous = True
 
     return match_lines, ratio, is_ambiguous
-
-
-def _calculate_sub_sample_score(window: List[str], find_lines: List[str]) -> float:
-    """
-    Calculates a lightning-fast similarity score for large blocks.
-    Uses simple string equality on a sub-sample of lines to avoid the
-    overhead of difflib.SequenceMatcher.quick_ratio() during the filter phase.
-    """
-    num_find_lines = len(find_lines)
-    sub_sample_matches = 0
-    total_checks = 0
-    # Check up to 10 representative lines distributed across the block.
-    step = max(1, num_find_lines // 10)
-    for k in range(0, num_find_lines, step):
-        total_checks += 1
-        # Simple equality is O(N) where N is line length, much faster than quick_ratio
-        if window[k].strip() == find_lines[k].strip():
-            sub_sample_matches += 1
-
-    return sub_sample_matches / total_checks
@@ -0,0 +1,122 @@
+"""
+Exact-match fast path for the EDIT action matcher.
+"""
+
+from typing import List, Optional
+
+from teddy_executor.core.services.validation_rules.edit_line_index import (
+    LINE_HASH_MODULUS,
+    LineIndex,
+    has_plain_line_breaks,
+)
+
+# Polynomial rolling hash over the per-line hashes.
+_HASH_BASE = 1_000_003
+
+
+def find_exact_match(
+    file_content: str, find_block: str, line_index: Optional[LineIndex] = None
+) -> Optional[tuple[str, float, bool, int]]:
+    """
+    Resolves FIND blocks that occur in the file verbatim or with only
+    whitespace and constant indentation changes, without any fuzzy scoring.
+
+    Tier 1 is a direct substring search: a line-aligned occurrence whose
+    longest line appears nowhere else is unique. Tier 2 finds every window
+    of whitespace-normalised lines with a rolling hash and accepts a single
+    hit. Returns the same tuple as `find_best_match`, or None when the fuzzy
+    cascade is needed (no match, or several candidate occurrences).
+    `line_index`, if given, must index `file_content`.
+    """
+    find_lines = find_block.splitlines(keepends=True)
+    anchor = max((line.strip() for line in find_lines), key=len, default="")
+    if not anchor:
+        return None
+
+    if has_plain_line_breaks(find_block):
+        match = _find_unique_verbatim(file_content, find_block, anchor)
+        if match is not None:
+            return match, 1.0, False, 0
+
+    index = line_index or LineIndex(file_content)
+    file_lines = index.lines
+    starts = _find_normalized_window_starts(index.line_hashes, find_lines)
+    matches = []
+    for start in starts:
+        window = file_lines[start : start + len(find_lines)]
+        offset = _constant_indent_offset(window, find_lines)
+        if offset is not None:
+            matches.append(("".join(window), offset))
+    # Repeated blocks are left to the fuzzy cascade, which ranks the copies
+    # and reports the ambiguity.
+    if len(matches) != 1:
+        return None
+    match, offset = matches[0]
+    return match, 1.0, False, offset
+
+
+def _find_unique_verbatim(
+    file_content: str, find_block: str, anchor: str
+) -> Optional[str]:
+    """
+    Returns the full lines spanned by the only occurrence of `find_block`,
+    or None if it is missing, not line-aligned or possibly repeated.
+    """
+    if file_content.count(anchor) != 1:
+        return None
+    start = file_content.find(find_block)
+    if start == -1 or (start > 0 and file_content[start - 1] != "\n"):
+        return None
+
+    end = start + len(find_block)
+    if not find_block.endswith("\n") and end < len(file_content):
+        if file_content.startswith("\r\n", end):
+            end += 2
+        elif file_content[end] == "\n":
+            end += 1
+        else:
+            return None
+    return file_content[start:end]
+
+
+def _find_normalized_window_starts(
+    line_hashes: List[int], find_lines: List[str]
+) -> List[int]:
+    """
+    Returns the starts of the windows whose stripped lines hash like the
+    stripped FIND lines, using a rolling hash over the per-line hashes.
+    """
+    size = len(find_lines)
+    if size > len(line_hashes):
+        return []
+    target = 0
+    for line in find_lines:
+        line_hash = hash(line.strip()) % LINE_HASH_MODULUS
+        target = (target * _HASH_BASE + line_hash) % LINE_HASH_MODULUS
+    top = pow(_HASH_BASE, size - 1, LINE_HASH_MODULUS)
+
+    starts = []
+    rolling = 0
+    for i, line_hash in enumerate(line_hashes):
+        if i >= size:
+            rolling = (rolling - line_hashes[i - size] * top) % LINE_HASH_MODULUS
+        rolling = (rolling * _HASH_BASE + line_hash) % LINE_HASH_MODULUS
+        if i >= size - 1 and rolling == target:
+            starts.append(i - size + 1)
+    return starts
+
+
+def _constant_indent_offset(window: List[str], find_lines: List[str]) -> Optional[int]:
+    """
+    Returns the indentation offset if the window equals the FIND lines up to
+    surrounding whitespace and a constant indentation, otherwise None.
+    """
+    offsets = set()
+    for w_line, f_line in zip(window, find_lines):
+        w_line, f_line = w_line.rstrip(), f_line.rstrip()
+        w_stripped, f_stripped = w_line.lstrip(), f_line.lstrip()
+        if w_stripped != f_stripped:
+            return None
+        if w_stripped:
+            offsets.add(len(w_line) - len(w_stripped) - (len(f_line) - len(f_stripped)))
+    return offsets.pop() if len(offsets) == 1 else None
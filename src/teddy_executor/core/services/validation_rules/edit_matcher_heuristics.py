@@ -3,23 +3,25 @@ Tiered heuristic search for candidate window start positions in EditMatcher.
 """
 
 import difflib
-from collections import defaultdict
 from typing import List, Set
 
+from teddy_executor.core.services.validation_rules.edit_line_index import LineIndex
+
 
 def gather_candidate_starts(
-    file_lines: List[str], find_lines: List[str], threshold: float
+    line_index: LineIndex, find_lines: List[str], threshold: float
 ) -> Set[int]:
     """Orchestrates tiered heuristic search for candidate window start positions."""
+    file_lines = line_index.lines
     num_find_lines = len(find_lines)
 
     # Tier 1: Exact Priority Anchors
-    candidate_starts = _find_starts_by_anchors(file_lines, find_lines)
+    candidate_starts = _find_starts_by_anchors(line_index, find_lines)
 
     # Tier 2: Incremental Fuzzy Cascade (Fallback)
     if not candidate_starts:
         candidate_starts = _find_starts_by_fuzzy_cascade(
-            file_lines, num_find_lines, find_lines[0], threshold
+            line_index.stripped, num_find_lines, find_lines[0], threshold
         )
 
     # Tier 3: Substring Fallback (For single-word or intra-line matches)
@@ -36,33 +38,27 @@ def gather_candidate_starts(
     return candidate_starts
 
 
-def _find_starts_by_anchors(file_lines: List[str], find_lines: List[str]) -> Set[int]:
+def _find_starts_by_anchors(line_index: LineIndex, find_lines: List[str]) -> Set[int]:
     """Tier 1: Find candidate windows by matching the longest unique 'anchor' lines."""
     num_find_lines = len(find_lines)
+    num_file_lines = len(line_index.lines)
     priority_lines = sorted(
         [(line.strip(), i) for i, line in enumerate(find_lines) if line.strip()],
         key=lambda x: len(x[0]),
         reverse=True,
     )[:5]
 
-    file_line_map = defaultdict(list)
-    for i, line in enumerate(file_lines):
-        trimmed = line.strip()
-        if trimmed:
-            file_line_map[trimmed].append(i)
-
     candidate_starts: Set[int] = set()
     for trimmed, find_idx in priority_lines:
-        if trimmed in file_line_map:
-            for file_idx in file_line_map[trimmed]:
-                start = file_idx - find_idx
-                if 0 <= start <= len(file_lines) - num_find_lines:
-                    candidate_starts.add(start)
+        for file_idx in line_index.positions(trimmed):
+            start = file_idx - find_idx
+            if 0 <= start <= num_file_lines - num_find_lines:
+                candidate_starts.add(start)
     return candidate_starts
 
 
 def _find_starts_by_fuzzy_cascade(
-    file_lines: List[str],
+    stripped_lines: List[str],
     num_find_lines: int,
     first_find_line_raw: str,
     threshold: float,
@@ -73,12 +69,13 @@ def _find_starts_by_fuzzy_cascade(
     """
     candidate_starts: Set[int] = set()
     first_find_line = first_find_line_raw.strip()
-    for i, f_line in enumerate(file_lines):
-        f_line_stripped = f_line.strip()
+    # seq2 is indexed once and reused; only seq1 changes per file line.
+    matcher = difflib.SequenceMatcher(None, "", first_find_line)
+    for i, f_line_stripped in enumerate(stripped_lines):
+        matcher.set_seq1(f_line_stripped)
         # Pre-filter with real_quick_ratio which is O(N+M) and very fast
-        matcher = difflib.SequenceMatcher(None, f_line_stripped, first_find_line)
         if matcher.real_quick_ratio() >= threshold:
             if matcher.quick_ratio() >= threshold:
-                if 0 <= i <= len(file_lines) - num_find_lines:
+                if 0 <= i <= len(stripped_lines) - num_find_lines:
                     candidate_starts.add(i)
     return candidate_starts
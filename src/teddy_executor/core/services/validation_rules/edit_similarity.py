@@ -0,0 +1,83 @@
+"""
+Fast similarity scoring for the EDIT matcher.
+"""
+
+from collections import Counter
+from typing import Dict, Hashable, List, Sequence
+
+
+def lcs_length(a: Sequence[Hashable], b: Sequence[Hashable]) -> int:
+    """
+    Returns the length of the longest common subsequence of `a` and `b`.
+
+    Uses the bit-parallel algorithm of Allison & Dix / Hyyrö (the indel
+    variant of Myers' Levenshtein algorithm): each symbol of `b` updates a
+    bit vector over all positions of `a` with a few big-integer operations,
+    so the cost is O(len(b) * len(a) / word size) instead of a quadratic
+    dynamic programme. Works on characters or on per-line hashes alike.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return 0
+    match_masks: Dict[Hashable, int] = {}
+    for i, symbol in enumerate(a):
+        match_masks[symbol] = match_masks.get(symbol, 0) | (1 << i)
+
+    mask = (1 << len(a)) - 1
+    vector = mask
+    for symbol in b:
+        matches = vector & match_masks.get(symbol, 0)
+        vector = ((vector + matches) | (vector - matches)) & mask
+    return len(a) - vector.bit_count()
+
+
+def ratio_upper_bound(
+    a: Sequence[Hashable], b: Sequence[Hashable], cutoff: float = 0.0
+) -> float:
+    """
+    Returns an upper bound of `difflib.SequenceMatcher(None, a, b).ratio()`.
+
+    difflib's matching blocks form a common subsequence, so the indel
+    similarity `2 * LCS / (len(a) + len(b))` is never below its ratio. The
+    bound is tightened in stages (lengths, symbol counts, then the exact
+    LCS) and returned as soon as it drops below `cutoff`.
+    """
+    total = len(a) + len(b)
+    if not total:
+        return 1.0
+    bound = 2.0 * min(len(a), len(b)) / total
+    if bound < cutoff:
+        return bound
+    bound = 2.0 * sum((Counter(a) & Counter(b)).values()) / total
+    if bound < cutoff:
+        return bound
+    return 2.0 * lcs_length(a, b) / total
+
+
+def window_line_matches(
+    file_lines: Sequence[str], find_lines: Sequence[str]
+) -> List[int]:
+    """
+    Returns, for every window start in `file_lines`, how many lines of the
+    window equal the aligned FIND line once stripped.
+
+    Instead of comparing each window line by line, every file line is
+    paired with the FIND positions holding the same stripped text and
+    credits the window start on that diagonal. All windows are scored in a
+    single pass whose cost is the number of equal line pairs.
+    """
+    num_starts = len(file_lines) - len(find_lines) + 1
+    if num_starts <= 0 or not find_lines:
+        return []
+    positions: Dict[str, List[int]] = {}
+    for index, line in enumerate(find_lines):
+        positions.setdefault(line.strip(), []).append(index)
+
+    counts = [0] * num_starts
+    for file_index, line in enumerate(file_lines):
+        for find_index in positions.get(line.strip(), ()):
+            start = file_index - find_index
+            if 0 <= start < num_starts:
+                counts[start] += 1
+    return counts
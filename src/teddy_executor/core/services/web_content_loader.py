@@ -0,0 +1,113 @@
+import collections
+import concurrent.futures
+import logging
+import time
+from typing import Deque, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+from teddy_executor.core.ports.outbound.web_content_cache import IWebContentCache
+from teddy_executor.core.ports.outbound.web_scraper import WebScraper as IWebScraper
+
+logger = logging.getLogger(__name__)
+
+
+def load_web_content(
+    web_scraper: IWebScraper, web_cache: Optional[IWebContentCache], url: str
+) -> str:
+    """
+    Returns the content of `url`, going through the shared web content cache.
+
+    Fresh entries are served without any network access. Expired entries
+    with an ETag or Last-Modified validator are revalidated with a
+    conditional request and renewed on a 304. Everything else is fetched
+    again; if that fetch fails, an expired entry is served rather than
+    nothing. Failed fetches are never cached. Without a cache, this is a
+    plain `get_content` call.
+    """
+    cached = web_cache.get(url) if web_cache is not None else None
+    if cached is not None and cached.is_fresh:
+        return cached.content
+
+    if web_cache is not None and cached is not None and cached.can_revalidate:
+        if web_scraper.is_unchanged(url, cached.etag, cached.last_modified):
+            web_cache.renew(url)
+            return cached.content
+
+    try:
+        content = web_scraper.get_content(url=url)
+    except Exception:
+        if cached is None:
+            raise
+        logger.debug("Refetch of %s failed, serving the expired copy", url)
+        return cached.content
+
+    if web_cache is not None:
+        validators = web_scraper.get_validators(url) or {}
+        web_cache.put(
+            url,
+            content,
+            etag=validators.get("etag"),
+            last_modified=validators.get("last_modified"),
+        )
+    return content
+
+
+def _group_by_host(urls: Sequence[str]) -> Dict[str, Deque[str]]:
+    """Groups URLs into per-host queues, keeping their relative order."""
+    queues: Dict[str, Deque[str]] = {}
+    for url in dict.fromkeys(urls):
+        queues.setdefault(urlsplit(url).netloc.lower(), collections.deque()).append(url)
+    return queues
+
+
+def load_web_contents(  # noqa: PLR0913
+    web_scraper: IWebScraper,
+    web_cache: Optional[IWebContentCache],
+    urls: Sequence[str],
+    *,
+    max_workers: int,
+    per_host: int,
+    deadline: Optional[float] = None,
+) -> Dict[str, Optional[str]]:
+    """
+    Loads many URLs concurrently via `load_web_content`.
+
+    Each host gets up to `per_host` lanes that drain its queue one URL at a
+    time, and all lanes share a pool of `max_workers` threads. Lanes are
+    submitted round-robin across hosts, so a single slow host cannot hold
+    every worker. URLs that fail, or are not finished within `deadline`
+    seconds, map to None. Late fetches keep running in the background (and
+    still fill the cache) but are not waited for.
+    """
+    contents: Dict[str, Optional[str]] = {url: None for url in urls}
+    if not urls:
+        return contents
+
+    queues = _group_by_host(urls)
+    expires_at = None if deadline is None else time.monotonic() + deadline
+
+    def run_lane(queue: Deque[str]) -> None:
+        while expires_at is None or time.monotonic() < expires_at:
+            try:
+                url = queue.popleft()
+            except IndexError:
+                return
+            try:
+                contents[url] = load_web_content(web_scraper, web_cache, url)
+            except Exception as e:
+                logger.debug("Failed to fetch %s: %s", url, e)
+
+    lanes: List[Deque[str]] = []
+    for round_index in range(max(1, per_host)):
+        lanes.extend(q for q in queues.values() if len(q) > round_index)
+
+    pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(lanes)))
+    )
+    futures = [pool.submit(run_lane, queue) for queue in lanes]
+    _, pending = concurrent.futures.wait(futures, timeout=deadline)
+    pool.shutdown(wait=False, cancel_futures=True)
+    if pending:
+        logger.debug("URL fetch deadline of %ss exceeded", deadline)
+
+    # Snapshot the results so that late fetches cannot change them.
+    return dict(contents)
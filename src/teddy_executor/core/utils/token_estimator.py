@@ -0,0 +1,45 @@
+import math
+from typing import Optional
+
+from teddy_executor.core.utils.markdown import get_language_from_path
+
+# Average UTF-8 bytes per token by language, measured with the cl100k_base
+# and o200k_base encodings (which agree within a few percent).
+BYTES_PER_TOKEN = {
+    "python": 4.5,
+    "markdown": 4.3,
+    "xml": 4.2,
+    "javascript": 3.6,
+    "typescript": 3.6,
+    "jsx": 3.4,
+    "tsx": 3.4,
+    "shell": 3.6,
+    "yaml": 3.5,
+    "html": 3.1,
+    "css": 3.1,
+    "toml": 3.0,
+    "json": 2.9,
+    "lock": 2.1,
+    "svg": 1.7,
+}
+DEFAULT_BYTES_PER_TOKEN = 3.8
+
+
+def estimate_token_count(text: str, path: Optional[str] = None) -> int:
+    """
+    Estimates the token count of `text` from its UTF-8 size and a
+    calibrated bytes-per-token ratio for the language of `path`.
+
+    This is much cheaper than a BPE pass and needs no encoding files, but
+    is only accurate to roughly ±15%. Use it for UI telemetry and pruning
+    heuristics, never where billing accuracy matters.
+    """
+    if not text:
+        return 0
+    size = len(text) if text.isascii() else len(text.encode("utf-8", "replace"))
+    ratio = (
+        BYTES_PER_TOKEN.get(get_language_from_path(path), DEFAULT_BYTES_PER_TOKEN)
+        if path
+        else DEFAULT_BYTES_PER_TOKEN
+    )
+    return math.ceil(size / ratio)
@@ -1,6 +1,16 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 import punq
 
+if TYPE_CHECKING:
+    from teddy_executor.adapters.outbound.file_sniffer import FileSniffer
+    from teddy_executor.adapters.outbound.tiktoken_encoding_store import (
+        TiktokenEncodingStore,
+    )
+    from teddy_executor.adapters.outbound.token_count_cache import TokenCountCache
+    from teddy_executor.adapters.outbound.web_content_cache import WebContentCache
+    from teddy_executor.core.ports.outbound import IConfigService
+
 
 def register_infrastructure(container: punq.Container) -> None:
     """Registers core OS and infrastructure adapters."""
@@ -14,6 +24,7 @@ def register_infrastructure(container: punq.Container) -> None:
         ISystemEnvironment,
         ITimeService,
         IUserInteractor,
+        IWebContentCache,
         IWebScraper,
         IWebSearcher,
     )
@@ -23,11 +34,13 @@ def register_infrastructure(container: punq.Container) -> None:
     from teddy_executor.adapters.outbound.litellm_adapter import (
         LiteLLMAdapter,
         IOpenRouterHydrator,
+        ITokenCountCache,
     )
     from teddy_executor.adapters.outbound.openrouter_hydrator import (
         OpenRouterMetadataHydrator,
     )
     from teddy_executor.adapters.outbound.local_file_system_adapter import (
+        IFileSniffer,
         LocalFileSystemAdapter,
     )
     from teddy_executor.adapters.outbound.local_repo_tree_generator import (
@@ -57,7 +70,7 @@ def register_infrastructure(container: punq.Container) -> None:
     container.register(
         IEnvironmentInspector,
         factory=lambda: SystemEnvironmentInspector(),
-        scope=punq.Scope.transient,
+        scope=punq.Scope.singleton,
     )
     container.register(
         ITimeService,
@@ -83,6 +96,11 @@ def register_infrastructure(container: punq.Container) -> None:
 
     from teddy_executor.core.ports.inbound.edit_simulator import IEditSimulator
 
+    container.register(
+        IFileSniffer,
+        factory=lambda: _create_file_sniffer(container.resolve(IConfigService)),
+        scope=punq.Scope.singleton,
+    )
     container.register(
         IFileSystemManager,
         factory=lambda: LocalFileSystemAdapter(
@@ -90,6 +108,13 @@ def register_infrastructure(container: punq.Container) -> None:
             max_read_lines=container.resolve(IConfigService).get_setting(
                 "read.max_lines"
             ),
+            max_read_bytes=container.resolve(IConfigService).get_setting(
+                "read.max_bytes"
+            ),
+            file_sniffer=container.resolve(IFileSniffer),
+            read_workers=container.resolve(IConfigService).get_setting(
+                "context.read_workers"
+            ),
         ),
         scope=punq.Scope.transient,
     )
@@ -100,6 +125,12 @@ def register_infrastructure(container: punq.Container) -> None:
         scope=punq.Scope.transient,
     )
 
+    container.register(
+        IWebContentCache,
+        factory=lambda: _create_web_content_cache(container.resolve(IConfigService)),
+        scope=punq.Scope.singleton,
+    )
+
     container.register(
         IUserInteractor,
         factory=lambda: ConsoleInteractorAdapter(
@@ -124,11 +155,18 @@ def register_infrastructure(container: punq.Container) -> None:
         factory=lambda: OpenRouterMetadataHydrator(),
         scope=punq.Scope.singleton,
     )
+    container.register(
+        ITokenCountCache,
+        factory=lambda: _create_token_count_cache(container.resolve(IConfigService)),
+        scope=punq.Scope.singleton,
+    )
     container.register(
         ILlmClient,
         factory=lambda: LiteLLMAdapter(
             config_service=container.resolve(IConfigService),
             hydrator=container.resolve(IOpenRouterHydrator),
+            token_cache=container.resolve(ITokenCountCache),
+            encoding_store=_create_encoding_store(container.resolve(IConfigService)),
         ),
         scope=punq.Scope.transient,
     )
@@ -145,3 +183,78 @@ def register_infrastructure(container: punq.Container) -> None:
         ),
         scope=punq.Scope.transient,
     )
+
+
+def _create_token_count_cache(config_service: IConfigService) -> TokenCountCache:
+    """Anchors the token count cache next to the project's config file."""
+    import os
+    from teddy_executor.adapters.outbound.token_count_cache import TokenCountCache
+
+    config_dir = os.path.dirname(str(config_service.get_config_path()))
+    return TokenCountCache(
+        cache_path=(
+            os.path.join(config_dir, TokenCountCache.CACHE_FILENAME)
+            if config_dir
+            else None
+        ),
+        max_entries=int(
+            config_service.get_setting("context.token_cache_max_entries", 20000)
+            or 20000
+        ),
+    )
+
+
+def _create_encoding_store(config_service: IConfigService) -> TiktokenEncodingStore:
+    """Anchors the tokenizer encoding store next to the project's config file."""
+    import os
+    from teddy_executor.adapters.outbound.tiktoken_encoding_store import (
+        TiktokenEncodingStore,
+    )
+
+    config_dir = os.path.dirname(str(config_service.get_config_path()))
+    return TiktokenEncodingStore(
+        cache_dir=(
+            os.path.join(config_dir, TiktokenEncodingStore.CACHE_DIRNAME)
+            if config_dir
+            else None
+        )
+    )
+
+
+def _create_file_sniffer(config_service: IConfigService) -> FileSniffer:
+    """Builds the process-wide file sniffer with the configured size cap."""
+    from teddy_executor.adapters.outbound.file_sniffer import FileSniffer
+
+    return FileSniffer(
+        max_file_bytes=config_service.get_setting(
+            "context.max_file_bytes", FileSniffer.DEFAULT_MAX_FILE_BYTES
+        )
+    )
+
+
+def _create_web_content_cache(config_service: IConfigService) -> WebContentCache:
+    """Anchors the shared web content cache next to the project's config file."""
+    import os
+    from teddy_executor.adapters.outbound.web_content_cache import WebContentCache
+
+    config_dir = os.path.dirname(str(config_service.get_config_path()))
+    return WebContentCache(
+        # Without a config directory the cache is kept in memory only.
+        cache_dir=(
+            os.path.join(config_dir, WebContentCache.CACHE_DIRNAME)
+            if config_dir
+            else None
+        ),
+        ttl_seconds=float(
+            config_service.get_setting(
+                "web_cache.ttl_seconds", WebContentCache.DEFAULT_TTL_SECONDS
+            )
+            or WebContentCache.DEFAULT_TTL_SECONDS
+        ),
+        max_bytes=int(
+            config_service.get_setting(
+                "web_cache.max_bytes", WebContentCache.DEFAULT_MAX_BYTES
+            )
+            or WebContentCache.DEFAULT_MAX_BYTES
+        ),
+    )
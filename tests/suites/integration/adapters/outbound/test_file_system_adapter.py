@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 import pytest
 
@@ -160,6 +161,16 @@ def test_write_file(adapter, observer, tmp_path: Path):
     observer.assert_file_content_equals(file_path, "second content")
 
 
+def test_write_file_parts_streams_and_overwrites(adapter, observer, tmp_path: Path):
+    file_path = tmp_path / "input.md"
+    file_path.write_text("stale", encoding="utf-8")
+    big_part = "é" * (adapter.WRITE_CHUNK_CHARS * 2 + 5)
+
+    adapter.write_file_parts(str(file_path), iter(["# Header", "\n", big_part]))
+
+    observer.assert_file_content_equals(file_path, f"# Header\n{big_part}")
+
+
 def test_read_files_in_vault(adapter, tmp_path: Path):
     """
     Tests that read_files_in_vault reads content for existing files
@@ -240,3 +251,44 @@ def test_edit_file_handles_leading_newline_in_find_block(
     observer.assert_file_content_equals(
         test_file, "line one\n\n    line two (replaced)\nline three"
     )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_list_directory_recursive_uses_git_listing(adapter, tmp_path: Path):
+    """In a git work tree, nested .gitignore files and deletions are honoured."""
+    import subprocess  # nosec
+
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)  # nosec
+    (tmp_path / "src" / "build").mkdir(parents=True)
+    (tmp_path / "src" / ".gitignore").write_text("build/\n", encoding="utf-8")
+    (tmp_path / "src" / "build" / "out.js").touch()
+    (tmp_path / "src" / "main.py").touch()
+    (tmp_path / "src" / "old.py").touch()
+    subprocess.run(["git", "add", "src"], cwd=tmp_path, check=True)  # nosec
+    (tmp_path / "src" / "old.py").unlink()
+    (tmp_path / "src" / "new.py").touch()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").touch()
+
+    assert adapter.list_directory_recursive("src") == [
+        "src/.gitignore",
+        "src/main.py",
+        "src/new.py",
+    ]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_list_directory_recursive_limits_git_to_the_directory(adapter, tmp_path: Path):
+    """Git lists only the requested directory, taking its name literally."""
+    import subprocess  # nosec
+
+    from teddy_executor.adapters.outbound.filesystem_helpers import git_list_files
+
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)  # nosec
+    for rel_path in ("app/[id]/page.tsx", "app/i/page.tsx", "lib/util.ts"):
+        (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel_path).touch()
+
+    assert git_list_files(tmp_path, "app/[id]") == ["app/[id]/page.tsx"]
+    assert git_list_files(tmp_path, "app") == ["app/[id]/page.tsx", "app/i/page.tsx"]
+    assert adapter.list_directory_recursive("app/[id]") == ["app/[id]/page.tsx"]
@@ -0,0 +1,131 @@
+import shutil
+import subprocess
+
+import pytest
+
+from teddy_executor.adapters.outbound.git_status import (
+    PORCELAIN_V2_COMMAND,
+    SHOW_TOPLEVEL_COMMAND,
+    format_short_status,
+    parse_porcelain_v2,
+    relative_to_cwd,
+)
+from teddy_executor.adapters.outbound.system_environment_inspector import (
+    SystemEnvironmentInspector,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not found")
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=False
+    ).stdout
+
+
+def _assert_matches_git(cwd):
+    status = parse_porcelain_v2(_git(cwd, *PORCELAIN_V2_COMMAND[1:]))
+    toplevel = _git(cwd, *SHOW_TOPLEVEL_COMMAND[1:]).strip()
+    status = relative_to_cwd(status, toplevel, str(cwd))
+    assert format_short_status(status) == _git(cwd, "status", "-s").rstrip()
+
+
+def _init_repo(path):
+    _git(path.parent, "init", "-q", "-b", "main", str(path))
+    _git(path, "config", "user.email", "dev@example.com")
+    _git(path, "config", "user.name", "dev")
+
+
+@pytest.mark.timeout(20)
+def test_rendered_status_matches_git_output(tmp_path):
+    # Arrange
+    repo = tmp_path / "repo"
+    _git(tmp_path, "init", "-q", "-b", "main", str(repo))
+    _git(repo, "config", "user.email", "dev@example.com")
+    _git(repo, "config", "user.name", "dev")
+    (repo / "a.txt").write_text("a\n", encoding="utf-8")
+
+    # Act / Assert
+    _assert_matches_git(repo)  # No commits yet, untracked file
+    _git(repo, "add", "a.txt")
+    _git(repo, "commit", "-q", "-m", "init")
+    _assert_matches_git(repo)  # Clean
+    (repo / "a.txt").write_text("changed\n", encoding="utf-8")
+    (repo / "b.txt").write_text("b\n", encoding="utf-8")
+    _assert_matches_git(repo)  # Unstaged and untracked
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "two")
+    _git(repo, "mv", "b.txt", "c.txt")
+    (repo / "a.txt").unlink()
+    _assert_matches_git(repo)  # Staged rename and unstaged deletion
+
+    clone = tmp_path / "clone"
+    _git(tmp_path, "clone", "-q", str(repo), str(clone))
+    _assert_matches_git(clone)  # Up to date with upstream
+    _git(clone, "reset", "-q", "--hard", "HEAD~1")
+    _assert_matches_git(clone)  # Behind upstream
+
+
+@pytest.mark.timeout(20)
+def test_rendered_status_is_relative_to_a_subdirectory(tmp_path, monkeypatch):
+    # Arrange: a project in a subdirectory of a larger repository
+    repo = tmp_path / "repo"
+    project = repo / "sub"
+    _git(tmp_path, "init", "-q", "-b", "main", str(repo))
+    _git(repo, "config", "user.email", "dev@example.com")
+    _git(repo, "config", "user.name", "dev")
+    project.mkdir()
+    (project / "a.txt").write_text("a\n", encoding="utf-8")
+    (repo / "b.txt").write_text("b\n", encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "init")
+    (project / "a.txt").write_text("changed\n", encoding="utf-8")
+    (repo / "b.txt").write_text("changed\n", encoding="utf-8")
+    _git(repo, "mv", "b.txt", "sub/c.txt")
+    (project / "new").mkdir()
+    (project / "new" / "d.txt").write_text("d\n", encoding="utf-8")
+
+    # Act / Assert
+    _assert_matches_git(project)
+    monkeypatch.chdir(project)
+    inspector = SystemEnvironmentInspector()
+    assert inspector.get_git_status() == _git(project, "status", "-s").rstrip()
+    assert " M a.txt" in inspector.get_git_status().splitlines()
+
+
+@pytest.mark.timeout(20)
+def test_inspector_matches_git_in_a_conflicted_repo(tmp_path, monkeypatch):
+    # Arrange: a merge conflict next to paths git has to quote
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    for name in ("a.txt", "z.txt", "sp ace.txt", "ünï.txt", "old.txt"):
+        (repo / name).write_text(f"{name}\n", encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "init")
+    _git(repo, "checkout", "-q", "-b", "other")
+    (repo / "a.txt").write_text("other\n", encoding="utf-8")
+    _git(repo, "commit", "-q", "-am", "other")
+    _git(repo, "checkout", "-q", "main")
+    (repo / "a.txt").write_text("main\n", encoding="utf-8")
+    _git(repo, "commit", "-q", "-am", "main")
+    _git(repo, "merge", "other")
+    for name in ("z.txt", "sp ace.txt", "ünï.txt"):
+        (repo / name).write_text("changed\n", encoding="utf-8")
+    _git(repo, "mv", "old.txt", "new name.txt")
+    (repo / "new file.txt").write_text("n\n", encoding="utf-8")
+    (repo / 'q"uote.txt').write_text("q\n", encoding="utf-8")
+    monkeypatch.chdir(repo)
+
+    # Act / Assert
+    full = SystemEnvironmentInspector().get_full_git_status()
+    assert full == _git(repo, "status").rstrip()
+    assert '(use "git merge --abort" to abort the merge)' in full
+    short = SystemEnvironmentInspector().get_git_status()
+    assert short == _git(repo, "status", "-s").rstrip()
+    assert short.splitlines()[0] == "UU a.txt"
+    assert ' M "sp ace.txt"' in short.splitlines()
+
+    _git(repo, "config", "core.quotePath", "false")
+    short = SystemEnvironmentInspector().get_git_status()
+    assert short == _git(repo, "status", "-s").rstrip()
+    assert " M ünï.txt" in short.splitlines()
@@ -1,3 +1,4 @@
+import shutil
 import sys
 import pytest
 from pathlib import Path
@@ -109,3 +110,206 @@ def test_tree_generator_handles_circular_symlinks_without_hanging(env, tmp_path)
     assert "circular_link" in tree_output
     # The fix treats symlinks as files, so it shouldn't recurse into 'circular_link/'
     assert "./subdir/circular_link:" not in tree_output
+
+
+def _age_directories(root: Path, seconds: int = 60) -> None:
+    """Backdates every directory mtime so snapshot entries are not considered racy."""
+    import os
+    import time
+
+    old = time.time() - seconds
+    for directory in [root, *[p for p in root.rglob("*") if p.is_dir()]]:
+        os.utime(directory, (old, old))
+
+
+def test_tree_generator_persists_snapshot_and_skips_unchanged_dirs(
+    tmp_path, monkeypatch
+):
+    """Unchanged directories are served from the persisted snapshot."""
+    from teddy_executor.adapters.outbound import filesystem_helpers
+    from teddy_executor.adapters.outbound.local_repo_tree_generator import (
+        LocalRepoTreeGenerator,
+    )
+
+    (tmp_path / ".teddy").mkdir()
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").touch()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").touch()
+    _age_directories(tmp_path)
+
+    first = LocalRepoTreeGenerator(root_dir=str(tmp_path)).generate_tree()
+    assert (tmp_path / ".teddy" / LocalRepoTreeGenerator.SNAPSHOT_FILENAME).is_file()
+
+    # Change a single directory; only that directory should be listed again.
+    (tmp_path / "src" / "new.py").touch()
+    listed: list[str] = []
+    original = filesystem_helpers.list_directory_entries
+
+    def tracking_list(directory, rel_dir, spec):
+        listed.append(rel_dir)
+        return original(directory, rel_dir, spec)
+
+    monkeypatch.setattr(filesystem_helpers, "list_directory_entries", tracking_list)
+    second = LocalRepoTreeGenerator(root_dir=str(tmp_path)).generate_tree()
+
+    assert listed == ["src"]
+    assert "new.py" not in first
+    assert second == first.replace("main.py", "main.py\nnew.py")
+
+
+def test_tree_generator_rescans_when_ignore_rules_change(tmp_path):
+    """A changed .gitignore invalidates the persisted snapshot."""
+    from teddy_executor.adapters.outbound.local_repo_tree_generator import (
+        LocalRepoTreeGenerator,
+    )
+
+    (tmp_path / ".teddy").mkdir()
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.bin").touch()
+    _age_directories(tmp_path)
+    assert "out.bin" in LocalRepoTreeGenerator(str(tmp_path)).generate_tree()
+
+    (tmp_path / ".gitignore").write_text("build/", encoding="utf-8")
+    _age_directories(tmp_path)
+
+    assert "build" not in LocalRepoTreeGenerator(str(tmp_path)).generate_tree()
+
+
+def _git_init(root: Path) -> None:
+    """Initializes a throwaway git repository at root."""
+    import subprocess  # nosec
+
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)  # nosec
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_tree_generator_uses_git_listing_in_git_repos(tmp_path, monkeypatch):
+    """Inside a git work tree the tree is built from git ls-files."""
+    from teddy_executor.adapters.outbound import filesystem_helpers
+    from teddy_executor.adapters.outbound.local_repo_tree_generator import (
+        LocalRepoTreeGenerator,
+    )
+
+    _git_init(tmp_path)
+    (tmp_path / ".gitignore").write_text("node_modules/\n", encoding="utf-8")
+    (tmp_path / ".teddyignore").write_text("secret.txt\n", encoding="utf-8")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").touch()
+    (tmp_path / "src" / "nested").mkdir(parents=True)
+    (tmp_path / "src" / "nested" / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    (tmp_path / "src" / "nested" / "app.py").touch()
+    (tmp_path / "src" / "nested" / "debug.log").touch()
+    (tmp_path / "secret.txt").touch()
+
+    def fail_walk(*args, **kwargs):
+        raise AssertionError("the Python walker should not be used")
+
+    monkeypatch.setattr(filesystem_helpers, "list_directory_entries", fail_walk)
+    tree_output = LocalRepoTreeGenerator(root_dir=str(tmp_path)).generate_tree()
+
+    expected_tree = dedent(
+        """
+        src
+
+        ./src:
+        nested
+
+        ./src/nested:
+        app.py
+        """
+    ).strip()
+    assert tree_output == expected_tree
+
+
+def test_tree_generator_respects_nested_gitignore_files(env, tmp_path):
+    """Nested .gitignore files prune directories relative to their own location."""
+    (tmp_path / "frontend" / "dist").mkdir(parents=True)
+    (tmp_path / "frontend" / ".gitignore").write_text("dist/\n", encoding="utf-8")
+    (tmp_path / "frontend" / "dist" / "bundle.js").touch()
+    (tmp_path / "frontend" / "app.ts").touch()
+    (tmp_path / "dist").mkdir()
+    (tmp_path / "dist" / "release.txt").touch()
+
+    tree_output = env.get_service(IRepoTreeGenerator).generate_tree()
+
+    assert "bundle.js" not in tree_output
+    assert "./frontend/dist:" not in tree_output
+    assert "app.ts" in tree_output
+    assert "release.txt" in tree_output
+
+
+def test_tree_generator_rescans_subtree_when_nested_gitignore_changes(tmp_path):
+    """Editing a nested .gitignore in place invalidates the listings below it."""
+    import os
+
+    from teddy_executor.adapters.outbound.local_repo_tree_generator import (
+        LocalRepoTreeGenerator,
+    )
+
+    (tmp_path / ".teddy").mkdir()
+    (tmp_path / "pkg" / "build").mkdir(parents=True)
+    (tmp_path / "pkg" / "build" / "out.bin").touch()
+    (tmp_path / "pkg" / "build" / "out.txt").touch()
+    ignore_file = tmp_path / "pkg" / ".gitignore"
+    ignore_file.write_text("# nothing yet\n", encoding="utf-8")
+    _age_directories(tmp_path)
+
+    first = LocalRepoTreeGenerator(str(tmp_path)).generate_tree()
+    assert "out.bin" in first
+
+    # Rewriting the file keeps the directory mtimes unchanged.
+    ignore_file.write_text("*.bin\n", encoding="utf-8")
+    newer = ignore_file.stat().st_mtime + 5
+    os.utime(ignore_file, (newer, newer))
+    _age_directories(tmp_path)
+
+    second = LocalRepoTreeGenerator(str(tmp_path)).generate_tree()
+    assert "out.bin" not in second
+    assert "out.txt" in second
+
+
+def test_compact_tree_collapses_chains_and_summarises_overflow(tmp_path):
+    """Verify the compact trie format, its budgets and its expansion rule."""
+    from teddy_executor.adapters.outbound.local_repo_tree_generator import (
+        LocalRepoTreeGenerator,
+    )
+
+    (tmp_path / "src" / "pkg" / "core").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "core" / "app.py").touch()
+    fixtures = tmp_path / "fixtures"
+    (fixtures / "nested").mkdir(parents=True)
+    (fixtures / "nested" / "deep.json").touch()
+    for i in range(4):
+        (fixtures / f"case_{i}.json").touch()
+    (fixtures / "schema.sql").touch()
+    migrations = tmp_path / "migrations"
+    migrations.mkdir()
+    for i in range(5):
+        (migrations / f"{i:04d}_step.sql").touch()
+    (tmp_path / "README.md").touch()
+
+    generator = LocalRepoTreeGenerator(root_dir=str(tmp_path))
+    tree = generator.generate_tree(
+        ["migrations/0004_step.sql"], compact=True, dir_budget=2
+    )
+
+    expected_tree = dedent(
+        """
+        fixtures/
+          nested/
+            deep.json
+          case_0.json
+          ... 3 *.json, 1 *.sql
+        migrations/
+          0000_step.sql
+          0001_step.sql
+          0002_step.sql
+          0003_step.sql
+          0004_step.sql
+        src/pkg/core/
+          app.py
+        README.md
+        """
+    ).strip()
+    assert tree == expected_tree
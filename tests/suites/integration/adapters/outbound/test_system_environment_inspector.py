@@ -53,7 +53,9 @@ def test_get_git_status_returns_concise_output_in_git_repo(monkeypatch):
     """
     expected_output = " M src/main.py\n?? new_file.txt"
     mock_result = POSIXPathMock()
-    mock_result.stdout = expected_output
+    mock_result.stdout = (
+        "1 .M N... 100644 100644 100644 abc abc src/main.py\0? new_file.txt\0"
+    )
     mock_result.returncode = 0
     mock_run = POSIXPathMock(return_value=mock_result)
 
@@ -78,3 +80,39 @@ def test_get_git_status_isolates_stdin(monkeypatch):
     _, kwargs = mock_run.call_args
     assert "stdin" in kwargs, "stdin missing from subprocess.run call"
     assert kwargs["stdin"] == subprocess.DEVNULL, "stdin must be DEVNULL"
+
+
+def test_status_views_are_cached_per_view(monkeypatch, tmp_path):
+    """
+    Verify the short status is rendered from one cached
+    `git status --porcelain=v2 -z` call, and the full status is git's own
+    cached `git status` text.
+    """
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    monkeypatch.chdir(tmp_path)
+    long_text = "On branch main\nYou have unmerged paths.\n"
+    outputs = {
+        "status --porcelain=v2 -z": (
+            "2 R. N... 100644 100644 100644 abc abc R100 new.py\0old.py\0"
+        ),
+        "status": long_text,
+    }
+    mock_run = POSIXPathMock(
+        side_effect=lambda command, **_kwargs: POSIXPathMock(
+            stdout=outputs[" ".join(command[1:])]
+        )
+    )
+    inspector = SystemEnvironmentInspector(run_func=mock_run)
+
+    for _ in range(2):
+        short = inspector.get_git_status()
+        full = inspector.get_full_git_status()
+
+    commands = [c.args[0] for c in mock_run.call_args_list]
+    assert commands == [
+        ["git", "status", "--porcelain=v2", "-z"],
+        ["git", "status"],
+    ]
+    assert short == "R  old.py -> new.py"
+    assert full == long_text.rstrip()
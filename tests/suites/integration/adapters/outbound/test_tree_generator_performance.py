@@ -2,6 +2,7 @@ import os
 import time
 import pytest
 from pathlib import Path
+from typing import Iterator
 from tests.harness.setup.test_environment import TestEnvironment
 from teddy_executor.core.ports.outbound.repo_tree_generator import IRepoTreeGenerator
 
@@ -73,3 +74,87 @@ def test_tree_integrity_with_deep_unignored_file(tmp_path: Path, monkeypatch):
     assert "c" in tree_output
     assert "./a/b/c:" in tree_output
     assert "file.txt" in tree_output
+
+
+def _load_ignore_spec(root_dir: Path):
+    """Loads the ignore rules as a single pathspec, as the previous walker did."""
+    import pathspec
+
+    from teddy_executor.adapters.outbound.filesystem_helpers import DEFAULT_IGNORES
+
+    lines = list(DEFAULT_IGNORES)
+    for name in (".gitignore", ".teddyignore"):
+        ignore_path = root_dir / name
+        if ignore_path.is_file():
+            lines.append(name)
+            lines.extend(ignore_path.read_text(encoding="utf-8").splitlines())
+    return pathspec.PathSpec.from_lines("gitwildmatch", lines)
+
+
+def _previous_walk(root_dir: Path, start_dir: Path, spec) -> Iterator[Path]:
+    """
+    The walker the scandir walker replaced: it also prunes ignored
+    directories, but matches every entry against the full pathspec through
+    `Path.iterdir`, `relative_to` and separate stat calls.
+    """
+    for entry in start_dir.iterdir():
+        rel_path_str = str(entry.relative_to(root_dir)).replace("\\", "/")
+        is_real_dir = entry.is_dir() and not entry.is_symlink()
+        match_path = rel_path_str + "/" if is_real_dir else rel_path_str
+        if spec.match_file(match_path):
+            continue
+        if is_real_dir:
+            yield from _previous_walk(root_dir, entry, spec)
+        else:
+            yield entry
+
+
+def _create_flat_dirs(base: Path, dir_count: int, files_per_dir: int) -> None:
+    """Creates dir_count directories holding files_per_dir empty files each."""
+    for d in range(dir_count):
+        directory = base / f"dir_{d}"
+        directory.mkdir(parents=True)
+        for f in range(files_per_dir):
+            os.close(os.open(directory / f"file_{f}.js", os.O_CREAT | os.O_WRONLY))
+
+
+@pytest.mark.skipif(
+    os.getenv("GITHUB_ACTIONS") == "true",
+    reason="Performance tests are flaky on CI runners due to environment variance",
+)
+@pytest.mark.timeout(120)
+def test_pruning_walker_benchmark_on_200k_entry_tree(tmp_path: Path):
+    """
+    Micro-benchmark: the scandir walker with precompiled matchers must
+    clearly beat the previous pathspec walker over a synthetic tree of
+    ~200k entries (mostly in an ignored node_modules, which both prune).
+    """
+    from teddy_executor.adapters.outbound.filesystem_helpers import (
+        IgnoreEngine,
+        list_files_recursive,
+    )
+
+    # Arrange: 180k ignored files and 19.8k visible files
+    _create_flat_dirs(tmp_path / "node_modules", 1800, 100)
+    _create_flat_dirs(tmp_path / "src", 180, 110)
+    (tmp_path / ".gitignore").write_text("node_modules/\n*.log\n", encoding="utf-8")
+    spec = _load_ignore_spec(tmp_path)
+
+    # Act: best of two runs each
+    walker_duration = baseline_duration = float("inf")
+    for _ in range(2):
+        start_time = time.perf_counter()
+        files = list_files_recursive(tmp_path, IgnoreEngine(tmp_path))
+        walker_duration = min(walker_duration, time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        previous_files = list(_previous_walk(tmp_path, tmp_path, spec))
+        baseline_duration = min(baseline_duration, time.perf_counter() - start_time)
+
+    # Assert
+    assert len(files) == 180 * 110
+    assert len(previous_files) == len(files)
+    assert walker_duration * 4 < baseline_duration, (
+        f"Walker took {walker_duration * 1000:.1f}ms, "
+        f"previous walker {baseline_duration * 1000:.1f}ms"
+    )
@@ -29,3 +29,68 @@ def test_context_service_expands_directories_from_manifest(monkeypatch):
     assert "src/core/models.py" in paths
     assert "README.md" in paths
     assert "my.context" not in paths  # Manifests themselves should be resolved away
+
+
+def test_context_service_expands_globs_and_negations_from_manifest(monkeypatch):
+    # Arrange
+    env = TestEnvironment(monkeypatch).setup().with_real_filesystem()
+    for rel_path in (
+        "src/app.py",
+        "src/legacy/old.py",
+        "src/util/helpers.py",
+        "docs/guide.md",
+        "docs/api/index.md",
+        "notes.txt",
+    ):
+        path = env.workspace / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel_path, encoding="utf-8")
+    (env.workspace / "nested.context").write_text(
+        "notes.txt\n!*.txt\n", encoding="utf-8"
+    )
+    (env.workspace / "my.context").write_text(
+        "src/\n**/*.md\n!src/legacy/\n!docs/api/\nnested.context\n",
+        encoding="utf-8",
+    )
+
+    # Act
+    service = env.container.resolve(IGetContextUseCase)
+    context = service.get_context(
+        context_files={"Manual": ["my.context", "notes.txt"]}, include_tokens=False
+    )
+
+    # Assert
+    # Negations only apply to the manifest that declares them.
+    assert context.scoped_paths["Manual"] == [
+        "docs/guide.md",
+        "src/app.py",
+        "src/util/helpers.py",
+        "notes.txt",
+    ]
+
+
+def test_context_service_keeps_literal_bracketed_paths(monkeypatch):
+    # Arrange
+    env = TestEnvironment(monkeypatch).setup().with_real_filesystem()
+    for rel_path in ("app/[id]/page.tsx", "app/i/page.tsx", "routes/[slug].md"):
+        path = env.workspace / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel_path, encoding="utf-8")
+    (env.workspace / "my.context").write_text("routes/[slug].md\n", encoding="utf-8")
+
+    # Act
+    service = env.container.resolve(IGetContextUseCase)
+    context = service.get_context(
+        context_files={
+            "File": ["app/[id]/page.tsx"],
+            "Dir": ["app/[id]"],
+            "Manifest": ["my.context"],
+        },
+        include_tokens=False,
+    )
+
+    # Assert
+    # Route segments like `[id]` are directory names, not character classes.
+    assert context.scoped_paths["File"] == ["app/[id]/page.tsx"]
+    assert context.scoped_paths["Dir"] == ["app/[id]/page.tsx"]
+    assert context.scoped_paths["Manifest"] == ["routes/[slug].md"]
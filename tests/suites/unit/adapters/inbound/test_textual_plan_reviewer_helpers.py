@@ -181,3 +181,35 @@ def test_populate_context_detail_system_info_tokens_equals_content_tokens_when_n
     # System = 500 + 1000 = 1500 -> 1.5k
     assert "• System" in detail_map
     assert "1.5k" in detail_map["• System"]
+
+
+def test_populate_context_detail_reports_repo_tree_tokens_separately():
+    """
+    Scenario: Repo tree token cost
+    Tests that the tree's tokens get their own line and are no longer
+    counted under System.
+    """
+    # Arrange
+    app = MagicMock()
+    pane = []
+    app.project_context = ProjectContext(
+        header="H",
+        content="C",
+        system_prompt_tokens=500,
+        content_tokens=1000,
+        tree_tokens=400,
+        total_window=128000,
+    )
+
+    # Act
+    populate_context_detail(app, pane, {"type": "CONTEXT_ROOT"})
+
+    # Assert
+    detail_map = {
+        item.data["key"]: item.data["val"]
+        for item in pane
+        if isinstance(item, DetailItem)
+    }
+    assert detail_map["• Repo Tree"] == "0.4k"
+    # System = 500 + (1000 - 400) = 1100 -> 1.1k
+    assert detail_map["• System"] == "1.1k"
@@ -0,0 +1,95 @@
+import os
+
+from teddy_executor.adapters.outbound.file_sniffer import (
+    BINARY,
+    MINIFIED,
+    MINIFIED_LINE_LENGTH,
+    OVERSIZED,
+    SNIFF_BYTES,
+    TEXT,
+    FileSniffer,
+    format_size,
+)
+
+
+def test_classifies_text_binary_and_minified_files(tmp_path):
+    # Arrange
+    sniffer = FileSniffer()
+    (tmp_path / "main.py").write_text("print('hi')\n", encoding="utf-8")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
+    (tmp_path / "app.min.js").write_text("var a=1;", encoding="utf-8")
+    (tmp_path / "bundle.js").write_text(
+        "x" * (MINIFIED_LINE_LENGTH + SNIFF_BYTES), encoding="utf-8"
+    )
+
+    # Act
+    kinds = {
+        name: sniffer.classify(str(tmp_path / name)).kind
+        for name in ("main.py", "logo.png", "app.min.js", "bundle.js")
+    }
+
+    # Assert
+    assert kinds == {
+        "main.py": TEXT,
+        "logo.png": BINARY,
+        "app.min.js": MINIFIED,
+        "bundle.js": MINIFIED,
+    }
+
+
+def test_multibyte_character_cut_at_prefix_end_is_still_text(tmp_path):
+    # Arrange
+    sniffer = FileSniffer()
+    path = tmp_path / "notes.md"
+    # The 2-byte 'é' straddles the end of the sniffed prefix.
+    path.write_bytes(b"a\n" * ((SNIFF_BYTES - 1) // 2) + "é\n".encode("utf-8"))
+
+    # Act
+    result = sniffer.classify(str(path))
+
+    # Assert
+    assert result.kind == TEXT
+
+
+def test_applies_byte_cap_and_describes_the_file(tmp_path):
+    # Arrange
+    cap = 16
+    sniffer = FileSniffer(max_file_bytes=cap)
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n" * 512, encoding="utf-8")
+
+    # Act
+    result = sniffer.classify(str(path))
+
+    # Assert
+    assert result.kind == OVERSIZED
+    assert result.placeholder() == "--- OVERSIZED FILE OMITTED (text/csv, 2.0 KB) ---"
+
+
+def test_caches_results_until_mtime_or_size_changes(tmp_path, monkeypatch):
+    # Arrange
+    sniffer = FileSniffer()
+    path = tmp_path / "blob.bin"
+    path.write_bytes(b"\x00\x01")
+    sniffed = []
+    original = sniffer._sniff
+    monkeypatch.setattr(
+        sniffer, "_sniff", lambda p, size: sniffed.append(p) or original(p, size)
+    )
+
+    # Act
+    sniffer.classify(str(path))
+    sniffer.classify(str(path))
+    path.write_text("now text", encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    result = sniffer.classify(str(path))
+
+    # Assert
+    assert len(sniffed) == 2
+    assert result.kind == TEXT
+
+
+def test_format_size_uses_binary_units():
+    assert format_size(512) == "512 B"
+    assert format_size(1536) == "1.5 KB"
+    assert format_size(3 << 20) == "3.0 MB"
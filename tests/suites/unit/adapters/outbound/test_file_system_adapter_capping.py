@@ -49,3 +49,115 @@ def test_read_file_does_not_truncate_below_limit(tmp_path, edit_simulator):
 
     # Assert
     assert result == content
+
+
+def test_read_file_streams_head_and_counts_remaining_lines(
+    tmp_path, edit_simulator, monkeypatch
+):
+    # Arrange
+    from teddy_executor.adapters.outbound import filesystem_helpers
+
+    # Tiny chunks force line breaks (including \r\n) across chunk boundaries
+    monkeypatch.setattr(filesystem_helpers, "READ_CHUNK_SIZE", 5)
+    adapter = LocalFileSystemAdapter(
+        edit_simulator=edit_simulator, root_dir=str(tmp_path), max_read_lines=2
+    )
+    (tmp_path / "mixed.txt").write_bytes(
+        "first\r\nsecond\rthird\r\nfourth fifth\n".encode("utf-8")
+    )
+
+    # Act
+    result = adapter.read_file("mixed.txt")
+
+    # Assert
+    assert result.startswith("first\nsecond\n[Content truncated: Showing first 2 of 5")
+
+
+def test_read_file_does_not_decode_beyond_the_head(tmp_path, edit_simulator):
+    # Arrange
+    adapter = LocalFileSystemAdapter(
+        edit_simulator=edit_simulator, root_dir=str(tmp_path), max_read_lines=1
+    )
+    (tmp_path / "fixture.dat").write_bytes(b"header\n\xff\xfe\x00binary\n")
+
+    # Act
+    result = adapter.read_file("fixture.dat")
+
+    # Assert
+    assert result.startswith("header\n[Content truncated: Showing first 1 of 2")
+
+
+def test_read_file_applies_byte_budget_to_long_lines(tmp_path, edit_simulator):
+    # Arrange
+    adapter = LocalFileSystemAdapter(
+        edit_simulator=edit_simulator,
+        root_dir=str(tmp_path),
+        max_read_lines=10,
+        max_read_bytes=8,
+    )
+    (tmp_path / "minified.js").write_text("é" * 20 + "\nnext", encoding="utf-8")
+
+    # Act
+    result = adapter.read_file("minified.js")
+
+    # Assert
+    # The cut never splits a multi-byte character
+    assert result.startswith("éééé\n[Content truncated: Showing first 1 of 2")
+
+
+def test_read_file_matches_full_read_for_unusual_line_breaks(tmp_path, edit_simulator):
+    # Arrange
+    adapter = LocalFileSystemAdapter(
+        edit_simulator=edit_simulator, root_dir=str(tmp_path), max_read_lines=2
+    )
+    (tmp_path / "paged.c").write_text("a\fb\nc\nd", encoding="utf-8")
+
+    # Act
+    result = adapter.read_file("paged.c")
+
+    # Assert
+    # Form feeds count as line breaks, exactly as before streaming
+    assert result.startswith("a\nb\n[Content truncated: Showing first 2 of 4")
+
+
+def test_read_files_in_vault_replaces_binary_files_with_placeholder(
+    tmp_path, edit_simulator
+):
+    # Arrange
+    adapter = LocalFileSystemAdapter(
+        edit_simulator=edit_simulator, root_dir=str(tmp_path)
+    )
+    (tmp_path / "app.db").write_bytes(b"SQLite format 3\x00" + b"\xff" * 2048)
+    (tmp_path / "notes.txt").write_text("hello", encoding="utf-8")
+
+    # Act
+    result = adapter.read_files_in_vault(["app.db", "notes.txt", "missing.txt"])
+
+    # Assert
+    assert result == {
+        "app.db": "--- BINARY FILE OMITTED (application/octet-stream, 2.0 KB) ---",
+        "notes.txt": "hello",
+        "missing.txt": None,
+    }
+
+
+def test_read_files_in_vault_reads_in_parallel_preserving_order(
+    tmp_path, edit_simulator
+):
+    # Arrange
+    adapter = LocalFileSystemAdapter(
+        edit_simulator=edit_simulator, root_dir=str(tmp_path), read_workers=4
+    )
+    paths = [f"file_{i}.txt" for i in reversed(range(20))]
+    for path in paths:
+        (tmp_path / path).write_text(path, encoding="utf-8")
+
+    # Act
+    result = adapter.read_files_in_vault([*paths, "missing.txt"])
+
+    # Assert
+    assert list(result) == [*paths, "missing.txt"]
+    assert all(result[p] == p for p in paths)
+    assert result["missing.txt"] is None
+    assert list(adapter.last_read_timings) == list(result)
+    assert all(t >= 0 for t in adapter.last_read_timings.values())
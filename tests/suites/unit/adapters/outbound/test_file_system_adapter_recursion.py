@@ -50,3 +50,33 @@ def test_list_directory_recursive_respects_ignores(fs, mock_edit_simulator):
     assert "node_modules/dep/index.js" not in files
     assert "secret.txt" not in files
     assert "src/main.py" in files
+
+
+def test_list_directory_recursive_applies_nested_gitignore_relative_to_its_dir(
+    fs, mock_edit_simulator
+):
+    # Arrange
+    fs.create_file("/app/.gitignore", contents="*.log")
+    fs.create_file("/app/pkg/.gitignore", contents="/generated/\n!keep.log")
+    fs.create_file("/app/pkg/generated/big.py", contents="...")
+    fs.create_file("/app/pkg/sub/generated/kept.py", contents="...")
+    fs.create_file("/app/pkg/keep.log", contents="...")
+    fs.create_file("/app/pkg/drop.log", contents="...")
+    fs.create_file("/app/generated/root.py", contents="...")
+
+    adapter = LocalFileSystemAdapter(
+        edit_simulator=mock_edit_simulator, root_dir="/app"
+    )
+
+    # Act
+    files = adapter.list_directory_recursive(".")
+    nested_files = adapter.list_directory_recursive("pkg/generated")
+
+    # Assert
+    # The anchored pattern only applies below pkg/, and the negation only there
+    assert files == [
+        "generated/root.py",
+        "pkg/keep.log",
+        "pkg/sub/generated/kept.py",
+    ]
+    assert nested_files == []
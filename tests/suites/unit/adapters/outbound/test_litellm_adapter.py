@@ -264,6 +264,25 @@ def test_get_text_token_count_uses_config_model_fallback(mock_config, monkeypatc
     mock_encoding.assert_called_with("config-model")
 
 
+def test_get_text_token_count_estimates_when_the_encoding_is_unavailable(
+    mock_config, monkeypatch
+):
+    # Arrange
+    mock_config.get_setting.return_value = "gpt-4o"
+    monkeypatch.setattr(
+        "tiktoken.encoding_for_model",
+        Mock(side_effect=ConnectionError("no network")),
+    )
+    adapter = LiteLLMAdapter(mock_config)
+
+    # Act
+    count = adapter.get_text_token_count("x" * 380)
+
+    # Assert
+    assert count == 100  # noqa: PLR2004
+    assert adapter.prewarm_tokenizer() is False
+
+
 def test_get_completion_hydrates_and_retries_on_not_found_error(mock_config, container):
     # Arrange
     import litellm
@@ -478,3 +497,26 @@ def test_get_completion_broadcasts_metadata_to_all_candidates(mock_config, conta
     # Metadata from resolved_id MUST be applied to requested_id as well
     assert litellm.model_cost[requested_id]["max_input_tokens"] == 32000
     assert litellm.model_cost[resolved_id]["max_input_tokens"] == 32000
+
+
+def test_get_text_token_count_reuses_cached_count_for_unchanged_text(
+    mock_config, monkeypatch
+):
+    # Arrange
+    from teddy_executor.adapters.outbound.token_count_cache import TokenCountCache
+
+    mock_config.get_setting.return_value = "gpt-4o"
+    mock_enc = Mock()
+    mock_enc.name = "o200k_base"
+    mock_enc.encode.return_value = [1, 2, 3]
+    monkeypatch.setattr("tiktoken.encoding_for_model", Mock(return_value=mock_enc))
+
+    adapter = LiteLLMAdapter(mock_config, token_cache=TokenCountCache())
+
+    # Act
+    first = adapter.get_text_token_count("unchanged file content")
+    second = adapter.get_text_token_count("unchanged file content")
+
+    # Assert
+    assert first == second == 3
+    mock_enc.encode.assert_called_once()
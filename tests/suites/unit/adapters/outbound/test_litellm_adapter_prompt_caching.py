@@ -0,0 +1,126 @@
+from unittest.mock import Mock
+
+import litellm
+import pytest
+
+from teddy_executor.adapters.outbound.litellm_adapter import LiteLLMAdapter
+
+EPHEMERAL = {"type": "ephemeral"}
+
+
+@pytest.fixture(autouse=True)
+def reset_litellm_mock():
+    # litellm is already mocked globally in tests/harness/setup/composition.py
+    litellm.reset_mock()
+    litellm.set_verbose = Mock()
+    litellm.suppress_debug_info = Mock()
+    litellm.completion.side_effect = None
+    litellm.completion.return_value = Mock()
+    yield
+
+
+def _adapter(mock_config, model: str) -> LiteLLMAdapter:
+    mock_config.get_setting.side_effect = lambda key, default=None: {
+        "llm.model": model,
+        "llm.api_key": "sk-test-key",  # pragma: allowlist secret
+        "llm": {"model": model},
+    }.get(key, default)
+    return LiteLLMAdapter(mock_config)
+
+
+def _messages():
+    return [
+        {"role": "system", "content": "You are an agent."},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "# Project Context\npinned"},
+                {"type": "text", "text": "\ntree"},
+                {"type": "text", "text": "\nvolatile"},
+            ],
+        },
+    ]
+
+
+def test_get_completion_emits_cache_breakpoints_for_claude_models(mock_config):
+    # Arrange
+    adapter = _adapter(mock_config, "anthropic/claude-sonnet-4")
+
+    # Act
+    adapter.get_completion(messages=_messages())
+
+    # Assert
+    sent = litellm.completion.call_args.kwargs["messages"]
+    assert sent[0]["content"] == [
+        {"type": "text", "text": "You are an agent.", "cache_control": EPHEMERAL}
+    ]
+    user_parts = sent[1]["content"]
+    assert [part.get("cache_control") for part in user_parts] == [
+        EPHEMERAL,
+        EPHEMERAL,
+        None,
+    ]
+
+
+def test_get_completion_caps_the_number_of_cache_breakpoints(mock_config):
+    # Arrange
+    adapter = _adapter(mock_config, "openrouter/anthropic/claude-3.5-sonnet")
+    messages = _messages()
+    messages[1]["content"] = [{"type": "text", "text": str(i)} for i in range(8)]
+
+    # Act
+    adapter.get_completion(messages=messages)
+
+    # Assert
+    sent = litellm.completion.call_args.kwargs["messages"]
+    marked = [p for m in sent for p in m["content"] if "cache_control" in p]
+    assert len(marked) == LiteLLMAdapter.MAX_CACHE_BREAKPOINTS
+
+
+def test_get_completion_joins_text_parts_for_other_providers(mock_config):
+    # Arrange
+    adapter = _adapter(mock_config, "gpt-4o")
+    messages = _messages()
+
+    # Act
+    adapter.get_completion(messages=messages)
+
+    # Assert
+    sent = litellm.completion.call_args.kwargs["messages"]
+    assert sent == [
+        {"role": "system", "content": "You are an agent."},
+        {"role": "user", "content": "# Project Context\npinned\ntree\nvolatile"},
+    ]
+    # The caller's messages are left untouched.
+    assert isinstance(messages[1]["content"], list)
+
+
+def test_get_cache_usage_reads_openai_and_anthropic_style_usage(mock_config):
+    # Arrange
+    adapter = _adapter(mock_config, "gpt-4o")
+    openai_style = Mock()
+    openai_style.usage = Mock(
+        prompt_tokens=1000,
+        prompt_tokens_details=Mock(cached_tokens=800),
+        cache_creation_input_tokens=None,
+    )
+    anthropic_style = Mock()
+    anthropic_style.usage = Mock(
+        prompt_tokens=1000,
+        prompt_tokens_details=None,
+        cache_read_input_tokens=0,
+        cache_creation_input_tokens=900,
+    )
+
+    # Act & Assert
+    assert adapter.get_cache_usage(openai_style) == {
+        "cache_hit_tokens": 800,
+        "cache_miss_tokens": 200,
+        "cache_write_tokens": 0,
+    }
+    assert adapter.get_cache_usage(anthropic_style) == {
+        "cache_hit_tokens": 0,
+        "cache_miss_tokens": 1000,
+        "cache_write_tokens": 900,
+    }
+    assert adapter.get_cache_usage(Mock(usage=None)) == {}
@@ -0,0 +1,90 @@
+import os
+from pathlib import Path
+
+from teddy_executor.adapters.outbound.tiktoken_encoding_store import (
+    TiktokenEncodingStore,
+)
+
+
+def test_seed_copies_the_bundled_encoding_into_the_cache(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.delenv("CUSTOM_TIKTOKEN_CACHE_DIR", raising=False)
+    monkeypatch.delenv("TIKTOKEN_CACHE_DIR", raising=False)
+    bundled = tmp_path / "bundle" / "cl100k"
+    bundled.parent.mkdir()
+    bundled.write_bytes(b"bpe ranks")
+    monkeypatch.setattr(
+        TiktokenEncodingStore, "_bundled_file", lambda self, name: bundled
+    )
+    cache_dir = tmp_path / ".teddy" / TiktokenEncodingStore.CACHE_DIRNAME
+    store = TiktokenEncodingStore(cache_dir=str(cache_dir))
+
+    # Act
+    seeded = store.seed("cl100k_base")
+    store.activate()
+
+    # Assert
+    assert seeded
+    cached = cache_dir / TiktokenEncodingStore._file_key("cl100k_base")
+    assert cached.read_bytes() == b"bpe ranks"
+    assert os.environ["TIKTOKEN_CACHE_DIR"] == str(cache_dir)
+
+
+def test_missing_encoding_is_reported_and_custom_dir_wins(tmp_path, monkeypatch):
+    # Arrange
+    custom = tmp_path / "custom"
+    monkeypatch.setenv("CUSTOM_TIKTOKEN_CACHE_DIR", str(custom))
+    monkeypatch.delenv("TIKTOKEN_CACHE_DIR", raising=False)
+    monkeypatch.setattr(TiktokenEncodingStore, "_bundled_file", lambda self, n: None)
+    store = TiktokenEncodingStore(cache_dir=str(tmp_path / "ignored"))
+
+    # Act & Assert
+    assert not store.seed("r50k_base")
+    assert not store.has_encoding("r50k_base")
+    store.activate()
+    assert Path(os.environ["TIKTOKEN_CACHE_DIR"]) == custom
+
+
+def test_user_tiktoken_cache_dir_is_used_and_kept(tmp_path, monkeypatch):
+    # Arrange
+    user_dir = tmp_path / "user-tiktoken"
+    monkeypatch.delenv("CUSTOM_TIKTOKEN_CACHE_DIR", raising=False)
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(user_dir))
+    bundled = tmp_path / "bundle" / "cl100k"
+    bundled.parent.mkdir()
+    bundled.write_bytes(b"bpe ranks")
+    monkeypatch.setattr(
+        TiktokenEncodingStore, "_bundled_file", lambda self, name: bundled
+    )
+    store = TiktokenEncodingStore(cache_dir=str(tmp_path / "ignored"))
+
+    # Act
+    store.activate()
+    seeded = store.seed("cl100k_base")
+
+    # Assert
+    assert os.environ["TIKTOKEN_CACHE_DIR"] == str(user_dir)
+    assert seeded
+    assert (user_dir / TiktokenEncodingStore._file_key("cl100k_base")).is_file()
+    assert not (tmp_path / "ignored").exists()
+
+
+def test_litellm_bundled_tiktoken_dir_is_not_taken_for_a_user_choice(
+    tmp_path, monkeypatch
+):
+    # Arrange
+    bundled_dir = tmp_path / "litellm" / "litellm_core_utils" / "tokenizers"
+    bundled_dir.mkdir(parents=True)
+    monkeypatch.delenv("CUSTOM_TIKTOKEN_CACHE_DIR", raising=False)
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(bundled_dir))
+    monkeypatch.setattr(
+        TiktokenEncodingStore, "_bundled_dirs", staticmethod(lambda: [bundled_dir])
+    )
+    cache_dir = tmp_path / ".teddy" / TiktokenEncodingStore.CACHE_DIRNAME
+    store = TiktokenEncodingStore(cache_dir=str(cache_dir))
+
+    # Act
+    store.activate()
+
+    # Assert
+    assert os.environ["TIKTOKEN_CACHE_DIR"] == str(cache_dir)
@@ -0,0 +1,68 @@
+import json
+
+from teddy_executor.adapters.outbound.token_count_cache import TokenCountCache
+
+
+def test_get_returns_none_on_miss_and_count_on_hit():
+    cache = TokenCountCache()
+
+    assert cache.get("hello", "cl100k_base") is None
+
+    cache.put("hello", "cl100k_base", 7)
+
+    assert cache.get("hello", "cl100k_base") == 7
+
+
+def test_entries_are_scoped_by_encoding_name():
+    cache = TokenCountCache()
+    cache.put("hello", "cl100k_base", 7)
+
+    assert cache.get("hello", "o200k_base") is None
+
+
+def test_put_evicts_least_recently_used_entry_when_over_capacity():
+    cache = TokenCountCache(max_entries=2)
+    cache.put("a", "enc", 1)
+    cache.put("b", "enc", 2)
+
+    # Touch "a" so that "b" becomes the least recently used entry
+    assert cache.get("a", "enc") == 1
+    cache.put("c", "enc", 3)
+
+    assert cache.get("a", "enc") == 1
+    assert cache.get("b", "enc") is None
+    assert cache.get("c", "enc") == 3
+
+
+def test_flush_persists_entries_and_reload_restores_them(temp_cache_dir):
+    cache_path = temp_cache_dir / TokenCountCache.CACHE_FILENAME
+    cache = TokenCountCache(cache_path=str(cache_path))
+    cache.put("some file content", "cl100k_base", 42)
+
+    cache.flush()
+
+    assert cache_path.is_file()
+    reloaded = TokenCountCache(cache_path=str(cache_path))
+    assert reloaded.get("some file content", "cl100k_base") == 42
+
+
+def test_flush_does_not_create_missing_parent_directory(temp_cache_dir):
+    cache_path = temp_cache_dir / "missing" / TokenCountCache.CACHE_FILENAME
+    cache = TokenCountCache(cache_path=str(cache_path))
+    cache.put("text", "enc", 1)
+
+    cache.flush()
+
+    assert not cache_path.parent.exists()
+
+
+def test_corrupt_or_outdated_cache_file_is_treated_as_empty(temp_cache_dir):
+    cache_path = temp_cache_dir / TokenCountCache.CACHE_FILENAME
+    cache_path.write_text("not json {{{", encoding="utf-8")
+    assert TokenCountCache(cache_path=str(cache_path)).get("x", "enc") is None
+
+    key = TokenCountCache.make_key("x", "enc")
+    cache_path.write_text(
+        json.dumps({"version": 0, "entries": {key: 5}}), encoding="utf-8"
+    )
+    assert TokenCountCache(cache_path=str(cache_path)).get("x", "enc") is None
@@ -0,0 +1,107 @@
+import json
+
+from teddy_executor.adapters.outbound.web_content_cache import WebContentCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_none_on_miss_and_entry_on_hit():
+    cache = WebContentCache()
+
+    assert cache.get("https://example.com") is None
+
+    cache.put("https://example.com", "page", etag='"abc"', last_modified="Mon")
+    entry = cache.get("https://example.com")
+
+    assert entry is not None
+    assert entry.content == "page"
+    assert entry.etag == '"abc"'
+    assert entry.last_modified == "Mon"
+    assert entry.is_fresh
+
+
+def test_entries_persist_as_one_sharded_file_per_page(temp_cache_dir):
+    cache_dir = temp_cache_dir / WebContentCache.CACHE_DIRNAME
+    cache = WebContentCache(cache_dir=str(cache_dir))
+    cache.put("https://a.example", "page a")
+    cache.put("https://b.example", "page b")
+    # Identical content is stored once (content-addressed).
+    cache.put("https://c.example", "page a")
+
+    blobs = sorted(p.name for p in cache_dir.glob("*/*.txt"))
+    digest_a = WebContentCache.make_digest("page a")
+    assert blobs == sorted(
+        [f"{digest_a}.txt", f"{WebContentCache.make_digest('page b')}.txt"]
+    )
+    assert (cache_dir / digest_a[:2] / f"{digest_a}.txt").is_file()
+
+    reloaded = WebContentCache(cache_dir=str(cache_dir))
+    assert reloaded.get("https://a.example").content == "page a"
+    assert reloaded.get("https://b.example").content == "page b"
+    assert reloaded.get("https://c.example").content == "page a"
+
+
+def test_entries_expire_after_their_ttl_and_renew_restarts_it():
+    clock = FakeClock()
+    cache = WebContentCache(ttl_seconds=60, clock=clock)
+    cache.put("https://default.example", "default ttl")
+    cache.put("https://short.example", "short ttl", ttl_seconds=10)
+
+    clock.now += 30
+    assert cache.get("https://default.example").is_fresh
+    assert not cache.get("https://short.example").is_fresh
+
+    clock.now += 40
+    assert not cache.get("https://default.example").is_fresh
+    cache.renew("https://default.example")
+    assert cache.get("https://default.example").is_fresh
+
+
+def test_put_evicts_least_recently_used_pages_over_the_size_cap(temp_cache_dir):
+    cache_dir = temp_cache_dir / WebContentCache.CACHE_DIRNAME
+    cache = WebContentCache(cache_dir=str(cache_dir), max_bytes=10)
+    cache.put("https://a.example", "aaaa")
+    cache.put("https://b.example", "bbbb")
+
+    # Touch "a" so that "b" becomes the least recently used entry
+    assert cache.get("https://a.example") is not None
+    cache.put("https://c.example", "cccc")
+
+    assert cache.get("https://a.example").content == "aaaa"
+    assert cache.get("https://b.example") is None
+    assert cache.get("https://c.example").content == "cccc"
+    digest_b = WebContentCache.make_digest("bbbb")
+    assert not (cache_dir / digest_b[:2] / f"{digest_b}.txt").exists()
+
+
+def test_corrupt_index_is_treated_as_empty(temp_cache_dir):
+    cache_dir = temp_cache_dir / WebContentCache.CACHE_DIRNAME
+    cache_dir.mkdir()
+    (cache_dir / WebContentCache.INDEX_FILENAME).write_text(
+        "{not json", encoding="utf-8"
+    )
+    cache = WebContentCache(cache_dir=str(cache_dir))
+
+    assert cache.get("https://example.com") is None
+
+    cache.put("https://example.com", "page")
+    index = json.loads(
+        (cache_dir / WebContentCache.INDEX_FILENAME).read_text(encoding="utf-8")
+    )
+    assert list(index["entries"]) == ["https://example.com"]
+
+
+def test_missing_parent_directory_keeps_the_cache_in_memory(temp_cache_dir):
+    cache_dir = temp_cache_dir / "missing" / WebContentCache.CACHE_DIRNAME
+    cache = WebContentCache(cache_dir=str(cache_dir))
+
+    cache.put("https://example.com", "page")
+
+    assert cache.get("https://example.com").content == "page"
+    assert not (temp_cache_dir / "missing").exists()
@@ -110,3 +110,23 @@ def test_project_context_content_tokens_can_be_set():
     """
     project_context = ProjectContext(header="H", content="C", content_tokens=1500)
     assert project_context.content_tokens == 1500
+
+
+def test_project_context_content_is_joined_from_sections_on_first_access():
+    """
+    Verify that, when only content_sections are given, content is their
+    newline join, built lazily and kept.
+    """
+    sections = ["## Git Status", "", "## Project Structure"]
+    project_context = ProjectContext(header="H", content_sections=sections)
+
+    assert project_context.content == "\n".join(sections)
+    assert project_context.content is project_context.content
+
+
+def test_project_context_explicit_content_takes_precedence_over_sections():
+    """
+    Verify that an explicitly passed content is kept as is.
+    """
+    project_context = ProjectContext(header="H", content="C", content_sections=["x"])
+    assert project_context.content == "C"
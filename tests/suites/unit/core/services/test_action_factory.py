@@ -1,5 +1,6 @@
 import pytest
 
+from teddy_executor.adapters.outbound.web_content_cache import WebContentCache
 from teddy_executor.core.services.action_factory import ActionFactory
 from teddy_executor.core.domain.models.action_ports import ActionPorts
 
@@ -133,3 +134,38 @@ def test_read_action_with_lines_extracts_range(
     mock_fs.read_file.assert_not_called()
     # Result should be only lines 2-4
     assert result == "line2\nline3\nline4", f"Expected lines 2-4, got: {result}"
+
+
+def test_read_action_with_url_shares_the_web_content_cache(
+    mock_fs, mock_scraper, mock_searcher, mock_user_interactor, mock_shell
+):
+    """
+    Given an ActionFactory with a web content cache,
+    When the same URL is read twice,
+    Then the second read is served from the cache.
+    """
+    # Arrange
+    mock_scraper.get_content.return_value = "web content"
+    mock_scraper.get_validators.return_value = {}
+    factory = ActionFactory(
+        ports=ActionPorts(
+            shell_executor=mock_shell,
+            file_system_manager=mock_fs,
+            user_interactor=mock_user_interactor,
+            web_scraper=mock_scraper,
+            web_searcher=mock_searcher,
+            web_cache=WebContentCache(),
+        )
+    )
+
+    # Act
+    results = [
+        factory.create_action("read", {"resource": "http://example.com"}).execute(
+            path="http://example.com"
+        )
+        for _ in range(2)
+    ]
+
+    # Assert
+    assert results == ["web content", "web content"]
+    mock_scraper.get_content.assert_called_once_with(url="http://example.com")
@@ -73,11 +73,9 @@ def test_resolve_recursive_ignores_urls_for_directory_checks(
     )
 
     url = "https://example.com/spec.md"
-    paths: list[str] = []
-    processed_manifests: set[str] = set()
 
     # Act
-    service._resolve_recursive(url, paths, processed_manifests)
+    paths = service._resolve_files_to_paths([url])
 
     # Assert
     assert url in paths
@@ -85,3 +83,80 @@ def test_resolve_recursive_ignores_urls_for_directory_checks(
     for call in mock_fs.is_dir.call_args_list:
         args, _ = call
         assert args[0] != url, f"is_dir was incorrectly called with URL: {url}"
+
+
+def test_resolve_files_to_paths_shares_one_walk_across_directories(
+    container,
+    mock_fs: Any,
+    mock_tree_gen: Any,
+    mock_inspector: Any,
+    mock_llm_client: Any,
+):
+    """
+    Ensures several directory entries are expanded from a single listing of
+    their common ancestor instead of one walk per directory.
+    """
+    # Arrange
+    mock_scraper = register_mock(container, IWebScraper)
+    service = ContextService(
+        file_system_manager=mock_fs,
+        repo_tree_generator=mock_tree_gen,
+        environment_inspector=mock_inspector,
+        llm_client=mock_llm_client,
+        web_scraper=mock_scraper,
+    )
+    mock_fs.is_dir.side_effect = lambda p: p in ("src/a", "./src/b/", "src/a/x")
+    mock_fs.list_directory_recursive.return_value = [
+        "src/b/two.py",
+        "src/a/x/deep.py",
+        "src/ab/other.py",
+        "src/a/one.py",
+    ]
+
+    # Act
+    resolved_paths = service._resolve_files_to_paths(
+        ["src/a", "README.md", "./src/b/", "src/a/x", "README.md"]
+    )
+
+    # Assert
+    assert resolved_paths == [
+        "src/a/one.py",
+        "src/a/x/deep.py",
+        "README.md",
+        "src/b/two.py",
+    ]
+    mock_fs.list_directory_recursive.assert_called_once_with("src")
+
+
+def test_resolve_files_to_paths_keeps_absolute_directories_absolute(
+    container,
+    mock_fs: Any,
+    mock_tree_gen: Any,
+    mock_inspector: Any,
+    mock_llm_client: Any,
+):
+    """
+    Ensures an absolute directory entry is not mistaken for the repo-relative
+    directory of the same name in the shared listing.
+    """
+    # Arrange
+    mock_scraper = register_mock(container, IWebScraper)
+    service = ContextService(
+        file_system_manager=mock_fs,
+        repo_tree_generator=mock_tree_gen,
+        environment_inspector=mock_inspector,
+        llm_client=mock_llm_client,
+        web_scraper=mock_scraper,
+    )
+    mock_fs.is_dir.side_effect = lambda p: p in ("/src", "src/a", "src/b")
+    listings = {
+        "src": ["src/a/one.py", "src/b/two.py", "src/other.py"],
+        "/src": ["/src/external.py"],
+    }
+    mock_fs.list_directory_recursive.side_effect = lambda p: listings[p]
+
+    # Act
+    resolved_paths = service._resolve_files_to_paths(["/src", "src/a", "src/b"])
+
+    # Assert
+    assert resolved_paths == ["/src/external.py", "src/a/one.py", "src/b/two.py"]
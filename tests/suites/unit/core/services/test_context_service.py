@@ -1,3 +1,5 @@
+from unittest.mock import Mock
+
 import pytest
 
 from teddy_executor.core.domain.models import ProjectContext
@@ -465,7 +467,7 @@ def test_get_context_fetches_remote_url_content_via_web_scraper(
 
     # Assert
     # 1. Scraper should be called for the URL
-    mock_scraper.get_content.assert_called_once_with(url)
+    mock_scraper.get_content.assert_called_once_with(url=url)
 
     # 2. Results should contain both contents
     assert scraped_content in result.content
@@ -508,8 +510,8 @@ def test_get_context_computes_content_tokens(
 ):
     """
     Scenario: Content Token Computation
-    Tests that get_context() computes content_tokens from the assembled content
-    string and stores it on the ProjectContext DTO.
+    Tests that get_context() computes content_tokens section by section,
+    without assembling the full content string, and stores it on the DTO.
     """
     # Arrange
     mock_inspector.get_environment_info.return_value = {}
@@ -518,16 +520,17 @@ def test_get_context_computes_content_tokens(
     mock_tree_gen.generate_tree.return_value = ""
     mock_fs.get_context_paths.return_value = []
 
-    # Mock token counting to return a known value
-    mock_llm_client.get_text_token_count.return_value = 42
+    # Mock token counting with one token per character
+    mock_llm_client.get_text_token_count.side_effect = len
 
     # Act
     result = service.get_context()
 
     # Assert
-    # content_tokens should be the token count of the assembled content string
-    assert result.content_tokens == 42
-    mock_llm_client.get_text_token_count.assert_called_once_with(result.content)
+    counted = [c.args[0] for c in mock_llm_client.get_text_token_count.call_args_list]
+    assert counted == [section for section in result.content_sections if section]
+    assert result.content_tokens == sum(map(len, result.content_sections))
+    assert "\n".join(result.content_sections) == result.content
 
 
 def test_get_context_content_tokens_zero_when_include_tokens_false(
@@ -554,3 +557,269 @@ def test_get_context_content_tokens_zero_when_include_tokens_false(
     # Assert
     assert result.content_tokens == 0
     mock_llm_client.get_text_token_count.assert_not_called()
+
+
+def test_get_context_cache_friendly_layout_orders_from_stable_to_volatile(
+    mock_fs,
+    mock_tree_gen,
+    mock_inspector,
+    mock_llm_client,
+    mock_config,
+):
+    """
+    Scenario: Prompt-Cache-Friendly Layout
+    Tests that `context.layout: cache_friendly` orders the content from most
+    stable to most volatile and exposes it as segments, with the per-turn
+    System Information moved out of the header.
+    """
+    # Arrange
+    mock_config.get_setting.side_effect = lambda key, default=None: {
+        "context.layout": "cache_friendly"
+    }.get(key, default)
+    session_prefix = ".teddy/sessions/20260521_134944-test-session"
+    mock_inspector.get_environment_info.return_value = {"current_time": "16:50:00"}
+    mock_inspector.get_git_status.return_value = ""
+    mock_inspector.get_full_git_status.return_value = "On branch main"
+    mock_tree_gen.generate_tree.return_value = "src/main.py"
+    mock_fs.read_files_in_vault.return_value = {
+        f"{session_prefix}/01/plan.md": "Plan for step 1",
+        "docs/spec.md": "pinned spec",
+        "src/main.py": "print('hello')",
+    }
+    service = ContextService(
+        mock_fs,
+        mock_tree_gen,
+        mock_inspector,
+        mock_llm_client,
+        Mock(spec=IWebScraper),
+        config_service=mock_config,
+    )
+
+    # Act
+    result = service.get_context(
+        context_files={
+            "Session": ["docs/spec.md"],
+            "Turn": [f"{session_prefix}/01/plan.md", "src/main.py", "docs/spec.md"],
+        },
+        current_turn="02",
+    )
+
+    # Assert
+    assert result.header == "# Project Context"
+    assert "\n".join(result.content_segments) == result.content
+    assert len(result.content_segments) == 4  # noqa: PLR2004
+    pinned, structure, turn, volatile = result.content_segments
+    assert "## Pinned Resource Contents" in pinned and "pinned spec" in pinned
+    assert structure.startswith("\n## Project Structure")
+    assert "## Turn Resource Contents" in turn and "print('hello')" in turn
+    assert "docs/spec.md" not in turn
+    assert volatile.index("## Git Status") < volatile.index("## Session History")
+    assert volatile.index("## Session History") < volatile.index(
+        "## System Information"
+    )
+    assert "- **Current Turn:** 02" in volatile
+
+
+def test_get_context_default_layout_has_no_segments(
+    service: IGetContextUseCase,
+    mock_fs,
+    mock_tree_gen,
+    mock_inspector,
+):
+    """The default layout keeps the historical order and returns no segments."""
+    # Arrange
+    mock_inspector.get_environment_info.return_value = {}
+    mock_inspector.get_git_status.return_value = None
+    mock_inspector.get_full_git_status.return_value = None
+    mock_tree_gen.generate_tree.return_value = ""
+    mock_fs.get_context_paths.return_value = []
+
+    # Act
+    result = service.get_context()
+
+    # Assert
+    assert result.content_segments == []
+    assert "## System Information" in result.header
+
+
+def test_get_context_outlines_oversized_turn_files(
+    mock_fs,
+    mock_tree_gen,
+    mock_inspector,
+    mock_llm_client,
+    mock_config,
+):
+    """
+    Scenario: Structural Outline Mode
+    Tests that Turn-only files above `context.outline_threshold_chars` are sent
+    as an outline, counted by the outline's tokens and marked on their item,
+    while pinned files keep their full text.
+    """
+    # Arrange
+    mock_config.get_setting.side_effect = lambda key, default=None: {
+        "context.outline_threshold_chars": 200
+    }.get(key, default)
+    big_module = "class Big:\n" + "".join(
+        f"    def method_{i}(self, x: int) -> int:\n        return x\n\n"
+        for i in range(10)
+    )
+    mock_inspector.get_environment_info.return_value = {}
+    mock_inspector.get_git_status.return_value = None
+    mock_inspector.get_full_git_status.return_value = None
+    mock_tree_gen.generate_tree.return_value = ""
+    mock_fs.read_files_in_vault.return_value = {
+        "src/big.py": big_module,
+        "src/pinned.py": big_module,
+        "src/small.py": "x = 1\n",
+    }
+    mock_llm_client.get_text_token_count.side_effect = len
+    service = ContextService(
+        mock_fs,
+        mock_tree_gen,
+        mock_inspector,
+        mock_llm_client,
+        Mock(spec=IWebScraper),
+        config_service=mock_config,
+    )
+
+    # Act
+    result = service.get_context(
+        context_files={
+            "Session": ["src/pinned.py"],
+            "Turn": ["src/big.py", "src/pinned.py", "src/small.py"],
+        }
+    )
+
+    # Assert
+    items = {item.path: item for item in result.items}
+    assert items["src/big.py"].representation == "outline"
+    assert items["src/big.py"].token_count < len(big_module)
+    assert items["src/pinned.py"].representation == "full"
+    assert items["src/small.py"].representation == "full"
+    assert "### [src/big.py](/src/big.py) (outline)" in result.content
+    assert "L2:     def method_0(self, x: int) -> int:" in result.content
+    # Only the pinned copy is sent in full.
+    assert result.content.count("return x") == 10  # noqa: PLR2004
+
+
+def test_get_context_requests_a_compact_tree_and_counts_its_tokens(
+    mock_fs,
+    mock_tree_gen,
+    mock_inspector,
+    mock_llm_client,
+    mock_config,
+):
+    """
+    Scenario: Compact Repo Tree
+    Tests that `context.tree_format: compact` asks for a budgeted tree that
+    keeps the context files' directories expanded, and that the tree's token
+    cost is reported separately.
+    """
+    # Arrange
+    mock_config.get_setting.side_effect = lambda key, default=None: {
+        "context.tree_format": "compact",
+        "context.tree_dir_budget": 25,
+    }.get(key, default)
+    mock_inspector.get_environment_info.return_value = {}
+    mock_inspector.get_git_status.return_value = None
+    mock_inspector.get_full_git_status.return_value = None
+    mock_tree_gen.generate_tree.return_value = "src/\n  main.py"
+    mock_fs.read_files_in_vault.return_value = {"src/main.py": "x = 1"}
+    mock_llm_client.get_text_token_count.side_effect = len
+    service = ContextService(
+        mock_fs,
+        mock_tree_gen,
+        mock_inspector,
+        mock_llm_client,
+        Mock(spec=IWebScraper),
+        config_service=mock_config,
+    )
+
+    # Act
+    result = service.get_context(context_files={"Turn": ["src/main.py"]})
+
+    # Assert
+    mock_tree_gen.generate_tree.assert_called_once_with(
+        ["src/main.py"], compact=True, dir_budget=25
+    )
+    assert result.tree_tokens == len("src/\n  main.py")
+
+
+def test_get_context_compacts_repeated_session_history(
+    service: IGetContextUseCase,
+    mock_fs,
+    mock_tree_gen,
+    mock_inspector,
+    mock_llm_client,
+):
+    """
+    Scenario: Cross-Turn History Compaction
+    Tests that a replan identical to an earlier plan is sent as a reference
+    and counted by the reference's tokens.
+    """
+    # Arrange
+    session_prefix = ".teddy/sessions/20260521_134944-test-session"
+    plan = "# Plan\n```text\n" + "step\n" * 60 + "```"
+    mock_inspector.get_environment_info.return_value = {}
+    mock_inspector.get_git_status.return_value = None
+    mock_inspector.get_full_git_status.return_value = None
+    mock_tree_gen.generate_tree.return_value = ""
+    mock_fs.read_files_in_vault.return_value = {
+        f"{session_prefix}/02/plan.md": plan,
+        f"{session_prefix}/01/plan.md": plan,
+    }
+    mock_llm_client.get_text_token_count.side_effect = len
+
+    # Act
+    result = service.get_context(
+        context_files={
+            "Turn": [f"{session_prefix}/02/plan.md", f"{session_prefix}/01/plan.md"]
+        }
+    )
+
+    # Assert
+    assert result.content.count("step") == 60  # noqa: PLR2004
+    assert "[Identical to Turn 1: Plan; omitted.]" in result.content
+    items = {item.path: item for item in result.items}
+    assert items[f"{session_prefix}/02/plan.md"].token_count < len(plan)
+
+
+def test_get_context_estimates_tokens_without_the_tokenizer(
+    mock_fs,
+    mock_tree_gen,
+    mock_inspector,
+    mock_llm_client,
+    mock_config,
+):
+    """
+    Scenario: Fast Estimator Mode
+    Tests that `context.token_counting: estimate` counts tokens with the
+    bytes-per-token estimator and marks the context as estimated.
+    """
+    # Arrange
+    mock_config.get_setting.side_effect = lambda key, default=None: {
+        "context.token_counting": "estimate"
+    }.get(key, default)
+    mock_inspector.get_environment_info.return_value = {}
+    mock_inspector.get_git_status.return_value = None
+    mock_inspector.get_full_git_status.return_value = None
+    mock_tree_gen.generate_tree.return_value = "src/main.py"
+    mock_fs.read_files_in_vault.return_value = {"src/main.py": "x" * 450}
+    service = ContextService(
+        mock_fs,
+        mock_tree_gen,
+        mock_inspector,
+        mock_llm_client,
+        Mock(spec=IWebScraper),
+        config_service=mock_config,
+    )
+
+    # Act
+    result = service.get_context(context_files={"Turn": ["src/main.py"]})
+
+    # Assert
+    mock_llm_client.get_text_token_count.assert_not_called()
+    assert result.tokens_estimated
+    assert result.items[0].token_count == 100  # noqa: PLR2004
+    assert result.tree_tokens > 0
+    assert result.content_tokens > result.items[0].token_count
@@ -1,16 +1,17 @@
 """
 Unit tests for ContextService web content caching behavior.
 
-Tests cover:
-- _load_web_cache: corruption handling, missing file, valid cache
-- _save_web_cache: atomic write, directory creation
-- Cache hit/miss integration in get_context URL-fetching loop
+Tests cover the shared web content cache lifecycle in get_context's
+URL-fetching stage:
+- Fresh entries are served without a network fetch
+- Misses are fetched and stored with their validators
+- Failed fetches are not cached
+- Expired entries are revalidated with a conditional request
 """
 
-import json
-from pathlib import Path
 from unittest.mock import Mock
 
+from teddy_executor.adapters.outbound.web_content_cache import WebContentCache
 from teddy_executor.core.ports.outbound.environment_inspector import (
     IEnvironmentInspector,
 )
@@ -23,231 +24,24 @@ from teddy_executor.core.ports.outbound.web_scraper import WebScraper as IWebScr
 from teddy_executor.core.services.context_service import ContextService
 
 
-class TestLoadWebCache:
-    """Tests for ContextService._load_web_cache private method."""
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
 
-    def test_load_web_cache_returns_empty_dict_for_corrupt_file(self, tmp_path):
-        """
-        When .web_cache.json contains invalid JSON, _load_web_cache
-        should return an empty dict without raising an exception.
-        """
-        # Arrange: create a corrupt cache file
-        cache_dir = str(tmp_path / "session")
-        cache_path = Path(cache_dir) / ".web_cache.json"
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_text("this is not valid json {{{", encoding="utf-8")
-
-        # Create ContextService with dummy ports (cache methods never call them)
-        service = ContextService(
-            file_system_manager=object(),
-            repo_tree_generator=object(),
-            environment_inspector=object(),
-            llm_client=object(),
-            web_scraper=object(),
-        )
-
-        # Act
-        result = service._load_web_cache(cache_dir)
-
-        # Assert
-        assert result == {}
-
-    def test_load_web_cache_returns_empty_dict_for_missing_file(self, tmp_path):
-        """
-        When .web_cache.json does not exist, _load_web_cache
-        should return an empty dict.
-        """
-        # Arrange
-        cache_dir = str(tmp_path / "nonexistent_session")
-
-        service = ContextService(
-            file_system_manager=object(),
-            repo_tree_generator=object(),
-            environment_inspector=object(),
-            llm_client=object(),
-            web_scraper=object(),
-        )
-
-        # Act
-        result = service._load_web_cache(cache_dir)
-
-        # Assert
-        assert result == {}
-
-    def test_load_web_cache_returns_parsed_content_for_valid_file(self, tmp_path):
-        """
-        When .web_cache.json contains valid JSON with string values,
-        _load_web_cache should parse and return the content.
-        """
-        # Arrange
-        cache_dir = str(tmp_path / "session")
-        cache_path = Path(cache_dir) / ".web_cache.json"
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        expected = {"https://example.com": "cached content"}
-        cache_path.write_text(json.dumps(expected), encoding="utf-8")
-
-        service = ContextService(
-            file_system_manager=object(),
-            repo_tree_generator=object(),
-            environment_inspector=object(),
-            llm_client=object(),
-            web_scraper=object(),
-        )
-
-        # Act
-        result = service._load_web_cache(cache_dir)
-
-        # Assert
-        assert result == expected
-
-    def test_load_web_cache_returns_empty_dict_for_non_dict_structure(self, tmp_path):
-        """
-        When .web_cache.json contains valid JSON but it's not a dict
-        (e.g., a list), _load_web_cache should return an empty dict.
-        """
-        # Arrange
-        cache_dir = str(tmp_path / "session")
-        cache_path = Path(cache_dir) / ".web_cache.json"
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_text('["not", "a", "dict"]', encoding="utf-8")
-
-        service = ContextService(
-            file_system_manager=object(),
-            repo_tree_generator=object(),
-            environment_inspector=object(),
-            llm_client=object(),
-            web_scraper=object(),
-        )
-
-        # Act
-        result = service._load_web_cache(cache_dir)
-
-        # Assert
-        assert result == {}
-
-    def test_load_web_cache_returns_empty_dict_when_disabled(self, tmp_path):
-        """
-        When cache_dir is None, _load_web_cache should return an empty dict
-        without attempting to read any file.
-        """
-        service = ContextService(
-            file_system_manager=object(),
-            repo_tree_generator=object(),
-            environment_inspector=object(),
-            llm_client=object(),
-            web_scraper=object(),
-        )
-
-        # Act
-        result = service._load_web_cache(None)
-
-        # Assert
-        assert result == {}
-
-
-class TestSaveWebCache:
-    """Tests for ContextService._save_web_cache private method."""
-
-    def test_save_web_cache_creates_directory_and_writes_file(self, tmp_path):
-        """
-        When cache_dir does not exist, _save_web_cache should create it
-        and write the cache content to .web_cache.json.
-        """
-        # Arrange
-        cache_dir = str(tmp_path / "new_session")
-        cache_content = {"https://example.com": "content"}
-
-        service = ContextService(
-            file_system_manager=object(),
-            repo_tree_generator=object(),
-            environment_inspector=object(),
-            llm_client=object(),
-            web_scraper=object(),
-        )
-
-        # Act
-        service._save_web_cache(cache_dir, cache_content)
-
-        # Assert
-        cache_path = Path(cache_dir) / ".web_cache.json"
-        assert cache_path.exists(), "Cache file should be created"
-        loaded = json.loads(cache_path.read_text(encoding="utf-8"))
-        assert loaded == cache_content
-
-    def test_save_web_cache_overwrites_existing_file(self, tmp_path):
-        """
-        When .web_cache.json already exists, _save_web_cache should
-        overwrite it with new content.
-        """
-        # Arrange
-        cache_dir = str(tmp_path / "session")
-        cache_dir_path = Path(cache_dir)
-        cache_dir_path.mkdir(parents=True, exist_ok=True)
-        initial = {"url1": "old"}
-        initial_path = cache_dir_path / ".web_cache.json"
-        initial_path.write_text(json.dumps(initial), encoding="utf-8")
-
-        updated = {"url2": "new"}
-
-        service = ContextService(
-            file_system_manager=object(),
-            repo_tree_generator=object(),
-            environment_inspector=object(),
-            llm_client=object(),
-            web_scraper=object(),
-        )
-
-        # Act
-        service._save_web_cache(cache_dir, updated)
-
-        # Assert
-        loaded = json.loads(initial_path.read_text(encoding="utf-8"))
-        assert loaded == updated, "Cache file should contain new content"
-
-    def test_save_web_cache_writes_correct_json_format(self, tmp_path):
-        """
-        The written .web_cache.json should be valid JSON with correct
-        string keys and values.
-        """
-        # Arrange
-        cache_dir = str(tmp_path / "session")
-        cache_content = {
-            "https://example.com/doc1": "content 1",
-            "https://example.com/doc2": "content 2",
-        }
-
-        service = ContextService(
-            file_system_manager=object(),
-            repo_tree_generator=object(),
-            environment_inspector=object(),
-            llm_client=object(),
-            web_scraper=object(),
-        )
-
-        # Act
-        service._save_web_cache(cache_dir, cache_content)
-
-        # Assert
-        cache_path = Path(cache_dir) / ".web_cache.json"
-        raw = cache_path.read_text(encoding="utf-8")
-        parsed = json.loads(raw)
-        assert isinstance(parsed, dict)
-        assert all(isinstance(k, str) for k in parsed)
-        assert all(isinstance(v, str) for v in parsed.values())
-        assert parsed == cache_content
+    def __call__(self) -> float:
+        return self.now
 
 
 class TestGetContextCacheIntegration:
     """
-    Integration tests for the cache check in get_context()'s URL-fetching loop.
-
-    These tests verify that the cache load/check/save lifecycle works correctly
-    when get_context processes URLs from context_files.
+    Integration tests for the web content cache in get_context()'s
+    URL-fetching stage.
     """
 
-    def _make_service(self, tmp_path, web_scraper=None):
+    URL = "https://example.com/page"
+
+    def _make_service(self, web_scraper, web_cache):
         """Create a ContextService with mocked dependencies for cache tests."""
-        web_scraper = web_scraper or Mock(spec=IWebScraper)
         repo_tree = Mock(spec=IRepoTreeGenerator)
         repo_tree.generate_tree.return_value = ""
 
@@ -267,90 +61,59 @@ class TestGetContextCacheIntegration:
             env_inspector,
             llm_client,
             web_scraper,
+            web_cache=web_cache,
         )
 
-    def _setup_cache(self, tmp_path, contents: dict) -> str:
-        """Create a session cache file with given contents, return cache_dir."""
-        cache_dir = str(tmp_path / "session")
-        cache_path = Path(cache_dir) / ".web_cache.json"
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_text(
-            json.dumps(contents),
-            encoding="utf-8",
-        )
-        return cache_dir
+    def _make_scraper(self, content="fresh result", validators=None):
+        web_scraper = Mock(spec=IWebScraper)
+        web_scraper.get_content.return_value = content
+        web_scraper.get_validators.return_value = validators or {}
+        web_scraper.is_unchanged.return_value = False
+        return web_scraper
 
     def test_get_context_uses_cached_content_when_url_in_cache(self, tmp_path):
         """
-        When a URL is already in the cache file, get_context should use
+        When a URL has a fresh cache entry, get_context should use
         the cached content and NOT call IWebScraper.get_content().
         """
         # Arrange
-        url = "https://example.com/page"
         cached_content = "cached result"
-        fresh_content = "fresh result"  # Should never be fetched
-
-        cache_dir = self._setup_cache(tmp_path, {url: cached_content})
-        web_scraper = Mock(spec=IWebScraper)
-        web_scraper.get_content.return_value = fresh_content
+        web_cache = WebContentCache(cache_dir=str(tmp_path / "web_cache"))
+        web_cache.put(self.URL, cached_content)
+        web_scraper = self._make_scraper()
 
-        service = self._make_service(tmp_path, web_scraper)
-        context_files = {"Session": [url]}
+        service = self._make_service(web_scraper, web_cache)
 
         # Act
-        result = service.get_context(
-            context_files=context_files,
-            cache_dir=cache_dir,
-        )
+        result = service.get_context(context_files={"Session": [self.URL]})
 
-        # Assert: no network fetch occurred
+        # Assert
         web_scraper.get_content.assert_not_called()
-
-        # Assert: the cached content appears in the result
-        assert cached_content in result.content, (
-            f"Expected cached content '{cached_content}' in result"
-        )
-        assert fresh_content not in result.content, (
-            f"Fresh content '{fresh_content}' should NOT be in result"
-        )
+        assert cached_content in result.content
+        assert "fresh result" not in result.content
 
     def test_get_context_fetches_and_caches_when_url_not_in_cache(self, tmp_path):
         """
         When a URL is NOT in the cache, get_context should fetch via
-        IWebScraper, persist the content to the cache file, and return it.
+        IWebScraper, persist the content with its validators, and return it.
         """
         # Arrange
-        url = "https://example.com/page"
-        fetched_content = "fresh fetched content"
-
-        cache_dir = self._setup_cache(tmp_path, {})  # Empty cache
-        web_scraper = Mock(spec=IWebScraper)
-        web_scraper.get_content.return_value = fetched_content
-
-        service = self._make_service(tmp_path, web_scraper)
-        context_files = {"Session": [url]}
-
-        # Act
-        result = service.get_context(
-            context_files=context_files,
-            cache_dir=cache_dir,
+        cache_dir = str(tmp_path / "web_cache")
+        web_scraper = self._make_scraper(
+            "fresh fetched content", {"etag": '"v1"', "last_modified": None}
         )
+        service = self._make_service(web_scraper, WebContentCache(cache_dir=cache_dir))
 
-        # Assert: web scraper was called
-        web_scraper.get_content.assert_called_once_with(url)
-
-        # Assert: content is in the return value
-        assert fetched_content in result.content, (
-            f"Expected fetched content '{fetched_content}' in result"
-        )
+        # Act
+        result = service.get_context(context_files={"Session": [self.URL]})
 
-        # Assert: cache file now contains the URL
-        cache_path = Path(cache_dir) / ".web_cache.json"
-        assert cache_path.exists(), "Cache file should exist after fetch"
-        stored = json.loads(cache_path.read_text(encoding="utf-8"))
-        assert stored.get(url) == fetched_content, (
-            f"Expected {url!r} -> {fetched_content!r} in cache, got {stored}"
-        )
+        # Assert
+        web_scraper.get_content.assert_called_once_with(url=self.URL)
+        assert "fresh fetched content" in result.content
+        stored = WebContentCache(cache_dir=cache_dir).get(self.URL)
+        assert stored is not None
+        assert stored.content == "fresh fetched content"
+        assert stored.etag == '"v1"'
 
     def test_get_context_does_not_cache_failed_fetches(self, tmp_path):
         """
@@ -358,31 +121,69 @@ class TestGetContextCacheIntegration:
         should NOT be added to the cache, allowing retries on subsequent calls.
         """
         # Arrange
-        url = "https://example.com/failing-page"
-
-        cache_dir = self._setup_cache(tmp_path, {})  # Empty cache
-        web_scraper = Mock(spec=IWebScraper)
+        web_cache = WebContentCache(cache_dir=str(tmp_path / "web_cache"))
+        web_scraper = self._make_scraper()
         web_scraper.get_content.side_effect = ConnectionError("Network timeout")
-
-        service = self._make_service(tmp_path, web_scraper)
-        context_files = {"Session": [url]}
+        service = self._make_service(web_scraper, web_cache)
 
         # Act
-        result = service.get_context(
-            context_files=context_files,
-            cache_dir=cache_dir,
+        result = service.get_context(context_files={"Session": [self.URL]})
+
+        # Assert
+        web_scraper.get_content.assert_called_once_with(url=self.URL)
+        assert "--- FILE NOT FOUND ---" in result.content
+        assert web_cache.get(self.URL) is None
+
+    def test_get_context_revalidates_expired_entries(self, tmp_path):
+        """
+        When an entry has expired but the server answers 304 Not Modified,
+        the cached content is reused and its TTL renewed without a refetch.
+        """
+        # Arrange
+        clock = FakeClock()
+        web_cache = WebContentCache(
+            cache_dir=str(tmp_path / "web_cache"), ttl_seconds=60, clock=clock
         )
+        web_cache.put(self.URL, "cached result", etag='"v1"')
+        clock.now += 120
+        web_scraper = self._make_scraper()
+        web_scraper.is_unchanged.return_value = True
+        service = self._make_service(web_scraper, web_cache)
 
-        # Assert: web scraper was called
-        web_scraper.get_content.assert_called_once_with(url)
+        # Act
+        result = service.get_context(context_files={"Session": [self.URL]})
+
+        # Assert
+        web_scraper.is_unchanged.assert_called_once_with(self.URL, '"v1"', None)
+        web_scraper.get_content.assert_not_called()
+        assert "cached result" in result.content
+        assert web_cache.get(self.URL).is_fresh
 
-        # Assert: content is None (represented as "--- FILE NOT FOUND ---") in result
-        assert "--- FILE NOT FOUND ---" in result.content, (
-            "Failed URL should appear as FILE NOT FOUND in result"
+    def test_get_context_refetches_changed_entries_and_serves_stale_on_error(
+        self, tmp_path
+    ):
+        """
+        When an expired entry has changed, it is fetched again. If that
+        fetch fails, the expired copy is served instead of a placeholder.
+        """
+        # Arrange
+        clock = FakeClock()
+        web_cache = WebContentCache(
+            cache_dir=str(tmp_path / "web_cache"), ttl_seconds=60, clock=clock
         )
+        web_cache.put(self.URL, "old result", etag='"v1"')
+        clock.now += 120
+        web_scraper = self._make_scraper("new result", {"etag": '"v2"'})
+        service = self._make_service(web_scraper, web_cache)
 
-        # Assert: cache file should NOT contain the failed URL
-        cache_path = Path(cache_dir) / ".web_cache.json"
-        assert cache_path.exists(), "Cache file should exist (created empty)"
-        stored = json.loads(cache_path.read_text(encoding="utf-8"))
-        assert url not in stored, f"Failed URL {url!r} should NOT be cached: {stored}"
+        # Act
+        changed = service.get_context(context_files={"Session": [self.URL]})
+        clock.now += 120
+        web_scraper.get_content.side_effect = ConnectionError("Network timeout")
+        failed = service.get_context(context_files={"Session": [self.URL]})
+
+        # Assert
+        assert "new result" in changed.content
+        assert web_cache.get(self.URL).etag == '"v2"'
+        assert "new result" in failed.content
+        assert "--- FILE NOT FOUND ---" not in failed.content
@@ -1,4 +1,5 @@
 import os
+import threading
 import time
 import pytest
 from teddy_executor.core.ports.outbound.file_system_manager import IFileSystemManager
@@ -57,5 +58,162 @@ def test_context_gathering_is_performant_for_large_repos(container):
     assert duration < 1.0, f"Context gathering is too slow: {duration:.4f}s"
 
 
+@pytest.mark.skipif(
+    os.getenv("GITHUB_ACTIONS") == "true",
+    reason="Performance tests are flaky on CI runners due to environment variance",
+)
+def test_context_pipeline_overlaps_independent_stages(container):
+    # Arrange
+    delay = 0.2
+
+    def slow(value):
+        def call(*_args, **_kwargs):
+            time.sleep(delay)
+            return value
+
+        return call
+
+    fs = register_mock(container, IFileSystemManager)
+    fs.get_context_paths.return_value = ["a.py"]
+    fs.resolve_paths_from_files.side_effect = lambda x: x
+    fs.is_dir.return_value = False
+    fs.read_files_in_vault.side_effect = slow({"a.py": "print()"})
+    tree = register_mock(container, IRepoTreeGenerator)
+    tree.generate_tree.side_effect = slow("tree")
+    env = register_mock(container, IEnvironmentInspector)
+    env.get_environment_info.side_effect = slow({})
+    env.get_git_status.side_effect = slow("")
+    env.get_full_git_status.side_effect = slow("clean")
+    llm = register_mock(container, ILlmClient)
+    llm.get_text_token_count.return_value = 1
+    scraper = register_mock(container, IWebScraper)
+    scraper.get_content.side_effect = slow("remote")
+    service = ContextService(fs, tree, env, llm, scraper)
+
+    # Act
+    start = time.perf_counter()
+    context = service.get_context({"Turn": ["a.py", "https://example.com"]})
+    duration = time.perf_counter() - start
+
+    # Assert
+    # Six slow stages run side by side instead of back to back.
+    assert duration < delay * 3, f"Stages did not overlap: {duration:.4f}s"
+    assert "remote" in context.content
+    assert {"environment", "repo_tree", "read_files", "fetch_urls", "total"} <= set(
+        service.last_stage_timings
+    )
+
+
+@pytest.mark.skipif(
+    os.getenv("GITHUB_ACTIONS") == "true",
+    reason="Performance tests are flaky on CI runners due to environment variance",
+)
+def test_manifest_resolution_is_linear_in_resolved_paths(container):
+    # Arrange
+    file_count = 40_000
+    fs = register_mock(container, IFileSystemManager)
+    listing = [f"pkg_{i % 50}/module_{i}.py" for i in range(file_count)]
+    fs.is_dir.side_effect = lambda p: p.startswith("pkg_") and "/" not in p
+    fs.list_directory_recursive.return_value = listing
+    fs.resolve_paths_from_files.return_value = [f"pkg_{i}" for i in range(50)]
+    service = ContextService(
+        fs,
+        register_mock(container, IRepoTreeGenerator),
+        register_mock(container, IEnvironmentInspector),
+        register_mock(container, ILlmClient),
+        register_mock(container, IWebScraper),
+    )
+
+    # Act
+    start = time.perf_counter()
+    scoped, all_paths = service._resolve_scoped_paths(
+        {"Session": ["session.context"], "Turn": listing[:1000]}
+    )
+    duration = time.perf_counter() - start
+
+    # Assert
+    assert len(all_paths) == file_count
+    assert len(scoped["Session"]) == file_count
+    fs.list_directory_recursive.assert_called_once_with(".")
+    assert duration < 1.0, f"Manifest resolution is too slow: {duration:.4f}s"
+
+
+class _LaneRecordingFetcher:
+    """
+    Fake scraper fetch that records how many fetches overlap, per host and
+    in total. The first fetch of every lane waits until all lanes are
+    fetching, and the slow host only answers once released.
+    """
+
+    def __init__(self, lane_count: int, slow_host: str):
+        self.lane_count = lane_count
+        self.slow_host = slow_host
+        self.first_round = threading.Barrier(lane_count, timeout=10)
+        self.release_slow = threading.Event()
+        self.slow_finished = threading.Event()
+        self.peak: dict[str, int] = {}
+        self.peak_total = 0
+        self._active: dict[str, int] = {}
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url, **_kwargs):
+        host = url.split("/")[2]
+        with self._lock:
+            self._calls += 1
+            in_first_round = self._calls <= self.lane_count
+            self._active[host] = self._active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self._active[host])
+            self.peak_total = max(self.peak_total, sum(self._active.values()))
+        if in_first_round:
+            self.first_round.wait()
+        with self._lock:
+            self._active[host] -= 1
+        if host == self.slow_host:
+            self.release_slow.wait(timeout=10)
+            self.slow_finished.set()
+        return f"content of {url}"
+
+
+def test_url_fetches_run_concurrently_with_a_per_host_limit_and_deadline(
+    container, monkeypatch
+):
+    # Arrange
+    monkeypatch.delenv("TEDDY_TESTING", raising=False)
+    # Two lanes each for docs and api, one for the slow host.
+    fetch = _LaneRecordingFetcher(lane_count=5, slow_host="slow.example")
+    fs = register_mock(container, IFileSystemManager)
+    fs.read_files_in_vault.return_value = {}
+    scraper = register_mock(container, IWebScraper)
+    scraper.get_content.side_effect = fetch
+    service = ContextService(
+        fs,
+        register_mock(container, IRepoTreeGenerator),
+        register_mock(container, IEnvironmentInspector),
+        register_mock(container, ILlmClient),
+        scraper,
+    )
+    service.URL_FETCH_DEADLINE = 1.0
+    docs = [f"https://docs.example/page{i}" for i in range(4)]
+    other = [f"https://api.example/ref{i}" for i in range(2)]
+    urls = [*docs, "https://slow.example/spec", *other]
+
+    # Act
+    contents = service._fetch_urls(urls)
+    # The slow host only answers once the deadline has passed.
+    fetch.release_slow.set()
+    assert fetch.slow_finished.wait(timeout=10)
+
+    # Assert
+    # Every lane fetched at once, each host never ran more than two fetches
+    # at a time, and the slow host degraded to the "not found" placeholder.
+    assert fetch.peak_total == fetch.lane_count
+    assert fetch.peak["docs.example"] == service.URL_FETCH_PER_HOST
+    assert fetch.peak["api.example"] == service.URL_FETCH_PER_HOST
+    assert list(contents) == urls
+    assert contents["https://slow.example/spec"] is None
+    assert all(contents[url] == f"content of {url}" for url in docs + other)
+
+
 if __name__ == "__main__":
     test_context_gathering_is_performant_for_large_repos()
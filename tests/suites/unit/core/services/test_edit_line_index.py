@@ -0,0 +1,54 @@
+"""
+Tests for the editable line index shared by the EDIT matcher and simulator.
+"""
+
+import random
+
+from teddy_executor.core.services.edit_simulator import EditSimulator
+from teddy_executor.core.services.validation_rules.edit_line_index import LineIndex
+
+
+def _assert_matches_fresh_index(index: LineIndex) -> None:
+    fresh = LineIndex(index.content)
+    assert index.lines == fresh.lines
+    assert index.stripped == fresh.stripped
+    assert index.line_hashes == fresh.line_hashes
+
+
+def test_replace_patches_the_index_like_a_full_rebuild():
+    rng = random.Random(5)
+    pieces = ["a", "b ", "  c", "\n", "\n", "\r\n", "x\n", "\r"]
+    for _ in range(500):
+        content = "".join(rng.choice(pieces) for _ in range(rng.randrange(30)))
+        index = LineIndex(content)
+        _assert_matches_fresh_index(index)
+        for _ in range(4):
+            start = rng.randrange(len(content) + 1)
+            old = content[start : start + rng.randrange(6)]
+            new = "".join(rng.choice(pieces) for _ in range(rng.randrange(5)))
+            count = rng.choice([1, 1, -1])
+            content = content.replace(old, new, count)
+
+            assert index.replace(old, new, count) == content
+            _assert_matches_fresh_index(index)
+
+
+def test_positions_lists_every_matching_stripped_line():
+    index = LineIndex("x = 1\n  y\nx = 1  \nz\n")
+
+    assert index.positions("x = 1") == [0, 2]
+    assert index.positions("missing") == []
+
+
+def test_simulate_edits_applies_sequential_edits_on_crlf_content():
+    content = "def a():\r\n    return 1\r\n\r\ndef b():\r\n    return 2\r\n"
+    edits = [
+        {"find": "    return 1", "replace": "    return 10"},
+        {"find": "def b():\r\n    return 2", "replace": "def c():\r\n    return 3"},
+        {"find": "  return 10", "replace": "  return 11"},
+    ]
+
+    result, scores = EditSimulator().simulate_edits(content, edits)
+
+    assert result == "def a():\r\n    return 11\r\n\r\ndef c():\r\n    return 3\r\n"
+    assert scores == [1.0, 1.0, 1.0]
@@ -0,0 +1,62 @@
+"""
+Tests for the per-turn cache of EDIT match results.
+"""
+
+from teddy_executor.core.services.validation_rules import edit_matcher
+from teddy_executor.core.services.validation_rules.edit_match_cache import (
+    EditMatchCache,
+)
+
+
+def test_cache_reuses_results_until_the_content_changes():
+    cache = EditMatchCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return ("b\n", 1.0, False, 0)
+
+    cache.get_or_compute("a\nb\n", "b", 0.95, compute)
+    cache.get_or_compute("a\nb\n", "b", 0.95, compute)
+    assert len(calls) == 1
+
+    cache.get_or_compute("a\nb\nc\n", "b", 0.95, compute)
+    cache.get_or_compute("a\nb\n", "b", 0.9, compute)
+    assert len(calls) == 3  # noqa: PLR2004
+
+
+def test_cache_evicts_least_recently_used_contents_and_clears():
+    cache = EditMatchCache(max_files=2)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return ("", 0.0, False, 0)
+
+    for content in ("one", "two", "one", "three", "one", "two"):
+        cache.get_or_compute(content, "x", 0.95, compute)
+    # "two" was evicted by "three"; "one" stayed warm.
+    assert len(calls) == 4  # noqa: PLR2004
+
+    cache.clear()
+    cache.get_or_compute("one", "x", 0.95, compute)
+    assert len(calls) == 5  # noqa: PLR2004
+
+
+def test_find_best_match_is_shared_across_callers(monkeypatch):
+    calls = []
+    uncached = edit_matcher._find_best_match_uncached
+
+    def counting(*args):
+        calls.append(args)
+        return uncached(*args)
+
+    monkeypatch.setattr(edit_matcher, "_find_best_match_uncached", counting)
+    edit_matcher.clear_match_cache()
+    content = "def f():\n    return 1\n"
+
+    edit_matcher.find_best_match_and_diff(content, "def f():\n    return 2")
+    result = edit_matcher.find_best_match(content, "def f():\n    return 2")
+
+    assert len(calls) == 1
+    assert result[0] == content
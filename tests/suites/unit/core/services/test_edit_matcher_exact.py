@@ -0,0 +1,33 @@
+"""
+Tests for the exact-match fast path of the EDIT matcher.
+"""
+
+from teddy_executor.core.services.validation_rules.edit_matcher import find_best_match
+from teddy_executor.core.services.validation_rules.edit_matcher_exact import (
+    find_exact_match,
+)
+
+
+def test_find_exact_match_returns_unique_verbatim_block_with_its_line_break():
+    file_content = "def a():\n    return 1\n\ndef b():\n    return 2\n"
+
+    result = find_exact_match(file_content, "def b():\n    return 2")
+
+    assert result == ("def b():\n    return 2\n", 1.0, False, 0)
+
+
+def test_find_exact_match_resolves_unique_reindented_block():
+    file_content = "class A:\n    def run(self):\n        return 1\n"
+
+    result = find_exact_match(file_content, "def run(self):\n    return 1\n")
+
+    assert result == ("    def run(self):\n        return 1\n", 1.0, False, 4)
+
+
+def test_find_exact_match_defers_repeated_and_fuzzy_blocks_to_the_cascade():
+    repeated = "if x:\n    go()\n\nif y:\n    if x:\n        go()\n"
+
+    assert find_exact_match(repeated, "if x:\n    go()") is None
+    assert find_exact_match("value = 1\n", "value = 2") is None
+    # The cascade still reports the re-indented copy as ambiguous.
+    assert find_best_match(repeated, "if x:\n    go()")[2] is True
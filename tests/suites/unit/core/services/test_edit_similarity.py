@@ -0,0 +1,130 @@
+"""
+Tests for the bit-parallel similarity bounds and a regression corpus
+proving the EDIT matcher selects the same matches with pruning enabled.
+"""
+
+import difflib
+import random
+
+from teddy_executor.core.services.validation_rules import edit_matcher
+from teddy_executor.core.services.validation_rules.edit_similarity import (
+    lcs_length,
+    ratio_upper_bound,
+    window_line_matches,
+)
+
+
+def _reference_lcs(a: str, b: str) -> int:
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(
+                previous[j] + 1 if x == y else max(previous[j + 1], current[j])
+            )
+        previous = current
+    return previous[-1]
+
+
+def _build_source(rng: random.Random) -> str:
+    names = ["load", "save", "parse", "render", "check", "merge", "split"]
+    blocks = []
+    for index in range(60):
+        name = f"{rng.choice(names)}_{index % 9}"
+        blocks.append(
+            f"def {name}(self, value):\n"
+            f"    result = self.{rng.choice(names)}(value, {index % 4})\n"
+            f"    if result is None:\n"
+            f"        return {rng.choice(['value', 'None', 'self'])}\n"
+            f"    return result\n"
+            "\n"
+        )
+    return "".join(blocks)
+
+
+def _mutate(rng: random.Random, text: str) -> str:
+    for _ in range(rng.randrange(1, 6)):
+        i = rng.randrange(len(text))
+        text = text[:i] + rng.choice("xyz_ ()") + text[i + rng.randrange(0, 3) :]
+    return text
+
+
+def test_lcs_length_matches_dynamic_programming():
+    rng = random.Random(7)
+    for _ in range(200):
+        a = "".join(rng.choice("abcd") for _ in range(rng.randrange(0, 70)))
+        b = "".join(rng.choice("abcd") for _ in range(rng.randrange(0, 70)))
+        assert lcs_length(a, b) == _reference_lcs(a, b)
+    assert lcs_length([1, 2, 3, 4], [2, 4, 5]) == 2  # noqa: PLR2004
+
+
+def test_ratio_upper_bound_never_undercuts_difflib():
+    rng = random.Random(11)
+    source = _build_source(rng)
+    lines = source.splitlines(keepends=True)
+    for _ in range(200):
+        start = rng.randrange(len(lines) - 6)
+        window = "".join(lines[start : start + 6])
+        other = _mutate(rng, "".join(lines[rng.randrange(len(lines) - 6) :][:6]))
+        ratio = difflib.SequenceMatcher(None, window, other).ratio()
+        assert ratio_upper_bound(window, other) >= ratio
+        assert ratio_upper_bound(window, other, cutoff=1.0) >= ratio
+
+
+def test_pruned_matcher_selects_the_same_matches(monkeypatch):
+    """Regression corpus: pruning must not change any chosen match."""
+    rng = random.Random(3)
+    corpus = []
+    for _ in range(40):
+        source = _build_source(rng)
+        lines = source.splitlines(keepends=True)
+        size = rng.choice([1, 2, 3, 5, 8, 12])
+        start = rng.randrange(len(lines) - size)
+        find_block = _mutate(rng, "".join(lines[start : start + size]))
+        corpus.append((source, find_block))
+
+    pruned = [
+        edit_matcher._find_best_match_uncached(source, find_block, 0.95)
+        for source, find_block in corpus
+    ]
+    monkeypatch.setattr(edit_matcher, "ratio_upper_bound", lambda *_args: 1.0)
+    exhaustive = [
+        edit_matcher._find_best_match_uncached(source, find_block, 0.95)
+        for source, find_block in corpus
+    ]
+
+    assert pruned == exhaustive
+
+
+def test_window_line_matches_counts_aligned_lines_for_every_window():
+    file_lines = ["a\n", "b\n", "  c\n", "a\n", "x\n", "c\n"]
+    find_lines = ["a\n", "b\n", "c\n"]
+
+    counts = window_line_matches(file_lines, find_lines)
+
+    expected = [
+        sum(
+            f.strip() == g.strip()
+            for f, g in zip(file_lines[start : start + 3], find_lines)
+        )
+        for start in range(4)
+    ]
+    assert counts == expected == [3, 0, 0, 2]
+    assert window_line_matches(["a\n"], find_lines) == []
+
+
+def test_large_block_is_found_when_only_sampled_lines_differ():
+    """Every line counts, not a sample of ten, when filtering large blocks."""
+    find_lines = [f"value_{i} = compute({i})\n" for i in range(30)]
+    window = list(find_lines)
+    for index in (0, 3, 6, 9):
+        window[index] = f"changed_{index} = other()\n"
+    file_content = "header = 1\n" + "".join(window) + "footer = 2\n"
+
+    match, score, is_ambiguous, _ = edit_matcher.find_best_match(
+        file_content, "".join(find_lines)
+    )
+
+    assert match == "".join(window)
+    assert score == 0.87  # noqa: PLR2004
+    assert not is_ambiguous
@@ -0,0 +1,82 @@
+import ast
+
+from teddy_executor.core.services import file_outliner
+from teddy_executor.core.services.file_outliner import build_outline
+
+PYTHON_SOURCE = '''import os
+
+
+class Store(Base):
+    """Docs."""
+
+    def get(self, key: str, default=None) -> Optional[str]:
+        return None
+
+    async def refresh(self) -> None:
+        pass
+
+
+def helper(*args, **kwargs):
+    return 1
+'''
+
+
+def test_python_outline_lists_signatures_with_line_numbers():
+    outline = build_outline("src/store.py", PYTHON_SOURCE)
+
+    assert outline is not None
+    lines = outline.splitlines()
+    assert lines[0].startswith("Outline of src/store.py (15 lines).")
+    assert lines[1:] == [
+        "L4: class Store(Base):",
+        "L7:     def get(self, key: str, default=None) -> Optional[str]:",
+        "L10:     async def refresh(self) -> None:",
+        "L14: def helper(*args, **kwargs):",
+    ]
+
+
+def test_other_languages_fall_back_to_declaration_heuristics():
+    source = "\n".join(
+        [
+            "import { x } from 'y';",
+            "export class Widget extends Base {",
+            "  render() {}",
+            "}",
+            "export async function load(url: string) {",
+            "}",
+        ]
+    )
+
+    outline = build_outline("web/widget.ts", source)
+
+    assert outline is not None
+    assert outline.splitlines()[1:] == [
+        "L2: export class Widget extends Base",
+        "L5: export async function load(url: string)",
+    ]
+
+
+def test_unparsable_python_uses_heuristics_and_plain_text_has_no_outline():
+    broken = "def ok(a):\n    pass\n\ndef broken(:\n"
+
+    assert build_outline("broken.py", broken).splitlines()[1:] == [
+        "L1: def ok(a):",
+        "L4: def broken(:",
+    ]
+    assert build_outline("notes.txt", "just some words\n" * 10) is None
+
+
+def test_outline_structure_is_cached_by_content_hash(monkeypatch):
+    calls = []
+    real_parse = ast.parse
+    monkeypatch.setattr(
+        file_outliner.ast, "parse", lambda src: calls.append(1) or real_parse(src)
+    )
+    source = PYTHON_SOURCE + "\n# unique: cache test\n"
+
+    first = build_outline("a/store.py", source)
+    second = build_outline("b/store.py", source)
+
+    assert len(calls) == 1
+    assert first.splitlines()[1:] == second.splitlines()[1:]
+    assert second.startswith("Outline of b/store.py")
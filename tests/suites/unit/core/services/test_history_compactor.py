@@ -0,0 +1,65 @@
+from teddy_executor.core.services.history_compactor import compact_history
+
+FIND_BLOCK = "\n".join(f"    line_{i} = compute({i})" for i in range(12))
+
+
+def _plan(title: str, replace: str) -> str:
+    return "\n".join(
+        [
+            f"# {title}",
+            "## Action Plan",
+            "### `EDIT`",
+            "#### `FIND:`",
+            "````python",
+            FIND_BLOCK,
+            "````",
+            "#### `REPLACE:`",
+            "````python",
+            replace,
+            "````",
+        ]
+    )
+
+
+def test_repeated_blocks_are_replaced_by_references_to_the_first_occurrence():
+    first = _plan("Fix the loop", "pass")
+    replan = _plan("Fix the loop again", "return None")
+
+    compacted = compact_history([("Turn 1: Plan", first), ("Turn 2: Plan", replan)])
+
+    assert compacted[0] == first
+    assert FIND_BLOCK not in compacted[1]
+    assert (
+        '[Identical to block 1 under "#### `FIND:`" in Turn 1: Plan; omitted.]'
+        in compacted[1]
+    )
+    # Short and changed blocks are kept, and the fences stay balanced.
+    assert "return None" in compacted[1]
+    assert compacted[1].count("````") == 4  # noqa: PLR2004
+
+
+def test_whole_duplicate_files_are_replaced_and_empty_files_kept():
+    report = "# Report\n```text\nok\n```"
+
+    compacted = compact_history(
+        [
+            ("Turn 1: Report", report),
+            ("Turn 2: Plan", ""),
+            ("Turn 2: Report", report + "\n"),
+        ]
+    )
+
+    assert compacted == [report, "", "[Identical to Turn 1: Report; omitted.]"]
+
+
+def test_compaction_is_deterministic_and_prefix_stable():
+    entries = [
+        ("Turn 1: Plan", _plan("A", "x = 1")),
+        ("Turn 2: Plan", _plan("B", "x = 2")),
+    ]
+
+    shorter = compact_history(entries)
+    longer = compact_history([*entries, ("Turn 3: Plan", _plan("C", "x = 3"))])
+
+    assert compact_history(entries) == shorter
+    assert longer[:2] == shorter
@@ -102,9 +102,9 @@ def test_generate_plan_writes_standardized_input_md(env):
     # Assert
     # Verify input.md contains the simplified context
     input_call = [
-        c for c in mock_fs.write_file.call_args_list if "input.md" in c[0][0]
+        c for c in mock_fs.write_file_parts.call_args_list if "input.md" in c[0][0]
     ][0]
-    input_content = input_call[0][1]
+    input_content = "".join(input_call[0][1])
     assert "Expected Header" in input_content
     assert "Expected Content" in input_content
 
@@ -445,3 +445,137 @@ def test_generate_plan_displays_no_actual_model_line_after_fix(env):
     # args[0] is the meta dict; the real update_meta will overwrite meta["model"],
     # but the mock doesn't execute real logic, so we just verify the call happened.
     # (The actual persistence is tested by prompt_manager unit tests.)
+
+
+def test_generate_plan_sends_cache_friendly_segments_and_records_cache_usage(env):
+    # Arrange
+    mock_prompt_manager = env.mock_port(IPromptManager)
+    mock_llm_client = env.mock_port(ILlmClient)
+    mock_fs = env.mock_port(IFileSystemManager)
+    env.mock_port(IGetContextUseCase).get_context.return_value = ProjectContext(
+        header="H",
+        content="pinned\ntree\nvolatile",
+        content_segments=["pinned", "tree", "volatile"],
+    )
+    meta: dict = {}
+    mock_prompt_manager.resolve_message.return_value = "test"
+    mock_prompt_manager.resolve_agent_metadata.return_value = (
+        "pathfinder",
+        meta,
+        "meta.yaml",
+    )
+    mock_prompt_manager.fetch_system_prompt.return_value = "prompt"
+    mock_llm_client.get_cache_usage.return_value = {
+        "cache_hit_tokens": 900,
+        "cache_miss_tokens": 100,
+        "cache_write_tokens": 0,
+    }
+
+    service = env.get_service(PlanningService)
+
+    # Act
+    service.generate_plan(user_message="test", turn_dir="turns/01")
+
+    # Assert
+    messages = mock_llm_client.get_completion.call_args.kwargs["messages"]
+    parts = messages[1]["content"]
+    assert [part["text"] for part in parts] == ["H\npinned", "\ntree", "\nvolatile"]
+    input_call = [
+        c for c in mock_fs.write_file_parts.call_args_list if "input.md" in c[0][0]
+    ][0]
+    assert "".join(input_call[0][1]) == "".join(part["text"] for part in parts)
+    saved_meta = mock_prompt_manager.update_meta.call_args[0][0]
+    assert saved_meta["cache_hit_tokens"] == 900  # noqa: PLR2004
+    assert saved_meta["cache_miss_tokens"] == 100  # noqa: PLR2004
+
+
+def test_generate_plan_streams_content_sections(env):
+    # Arrange
+    mock_prompt_manager = env.mock_port(IPromptManager)
+    mock_llm_client = env.mock_port(ILlmClient)
+    mock_fs = env.mock_port(IFileSystemManager)
+    env.mock_port(IGetContextUseCase).get_context.return_value = ProjectContext(
+        header="H", content_sections=["git", "tree", "files"]
+    )
+    mock_prompt_manager.resolve_message.return_value = "test"
+    mock_prompt_manager.resolve_agent_metadata.return_value = (
+        "pathfinder",
+        {},
+        "meta.yaml",
+    )
+    mock_prompt_manager.fetch_system_prompt.return_value = "prompt"
+
+    service = env.get_service(PlanningService)
+
+    # Act
+    service.generate_plan(user_message="test", turn_dir="turns/01")
+
+    # Assert
+    messages = mock_llm_client.get_completion.call_args.kwargs["messages"]
+    assert messages[1]["content"] == "H\ngit\ntree\nfiles"
+    input_call = [
+        c for c in mock_fs.write_file_parts.call_args_list if "input.md" in c[0][0]
+    ][0]
+    assert list(input_call[0][1]) == ["H", "\n", "git", "\n", "tree", "\n", "files"]
+
+
+def test_generate_plan_sums_precounted_tokens_instead_of_recounting(env):
+    # Arrange
+    mock_prompt_manager = env.mock_port(IPromptManager)
+    mock_llm_client = env.mock_port(ILlmClient)
+    env.mock_port(IFileSystemManager)
+    env.mock_port(IGetContextUseCase).get_context.return_value = ProjectContext(
+        header="H", content="C", content_tokens=1000
+    )
+    mock_prompt_manager.resolve_message.return_value = "test"
+    mock_prompt_manager.resolve_agent_metadata.return_value = (
+        "pathfinder",
+        {},
+        "meta.yaml",
+    )
+    mock_prompt_manager.fetch_system_prompt.return_value = "prompt"
+    mock_llm_client.get_text_token_count.side_effect = lambda text, model=None: (
+        200 if text == "prompt" else 5
+    )
+
+    service = env.get_service(PlanningService)
+
+    # Act
+    service.generate_plan(user_message="test", turn_dir="turns/01")
+
+    # Assert
+    mock_llm_client.get_token_count.assert_not_called()
+    token_count = mock_prompt_manager.update_meta.call_args[0][2]
+    overhead = (
+        PlanningService.MESSAGE_OVERHEAD_TOKENS * 2
+        + PlanningService.REPLY_PRIMING_TOKENS
+    )
+    assert token_count == 200 + 5 + 1000 + overhead  # noqa: PLR2004
+
+
+def test_generate_plan_counts_exactly_when_context_tokens_are_estimated(env):
+    # Arrange
+    mock_prompt_manager = env.mock_port(IPromptManager)
+    mock_llm_client = env.mock_port(ILlmClient)
+    env.mock_port(IFileSystemManager)
+    env.mock_port(IGetContextUseCase).get_context.return_value = ProjectContext(
+        header="H", content="C", content_tokens=1000, tokens_estimated=True
+    )
+    mock_prompt_manager.resolve_message.return_value = "test"
+    mock_prompt_manager.resolve_agent_metadata.return_value = (
+        "pathfinder",
+        {},
+        "meta.yaml",
+    )
+    mock_prompt_manager.fetch_system_prompt.return_value = "prompt"
+    mock_llm_client.get_text_token_count.return_value = 200
+    mock_llm_client.get_token_count.return_value = 1234
+
+    service = env.get_service(PlanningService)
+
+    # Act
+    service.generate_plan(user_message="test", turn_dir="turns/01")
+
+    # Assert
+    token_count = mock_prompt_manager.update_meta.call_args[0][2]
+    assert token_count == 1234  # noqa: PLR2004
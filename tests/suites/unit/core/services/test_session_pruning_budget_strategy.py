@@ -0,0 +1,141 @@
+import os
+import time
+
+import pytest
+from unittest.mock import create_autospec
+
+from teddy_executor.core.domain.models import ProjectContext
+from teddy_executor.core.domain.models.project_context import ContextItem
+from teddy_executor.core.ports.outbound.config_service import IConfigService
+from teddy_executor.core.ports.outbound.file_system_manager import IFileSystemManager
+from teddy_executor.core.services.budget_solver import BudgetItem, solve_knapsack
+from teddy_executor.core.services.session_pruning_service import SessionPruningService
+
+
+def _make_service(settings: dict) -> SessionPruningService:
+    config = create_autospec(IConfigService, instance=True)
+    config.get_setting.side_effect = lambda key, default=None: {
+        "auto_pruning.enabled": True,
+        "auto_pruning.prune_failure_history": False,
+        "auto_pruning.prune_validation_failures": False,
+        **settings,
+    }.get(key, default)
+    fs = create_autospec(IFileSystemManager, instance=True)
+    fs.path_exists.return_value = False
+    fs.match_paths.side_effect = lambda paths, patterns: [
+        p for p in paths if any(p.startswith(pat.rstrip("*")) for pat in patterns)
+    ]
+    return SessionPruningService(config_service=config, file_system_manager=fs)
+
+
+def _items() -> list[ContextItem]:
+    # One large file that is being edited, and several small stale turn files.
+    return [
+        ContextItem(path="src/core.py", token_count=6000, git_status="M", scope="Turn"),
+        ContextItem(path="s/01/plan.md", token_count=1500, git_status="", scope="Turn"),
+        ContextItem(
+            path="s/01/report.md", token_count=1500, git_status="", scope="Turn"
+        ),
+        ContextItem(path="s/02/plan.md", token_count=1000, git_status="", scope="Turn"),
+        ContextItem(path="s/05/plan.md", token_count=500, git_status="", scope="Turn"),
+        ContextItem(path="README.md", token_count=9000, git_status="", scope="Session"),
+    ]
+
+
+def _prune(settings: dict) -> dict[str, ContextItem]:
+    service = _make_service({"auto_pruning.turn_context_threshold": 8000, **settings})
+    context = ProjectContext(header="", content="", items=_items())
+    return {item.path: item for item in service.prune(context).items}
+
+
+def test_largest_first_remains_the_default_strategy():
+    # Act
+    items = _prune({})
+
+    # Assert
+    assert not items["src/core.py"].selected
+    assert items["src/core.py"].auto_prune_reason == "Pruned to fit context budget"
+    assert all(items[p].selected for p in ["s/01/plan.md", "s/05/plan.md"])
+
+
+def test_knapsack_strategy_drops_small_stale_files_instead_of_a_valuable_one():
+    # Act
+    items = _prune({"auto_pruning.strategy": "knapsack"})
+
+    # Assert
+    assert items["src/core.py"].selected
+    assert items["s/05/plan.md"].selected
+    assert items["README.md"].selected  # Session scope is never pruned
+    # Dropping the two oldest files is enough; turn 02 still fits.
+    pruned = [p for p, item in items.items() if not item.selected]
+    assert pruned == ["s/01/plan.md", "s/01/report.md"]
+    assert items["s/01/plan.md"].auto_prune_reason == (
+        "Pruned to fit context budget (priority 0.41: 4 turns old, unmodified)"
+    )
+    kept_tokens = sum(
+        item.token_count
+        for item in items.values()
+        if item.selected and item.scope == "Turn"
+    )
+    assert kept_tokens <= 8000
+
+
+def test_knapsack_strategy_never_prunes_pinned_paths():
+    # Act
+    items = _prune(
+        {"auto_pruning.strategy": "knapsack", "auto_pruning.pinned": ["s/01/*"]}
+    )
+
+    # Assert
+    assert items["s/01/plan.md"].selected
+    assert items["s/01/report.md"].selected
+    assert items["s/05/plan.md"].selected
+    assert not items["src/core.py"].selected
+
+
+def test_solve_knapsack_finds_the_optimal_subset():
+    # Arrange: greedy by value density would take key 0 and miss the optimum
+    items = [
+        BudgetItem(key=0, tokens=6, value=30.0),
+        BudgetItem(key=1, tokens=5, value=20.0),
+        BudgetItem(key=2, tokens=5, value=20.0),
+        BudgetItem(key=3, tokens=0, value=0.0),
+    ]
+
+    # Act & Assert
+    assert solve_knapsack(items, capacity=10) == {1, 2, 3}
+    assert solve_knapsack(items, capacity=0) == {3}
+
+
+@pytest.mark.skipif(
+    os.getenv("GITHUB_ACTIONS") == "true",
+    reason="Performance tests are flaky on CI runners due to environment variance",
+)
+def test_knapsack_strategy_is_fast_for_thousands_of_items():
+    # Arrange
+    service = _make_service(
+        {
+            "auto_pruning.strategy": "knapsack",
+            "auto_pruning.turn_context_threshold": 50000,
+        }
+    )
+    items = [
+        ContextItem(
+            path=f"s/{i % 99:02d}/file_{i}.md",
+            token_count=50 + (i * 37) % 900,
+            git_status="M" if i % 7 == 0 else "",
+            scope="Turn",
+        )
+        for i in range(3000)
+    ]
+    context = ProjectContext(header="", content="", items=items)
+
+    # Act
+    start = time.perf_counter()
+    result = service.prune(context)
+    duration = time.perf_counter() - start
+
+    # Assert
+    kept = sum(item.token_count for item in result.items if item.selected)
+    assert 49000 <= kept <= 50000
+    assert duration < 2.0, f"Budget solver is too slow: {duration:.4f}s"
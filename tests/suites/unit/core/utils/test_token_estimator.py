@@ -0,0 +1,27 @@
+import math
+
+from teddy_executor.core.utils.token_estimator import (
+    BYTES_PER_TOKEN,
+    DEFAULT_BYTES_PER_TOKEN,
+    estimate_token_count,
+)
+
+
+def test_estimate_uses_the_ratio_of_the_path_language():
+    text = "x" * 900
+
+    assert estimate_token_count(text, "src/app.py") == math.ceil(
+        900 / BYTES_PER_TOKEN["python"]
+    )
+    assert estimate_token_count(text, "data.json") == math.ceil(
+        900 / BYTES_PER_TOKEN["json"]
+    )
+    assert estimate_token_count(text) == math.ceil(900 / DEFAULT_BYTES_PER_TOKEN)
+
+
+def test_estimate_counts_utf8_bytes_and_empty_text():
+    assert estimate_token_count("") == 0
+    # Each "é" is two bytes in UTF-8.
+    assert estimate_token_count("é" * 450, "notes.md") == estimate_token_count(
+        "x" * 900, "notes.md"
+    )